@@ -0,0 +1,218 @@
+import json
+import random
+import resource
+import sys
+
+from django.test import Client, override_settings
+from django.urls import reverse
+
+from core.constants import AMOUNT_OF_QUESTIONS_PER_LIST
+from lists.models import QuestionList
+from questions.models import Alternative
+from users.factories import UserFactory
+
+from .metrics import request_metrics
+from .seeding import SEED_WORDS
+
+# The memory of the process may grow this much (MB) over the baseline, on top
+# of the tolerance, since small growths are mostly noise
+RSS_GROWTH_SLACK_MB = 10
+# Pages of every list followed after the first one
+BROWSED_PAGES = 3
+
+
+class BenchmarkError(Exception):
+    pass
+
+
+def read_memory_status_kb(field):
+    """``field`` of /proc/self/status, in kB. None without /proc (macOS)"""
+    try:
+        with open('/proc/self/status') as status:
+            for line in status:
+                if line.startswith(f'{field}:'):
+                    return int(line.split()[1])
+    except FileNotFoundError:
+        return None
+
+
+def get_max_rss_kb():
+    """Peak RSS of the process, in kB"""
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Bytes on macOS, kB everywhere else
+    if sys.platform == 'darwin':
+        return max_rss // 1024
+    return max_rss
+
+
+def get_rss_mb():
+    rss_kb = read_memory_status_kb('VmRSS')
+    if rss_kb is None:
+        # Only the peak is known, which is close after the journeys anyway
+        rss_kb = get_max_rss_kb()
+    return rss_kb / 1024
+
+
+class JourneyClient(Client):
+    """A test client failing on every error response"""
+
+    def request(self, **request):
+        response = super().request(**request)
+        if response.status_code >= 400:
+            raise BenchmarkError(
+                f'{request["REQUEST_METHOD"]} {request["PATH_INFO"]}: '
+                f'{response.status_code}'
+            )
+        return response
+
+
+def browse(client):
+    """The popular lists, then some pages of every list"""
+    client.get(reverse('questions_list'))
+    response = client.get(reverse('questions_list'), {'filter': 'all'})
+    for _ in range(BROWSED_PAGES):
+        cursor = response.context['page_obj'].next_cursor
+        if cursor is None:
+            break
+        response = client.get(
+            reverse('questions_list'), {'filter': 'all', 'cursor': cursor}
+        )
+
+
+def search(client, rng):
+    word = rng.choice(SEED_WORDS)
+    client.get(reverse('search_lists'), {'q': word})
+    client.get(reverse('autocomplete_lists'), {'q': word[:3]})
+
+
+def answer_all(client, slug, alternatives_ids):
+    """Answer the questions one by one, as the site does"""
+    for alternative_id in alternatives_ids:
+        client.get(reverse('answer_list', args=[slug]))
+        client.post(
+            reverse('answer_list', args=[slug]),
+            {'alternatives': alternative_id},
+        )
+    client.get(reverse('list_results', args=[slug]))
+
+
+def answer_all_at_once(client, slug, alternatives_ids):
+    client.post(
+        reverse('answer_list_at_once', args=[slug]),
+        json.dumps({'alternatives': alternatives_ids}),
+        content_type='application/json',
+    )
+    client.get(reverse('list_results', args=[slug]))
+
+
+def get_first_alternatives_ids(slug):
+    """Id of the first alternative of every question of the list"""
+    alternatives = (
+        Alternative.objects.filter(question__child_of__slug=slug)
+        .order_by('question_id', 'id')
+        .values_list('question_id', 'id')
+    )
+    first_alternatives = {}
+    for question_id, alternative_id in alternatives:
+        first_alternatives.setdefault(question_id, alternative_id)
+    return list(first_alternatives.values())
+
+
+def run_journeys(iterations, seed=0):
+    """
+    Browse, search, answer two lists (one question at a time and all at
+    once) and see their results, ``iterations`` times, every time as a new
+    user. Return the summary of the requests of every view, and the RSS of
+    the process and how much it grew meanwhile (the dataset, when in
+    memory, is part of the former only).
+    """
+    rng = random.Random(seed)
+    slugs = list(
+        QuestionList.activated_lists.filter(private=False)
+        .order_by('id')
+        .values_list('slug', flat=True)
+    )
+    if len(slugs) < 2:
+        raise BenchmarkError('At least two public lists are needed')
+
+    request_metrics.reset()
+    rss_before = get_rss_mb()
+    with override_settings(
+        # Neither the debug toolbar nor the queries log of DEBUG
+        DEBUG=False,
+        ALLOWED_HOSTS=['testserver'],
+        # The queries are reported at the end, not logged
+        QUERY_BUDGETS={},
+        REQUEST_METRICS_WINDOW=iterations * 2 * AMOUNT_OF_QUESTIONS_PER_LIST,
+    ):
+        for i in range(iterations):
+            client = JourneyClient()
+            client.force_login(
+                UserFactory(
+                    username=f'benchmark-runner-{seed}-{i}',
+                    email=f'benchmark-runner-{seed}-{i}@email.com',
+                )
+            )
+            one_by_one, at_once = rng.sample(slugs, 2)
+
+            browse(client)
+            search(client, rng)
+            answer_all(
+                client, one_by_one, get_first_alternatives_ids(one_by_one)
+            )
+            answer_all_at_once(
+                client, at_once, get_first_alternatives_ids(at_once)
+            )
+
+    rss = get_rss_mb()
+    return {
+        'views': {
+            view_name: {
+                'requests': summary['requests'],
+                'latency_ms': {
+                    percentile: summary['latency_ms'][percentile]
+                    for percentile in ('p50', 'p95', 'p99')
+                },
+                'queries_avg': summary['queries']['avg'],
+                'queries_max': summary['queries']['max'],
+            }
+            for view_name, summary in request_metrics.get_summary().items()
+        },
+        'rss_mb': round(rss, 1),
+        'rss_growth_mb': round(rss - rss_before, 1),
+    }
+
+
+def compare_with_baseline(results, baseline, tolerance):
+    """
+    Regressions of ``results``: a p95 latency or the RSS growth going over
+    the baseline more than ``tolerance`` (a ratio), or a view running more
+    queries.
+    """
+    regressions = []
+    for view_name, expected in baseline['views'].items():
+        current = results['views'].get(view_name)
+        if current is None:
+            regressions.append(f'{view_name}: not requested')
+            continue
+
+        p95 = current['latency_ms']['p95']
+        expected_p95 = expected['latency_ms']['p95']
+        if p95 > expected_p95 * (1 + tolerance):
+            regressions.append(
+                f'{view_name}: p95 of {p95} ms, it was {expected_p95} ms'
+            )
+        if current['queries_max'] > expected['queries_max']:
+            regressions.append(
+                f'{view_name}: {current["queries_max"]} queries, '
+                f'it was {expected["queries_max"]}'
+            )
+
+    growth = results['rss_growth_mb']
+    # The memory may also go down, after a garbage collection
+    expected_growth = max(baseline['rss_growth_mb'], 0)
+    if growth > expected_growth * (1 + tolerance) + RSS_GROWTH_SLACK_MB:
+        regressions.append(
+            f'RSS grew {growth} MB, it grew {expected_growth} MB'
+        )
+    return regressions
@@ -5,11 +5,23 @@ from django.utils.translation import gettext_lazy as _
 
 # === Global variables ===
 AMOUNT_OF_LISTS_PER_PAGE = 6
+MAX_SEARCH_RESULTS = 300
+AUTOCOMPLETE_MAX_SUGGESTIONS = 8
+AUTOCOMPLETE_MAX_PREFIX_LENGTH = 10
+AUTOCOMPLETE_MAX_LISTS = 2000
+AUTOCOMPLETE_MAX_TAGS = 500
+AUTOCOMPLETE_INDEX_MAX_AGE = 15 * 60  # seconds
 AMOUNT_OF_QUESTIONS_PER_LIST = 10
 AMOUNT_OF_DAYS_FOR_POPULARITY = 10
+VOTES_SPOOL_BATCH_SIZE = 500
 MAX_IMAGE_SIZE = 2 * 1000 * 1000
 IMAGE_VALID_EXTENSIONS = ['.jpg', '.jpeg', '.png']
 DEFAULT_IMAGE_NAME = 'default_alternative.png'
+IMAGE_DERIVATIVE_SIZES = [96, 200, 400]
+IMAGE_DERIVATIVE_QUALITY = 80
+# Decompression budget: a 2 MB JPEG may still hold a huge bitmap
+MAX_IMAGE_PIXELS = 24 * 1000 * 1000
+IMAGE_REDUCING_GAP = 3.0
 
 # === Flash Messages ===
 LIST_COMPLETION_ERROR_MESSAGE = _(
@@ -38,12 +50,24 @@ USER_THAT_SHARED_LIST_HAVENT_COMPLETED_IT = _(
     "user to answer all the questions"
 )
 DONT_TRY_WEIRD_STUFF = _('Please do not try to do weird stuff with the site')
+ANSWERS_MUST_BELONG_TO_THE_LIST = _(
+    'Every answer must be an alternative of the list'
+)
+ONE_ANSWER_PER_QUESTION = _('Only one answer per question is allowed')
+LOGIN_REQUIRED_TO_ANSWER = _('You must log in to answer the list')
+INVALID_ANSWERS_PAYLOAD = _(
+    'Send the answers as JSON: {"alternatives": [<alternative id>, ...]}'
+)
 
 # === Related to forms ===
 # Errors
 SPECIAL_CHARS_ERROR = _('Do not use special chars.')
 # Note: related to MAX_IMAGE_SIZE
 FILE_TOO_LARGE_ERROR = _('File too large. Size should not exceed 2 MB.')
+# Note: related to MAX_IMAGE_PIXELS
+FILE_TOO_MANY_PIXELS_ERROR = _(
+    'Image resolution too large. It should not exceed 24 megapixels.'
+)
 # Note: related to IMAGE_VALID_EXTENSIONS
 FILE_EXTENSION_ERROR = _(
     'File extension not valid. Allowed extensions: .jpg, .jpeg, .png.'
@@ -94,6 +118,90 @@ IMAGE_3_NAME = DEFAULT_IMAGE_NAME
 IMAGE_4_NAME = DEFAULT_IMAGE_NAME
 IMAGE_5_NAME = DEFAULT_IMAGE_NAME
 IMAGE_6_NAME = DEFAULT_IMAGE_NAME
+# rebuild_vote_counters
+COMMAND_REBUILD_VOTE_COUNTERS_HELP_TEXT = (
+    'Recompute the votes counters of every alternative and question, to repair'
+    ' them: the migrations already fill them'
+)
+COMMAND_REBUILD_VOTE_COUNTERS_SUCCESS_MESSAGE = 'Vote counters rebuilt'
+# process_image_jobs
+COMMAND_PROCESS_IMAGE_JOBS_HELP_TEXT = (
+    'Process the pending images stored in the database queue'
+)
+COMMAND_PROCESS_IMAGE_JOBS_SUCCESS_MESSAGE = '%s image jobs processed'
+# rebuild_search_index
+COMMAND_REBUILD_SEARCH_INDEX_HELP_TEXT = (
+    'Index again every active and public list for the search'
+)
+COMMAND_REBUILD_SEARCH_INDEX_SUCCESS_MESSAGE = '%s lists indexed'
+# refresh_popularity
+COMMAND_REFRESH_POPULARITY_HELP_TEXT = (
+    'Count again the recent votes of every list, for the popularity ranking'
+)
+COMMAND_REFRESH_POPULARITY_SUCCESS_MESSAGE = (
+    'Popularity refreshed, %s lists with recent votes'
+)
+# check_query_plans
+COMMAND_CHECK_QUERY_PLANS_HELP_TEXT = (
+    'Fail if the main queries of the site fully scan a big table'
+)
+COMMAND_CHECK_QUERY_PLANS_SUCCESS_MESSAGE = 'No big table is fully scanned'
+COMMAND_CHECK_QUERY_PLANS_ERROR_MESSAGE = 'Full scans of big tables in: %s'
+QUERY_PLANS_MAX_SEQ_SCAN_ROWS = 1000
+# benchmark_image_decode
+COMMAND_BENCHMARK_IMAGE_DECODE_HELP_TEXT = (
+    'Measure the peak memory needed to reshape a large uploaded JPEG'
+)
+COMMAND_BENCHMARK_IMAGE_DECODE_SUCCESS_MESSAGE = (
+    'Bounded decode uses %.1fx less memory'
+)
+# flush_vote_spool
+COMMAND_FLUSH_VOTE_SPOOL_HELP_TEXT = (
+    'Move the votes spooled in write-behind mode to the database'
+)
+COMMAND_FLUSH_VOTE_SPOOL_SUCCESS_MESSAGE = '%s spooled votes saved'
+# profile_report
+COMMAND_PROFILE_REPORT_HELP_TEXT = (
+    'Top hot functions of every view, from the stored request profiles'
+)
+COMMAND_PROFILE_REPORT_SUCCESS_MESSAGE = '%s profiles reported'
+PROFILE_REPORT_TOP_FUNCTIONS = 15
+# run_benchmarks
+COMMAND_RUN_BENCHMARKS_HELP_TEXT = (
+    'Time the main user journeys on a large dataset, in a throwaway database'
+)
+COMMAND_RUN_BENCHMARKS_SUCCESS_MESSAGE = 'No regression against the baseline'
+COMMAND_RUN_BENCHMARKS_ERROR_MESSAGE = 'Regressions against the baseline: %s'
+COMMAND_RUN_BENCHMARKS_BASELINE_SAVED_MESSAGE = 'Baseline saved in %s'
+COMMAND_RUN_BENCHMARKS_OTHER_DATASET_MESSAGE = (
+    'The baseline was measured on another dataset, run it again with '
+    '--save-baseline'
+)
+BENCHMARK_LISTS = 10000
+BENCHMARK_VOTES = 1000000
+BENCHMARK_USERS = 2000
+BENCHMARK_ITERATIONS = 30
+# Latencies and RSS may grow this much (a ratio) over the baseline
+BENCHMARK_TOLERANCE = 0.5
+BENCHMARK_BASELINE_PATH = settings.BASE_DIR / 'core/benchmark_baseline.json'
+# seed_bulk
+COMMAND_SEED_BULK_HELP_TEXT = (
+    'Add a large, reproducible dataset of users, lists and votes, quickly'
+)
+COMMAND_SEED_BULK_SUCCESS_MESSAGE = (
+    '%s users, %s lists and %s votes seeded in %.0f s'
+)
+SEED_BULK_USERS = 10000
+SEED_BULK_LISTS = 10000
+SEED_BULK_VOTES = 1000000
+SEED_BULK_BATCH_SIZE = 5000
+# rebuild_user_stats
+COMMAND_REBUILD_USER_STATS_HELP_TEXT = (
+    'Count again the stats of every user, for the stats page'
+)
+COMMAND_REBUILD_USER_STATS_SUCCESS_MESSAGE = 'Stats of %s users rebuilt'
+
+IMAGE_JOB_MAX_ATTEMPTS = 3
 
 # === Images - Demo List ===
 DEMO_IMAGES_PATH = settings.BASE_DIR / 'static/images/demo'
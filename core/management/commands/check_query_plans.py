@@ -0,0 +1,59 @@
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+
+from core.constants import (
+    COMMAND_CHECK_QUERY_PLANS_ERROR_MESSAGE,
+    COMMAND_CHECK_QUERY_PLANS_HELP_TEXT,
+    COMMAND_CHECK_QUERY_PLANS_SUCCESS_MESSAGE,
+    QUERY_PLANS_MAX_SEQ_SCAN_ROWS,
+)
+from core.query_plans import (
+    count_rows,
+    get_main_querysets,
+    get_seq_scanned_tables,
+)
+
+
+class Command(BaseCommand):
+    help = COMMAND_CHECK_QUERY_PLANS_HELP_TEXT
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--max-rows',
+            type=int,
+            default=QUERY_PLANS_MAX_SEQ_SCAN_ROWS,
+            help='Tables up to this amount of rows may be fully scanned',
+        )
+
+    def handle(self, *args, **options):
+        failing = []
+
+        for name, queryset in get_main_querysets().items():
+            plan = queryset.explain()
+            if options['verbosity'] > 1:
+                self.stdout.write(f'{name}:\n{plan}')
+
+            too_big = {}
+            for table in get_seq_scanned_tables(plan, connection.vendor):
+                rows = count_rows(table)
+                if rows > options['max_rows']:
+                    too_big[table] = rows
+
+            if too_big:
+                failing.append(name)
+                tables = ', '.join(
+                    f'{table} ({rows} rows)' for table, rows in too_big.items()
+                )
+                self.stdout.write(
+                    self.style.ERROR(f'{name}: full scan of {tables}')
+                )
+            else:
+                self.stdout.write(f'{name}: ok')
+
+        if failing:
+            raise CommandError(
+                COMMAND_CHECK_QUERY_PLANS_ERROR_MESSAGE % ', '.join(failing)
+            )
+        self.stdout.write(
+            self.style.SUCCESS(COMMAND_CHECK_QUERY_PLANS_SUCCESS_MESSAGE)
+        )
@@ -0,0 +1,65 @@
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from core.constants import (
+    COMMAND_PROFILE_REPORT_HELP_TEXT,
+    COMMAND_PROFILE_REPORT_SUCCESS_MESSAGE,
+    PROFILE_REPORT_TOP_FUNCTIONS,
+)
+from core.profiling import get_hot_functions, get_profiles_by_view
+
+
+class Command(BaseCommand):
+    help = COMMAND_PROFILE_REPORT_HELP_TEXT
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--directory',
+            default=settings.PROFILING_DIR,
+            help='Where the profiles are stored',
+        )
+        parser.add_argument(
+            '--top',
+            type=int,
+            default=PROFILE_REPORT_TOP_FUNCTIONS,
+            help='Amount of functions reported per view',
+        )
+        parser.add_argument(
+            '--sort',
+            choices=['tottime', 'cumtime', 'ncalls'],
+            default='tottime',
+            help='Order the functions by own time, cumulative time or calls',
+        )
+        parser.add_argument('--view', help='Only report this view (URL name)')
+
+    def handle(self, *args, **options):
+        profiles = get_profiles_by_view(options['directory'])
+        if options['view']:
+            profiles = {options['view']: profiles.get(options['view'], [])}
+
+        reported = 0
+        for view_name, paths in sorted(profiles.items()):
+            if not paths:
+                continue
+            reported += len(paths)
+            self.stdout.write(f'== {view_name} ({len(paths)} profiles) ==')
+            self.stdout.write(
+                f'{"own s":>9} {"cum s":>9} {"calls":>9}  function'
+            )
+            for (
+                function,
+                calls,
+                own_time,
+                cumulative_time,
+            ) in get_hot_functions(paths, options['sort'], options['top']):
+                self.stdout.write(
+                    f'{own_time:9.4f} {cumulative_time:9.4f} {calls:9d}  '
+                    f'{function}'
+                )
+            self.stdout.write('')
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                COMMAND_PROFILE_REPORT_SUCCESS_MESSAGE % reported
+            )
+        )
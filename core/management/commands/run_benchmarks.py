@@ -0,0 +1,155 @@
+import json
+import time
+from pathlib import Path
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+
+from core.benchmarks import BenchmarkError, compare_with_baseline, run_journeys
+from core.constants import (
+    BENCHMARK_BASELINE_PATH,
+    BENCHMARK_ITERATIONS,
+    BENCHMARK_LISTS,
+    BENCHMARK_TOLERANCE,
+    BENCHMARK_USERS,
+    BENCHMARK_VOTES,
+    COMMAND_RUN_BENCHMARKS_BASELINE_SAVED_MESSAGE,
+    COMMAND_RUN_BENCHMARKS_ERROR_MESSAGE,
+    COMMAND_RUN_BENCHMARKS_HELP_TEXT,
+    COMMAND_RUN_BENCHMARKS_OTHER_DATASET_MESSAGE,
+    COMMAND_RUN_BENCHMARKS_SUCCESS_MESSAGE,
+)
+from core.seeding import SeedError, seed_bulk
+from lists.models import QuestionList
+
+
+class Command(BaseCommand):
+    help = COMMAND_RUN_BENCHMARKS_HELP_TEXT
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--lists', type=int, default=BENCHMARK_LISTS, help='Lists to seed'
+        )
+        parser.add_argument(
+            '--votes', type=int, default=BENCHMARK_VOTES, help='Votes to seed'
+        )
+        parser.add_argument(
+            '--users', type=int, default=BENCHMARK_USERS, help='Users to seed'
+        )
+        parser.add_argument(
+            '--iterations',
+            type=int,
+            default=BENCHMARK_ITERATIONS,
+            help='Times every journey is run, each time by a new user',
+        )
+        parser.add_argument(
+            '--seed', type=int, default=0, help='Seed of the random choices'
+        )
+        parser.add_argument(
+            '--baseline',
+            default=BENCHMARK_BASELINE_PATH,
+            help='JSON file of the results to compare with',
+        )
+        parser.add_argument(
+            '--save-baseline',
+            action='store_true',
+            help='Store the results as the new baseline',
+        )
+        parser.add_argument(
+            '--tolerance',
+            type=float,
+            default=BENCHMARK_TOLERANCE,
+            help='Ratio latencies and RSS may grow over the baseline',
+        )
+        parser.add_argument(
+            '--keepdb',
+            action='store_true',
+            help='Keep the seeded database for the next runs',
+        )
+
+    def handle(self, *args, **options):
+        dataset = {
+            'lists': options['lists'],
+            'votes': options['votes'],
+            'users': options['users'],
+            'iterations': options['iterations'],
+        }
+
+        # Like the tests, on a database of its own
+        old_name = connection.settings_dict['NAME']
+        connection.creation.create_test_db(
+            verbosity=0,
+            autoclobber=True,
+            serialize=False,
+            keepdb=options['keepdb'],
+        )
+        try:
+            results = self.run(dataset, options['seed'])
+        except (BenchmarkError, SeedError) as error:
+            raise CommandError(error)
+        finally:
+            connection.creation.destroy_test_db(
+                old_name, verbosity=0, keepdb=options['keepdb']
+            )
+
+        for view_name, stats in results['views'].items():
+            latency = stats['latency_ms']
+            self.stdout.write(
+                f'{view_name}: {stats["requests"]} requests, '
+                f'p50 {latency["p50"]} / p95 {latency["p95"]} / '
+                f'p99 {latency["p99"]} ms, {stats["queries_avg"]} queries '
+                f'(max {stats["queries_max"]})'
+            )
+        self.stdout.write(
+            f'RSS: {results["rss_mb"]} MB '
+            f'({results["rss_growth_mb"]:+} MB while running the journeys)'
+        )
+
+        baseline_path = Path(options['baseline'])
+        if options['save_baseline']:
+            with open(baseline_path, 'w') as baseline_file:
+                json.dump(results, baseline_file, indent=2, sort_keys=True)
+                baseline_file.write('\n')
+            self.stdout.write(
+                self.style.SUCCESS(
+                    COMMAND_RUN_BENCHMARKS_BASELINE_SAVED_MESSAGE
+                    % baseline_path
+                )
+            )
+            return
+
+        with open(baseline_path) as baseline_file:
+            baseline = json.load(baseline_file)
+        if baseline['dataset'] != dataset:
+            self.stdout.write(
+                self.style.WARNING(
+                    COMMAND_RUN_BENCHMARKS_OTHER_DATASET_MESSAGE
+                )
+            )
+            return
+
+        regressions = compare_with_baseline(
+            results, baseline, options['tolerance']
+        )
+        if regressions:
+            raise CommandError(
+                COMMAND_RUN_BENCHMARKS_ERROR_MESSAGE % '; '.join(regressions)
+            )
+        self.stdout.write(
+            self.style.SUCCESS(COMMAND_RUN_BENCHMARKS_SUCCESS_MESSAGE)
+        )
+
+    def run(self, dataset, seed):
+        # A kept database is already seeded
+        if not QuestionList.objects.exists():
+            started = time.perf_counter()
+            seed_bulk(
+                dataset['users'], dataset['lists'], dataset['votes'], seed
+            )
+            self.stdout.write(
+                f'Dataset seeded in {time.perf_counter() - started:.0f} s'
+            )
+
+        results = run_journeys(dataset['iterations'], seed)
+        results['dataset'] = dataset
+        return results
@@ -0,0 +1,70 @@
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+
+from core.constants import (
+    COMMAND_SEED_BULK_HELP_TEXT,
+    COMMAND_SEED_BULK_SUCCESS_MESSAGE,
+    SEED_BULK_BATCH_SIZE,
+    SEED_BULK_LISTS,
+    SEED_BULK_USERS,
+    SEED_BULK_VOTES,
+)
+from core.seeding import SeedError, seed_bulk
+
+
+class Command(BaseCommand):
+    help = COMMAND_SEED_BULK_HELP_TEXT
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--users', type=int, default=SEED_BULK_USERS, help='Users to add'
+        )
+        parser.add_argument(
+            '--lists', type=int, default=SEED_BULK_LISTS, help='Lists to add'
+        )
+        parser.add_argument(
+            '--votes', type=int, default=SEED_BULK_VOTES, help='Votes to add'
+        )
+        parser.add_argument(
+            '--seed',
+            type=int,
+            default=0,
+            help='Seed of the random data, the same one leads to the same data',
+        )
+        parser.add_argument(
+            '--password',
+            help='Password of every seeded user, they can not log in without',
+        )
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=SEED_BULK_BATCH_SIZE,
+            help='Rows inserted at once',
+        )
+
+    def handle(self, *args, **options):
+        started = time.perf_counter()
+        try:
+            seed_bulk(
+                options['users'],
+                options['lists'],
+                options['votes'],
+                seed=options['seed'],
+                password=options['password'],
+                batch_size=options['batch_size'],
+            )
+        except SeedError as error:
+            raise CommandError(error)
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                COMMAND_SEED_BULK_SUCCESS_MESSAGE
+                % (
+                    options['users'],
+                    options['lists'],
+                    options['votes'],
+                    time.perf_counter() - started,
+                )
+            )
+        )
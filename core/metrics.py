@@ -0,0 +1,159 @@
+import json
+import logging
+import threading
+import time
+from collections import defaultdict, deque, namedtuple
+
+from django.conf import settings
+
+logger = logging.getLogger(__name__)
+
+# Upper bounds (ms) of the latency histogram buckets, the last one is +Inf
+LATENCY_BUCKETS = (5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000)
+
+RequestSample = namedtuple(
+    'RequestSample',
+    ['status', 'latency_ms', 'queries', 'sql_ms', 'template_ms'],
+)
+
+
+class RequestTimer:
+    """
+    Times a request while it goes through the middleware: its SQL queries
+    (as an ``execute_wrapper`` of the connection) and the rendering of its
+    ``TemplateResponse``, if any.
+    """
+
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.queries = 0
+        self.sql_seconds = 0
+        self.render_started = None
+        self.template_seconds = 0
+
+    def __call__(self, execute, sql, params, many, context):
+        started = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.sql_seconds += time.perf_counter() - started
+            self.queries += 1
+
+    def start_render(self):
+        self.render_started = time.perf_counter()
+
+    def end_render(self):
+        self.template_seconds += time.perf_counter() - self.render_started
+
+    def get_sample(self, status):
+        return RequestSample(
+            status=status,
+            latency_ms=(time.perf_counter() - self.started) * 1000,
+            queries=self.queries,
+            sql_ms=self.sql_seconds * 1000,
+            template_ms=self.template_seconds * 1000,
+        )
+
+
+def get_percentile(sorted_values, percentile):
+    index = round(percentile / 100 * (len(sorted_values) - 1))
+    return sorted_values[index]
+
+
+class RequestMetrics:
+    """
+    The latest ``REQUEST_METRICS_WINDOW`` samples of every view, kept in
+    memory by the process, so the summary is a rolling one.
+    """
+
+    def __init__(self):
+        self.samples = defaultdict(
+            lambda: deque(maxlen=settings.REQUEST_METRICS_WINDOW)
+        )
+        self.lock = threading.Lock()
+
+    def record(self, view_name, sample):
+        with self.lock:
+            self.samples[view_name].append(sample)
+
+    def reset(self):
+        with self.lock:
+            self.samples.clear()
+
+    def get_summary(self):
+        with self.lock:
+            samples = {
+                view_name: list(view_samples)
+                for view_name, view_samples in self.samples.items()
+            }
+        return {
+            view_name: summarize(view_name, view_samples)
+            for view_name, view_samples in sorted(samples.items())
+        }
+
+
+def summarize(view_name, samples):
+    latencies = sorted(sample.latency_ms for sample in samples)
+    histogram = {str(bucket): 0 for bucket in LATENCY_BUCKETS}
+    histogram['+Inf'] = 0
+    for latency in latencies:
+        bucket = next(
+            (str(bucket) for bucket in LATENCY_BUCKETS if latency <= bucket),
+            '+Inf',
+        )
+        histogram[bucket] += 1
+
+    budget = settings.QUERY_BUDGETS.get(view_name)
+    return {
+        'requests': len(samples),
+        'errors': sum(sample.status >= 500 for sample in samples),
+        'latency_ms': {
+            'p50': round(get_percentile(latencies, 50), 2),
+            'p95': round(get_percentile(latencies, 95), 2),
+            'p99': round(get_percentile(latencies, 99), 2),
+            'max': round(latencies[-1], 2),
+        },
+        'latency_histogram': histogram,
+        'queries': {
+            'avg': round(
+                sum(sample.queries for sample in samples) / len(samples), 2
+            ),
+            'max': max(sample.queries for sample in samples),
+            'budget': budget,
+            'over_budget': sum(
+                budget is not None and sample.queries > budget
+                for sample in samples
+            ),
+        },
+        'sql_ms_avg': round(
+            sum(sample.sql_ms for sample in samples) / len(samples), 2
+        ),
+        'template_ms_avg': round(
+            sum(sample.template_ms for sample in samples) / len(samples), 2
+        ),
+    }
+
+
+def log_sample(request, view_name, sample):
+    """One JSON line per request, and a warning when over its budget"""
+    record = {
+        'view': view_name,
+        'method': request.method,
+        'status': sample.status,
+        'latency_ms': round(sample.latency_ms, 2),
+        'queries': sample.queries,
+        'sql_ms': round(sample.sql_ms, 2),
+        'template_ms': round(sample.template_ms, 2),
+    }
+    logger.info(json.dumps(record))
+
+    budget = settings.QUERY_BUDGETS.get(view_name)
+    if budget is not None and sample.queries > budget:
+        logger.warning(
+            json.dumps(
+                {'event': 'query_budget_exceeded', 'budget': budget, **record}
+            )
+        )
+
+
+request_metrics = RequestMetrics()
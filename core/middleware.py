@@ -0,0 +1,81 @@
+import cProfile
+
+from django.conf import settings
+from django.db import connection
+
+from .metrics import RequestTimer, log_sample, request_metrics
+from .profiling import StackSampler, save_profile, should_profile
+
+UNRESOLVED_VIEW_NAME = 'unresolved'
+
+
+def get_view_name(request):
+    resolver_match = getattr(request, 'resolver_match', None)
+    return (
+        resolver_match.url_name if resolver_match else None
+    ) or UNRESOLVED_VIEW_NAME
+
+
+class RequestMetricsMiddleware:
+    """
+    Record the SQL queries, SQL time, template rendering time and latency of
+    every request, by URL name. It's cheap enough for production: queries
+    are counted and timed, never stored.
+
+    Template rendering is only timed for ``TemplateResponse`` (class-based
+    views). For views calling ``render()`` it's part of the latency only.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        request.metrics_timer = timer = RequestTimer()
+        with connection.execute_wrapper(timer):
+            response = self.get_response(request)
+
+        view_name = get_view_name(request)
+        sample = timer.get_sample(response.status_code)
+        request_metrics.record(view_name, sample)
+        log_sample(request, view_name, sample)
+        return response
+
+    def process_template_response(self, request, response):
+        # Rendering comes right after the last of these hooks, this one
+        timer = request.metrics_timer
+        timer.start_render()
+        response.add_post_render_callback(lambda response: timer.end_render())
+        return response
+
+
+class RequestProfilerMiddleware:
+    """
+    Profile some requests with cProfile and a stack sampler at once, see
+    ``core.profiling.should_profile``. The ``profile_report`` command sums
+    the stored profiles up by view.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        if not should_profile(request):
+            return self.get_response(request)
+
+        profile = cProfile.Profile()
+        try:
+            profile.enable()
+        except ValueError:
+            # Another request of the process is being profiled already
+            return self.get_response(request)
+
+        sampler = StackSampler(settings.PROFILING_SAMPLE_INTERVAL)
+        sampler.start()
+        try:
+            response = self.get_response(request)
+        finally:
+            profile.disable()
+            sampler.stop()
+
+        save_profile(get_view_name(request), profile, sampler.stacks)
+        return response
@@ -6,6 +6,8 @@ from django.contrib.auth.mixins import UserPassesTestMixin
 
 from lists.models import QuestionList
 
+from .pagination import KeysetPaginator
+
 
 class TestModelStrMixin:
     @property
@@ -61,3 +63,25 @@ class CustomUserPassesTestMixin(UserPassesTestMixin):
         ):
             return True
         return False
+
+
+class KeysetPaginationMixin:
+    """
+    Paginate a ``ListView`` with a ``KeysetPaginator``, by the ordering of
+    its queryset. The page comes in the ``cursor`` GET parameter.
+    """
+
+    cursor_kwarg = 'cursor'
+
+    def paginate_queryset(self, queryset, page_size):
+        paginator = KeysetPaginator(queryset, page_size)
+        page = paginator.get_page(self.request.GET.get(self.cursor_kwarg))
+        return (paginator, page, page.object_list, page.has_other_pages())
+
+    def get_context_data(self, **kwargs):
+        context = super().get_context_data(**kwargs)
+        # The other parameters (search, filters) go along with the cursor
+        params = self.request.GET.copy()
+        params.pop(self.cursor_kwarg, None)
+        context['pagination_params'] = params.urlencode()
+        return context
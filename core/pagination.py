@@ -0,0 +1,167 @@
+import base64
+import binascii
+import datetime
+import json
+
+from django.core.exceptions import ImproperlyConfigured, ValidationError
+from django.db.models import Q
+
+NEXT = 'n'
+PREVIOUS = 'p'
+
+
+def encode_cursor_value(value):
+    # Parsed back by the field when filtering
+    if isinstance(value, datetime.datetime):
+        return value.isoformat()
+    raise TypeError(f'{type(value).__name__} can\'t be part of a cursor')
+
+
+def encode_cursor(direction, values):
+    cursor = json.dumps(
+        [direction, values], separators=(',', ':'), default=encode_cursor_value
+    )
+    return base64.urlsafe_b64encode(cursor.encode()).decode().rstrip('=')
+
+
+def decode_cursor(cursor, amount_of_values):
+    """
+    The ``(direction, values)`` of ``cursor``, or ``None`` if it isn't
+    a valid one.
+    """
+    try:
+        padding = '=' * (-len(cursor) % 4)
+        direction, values = json.loads(
+            base64.urlsafe_b64decode(cursor + padding)
+        )
+    except (binascii.Error, UnicodeDecodeError, ValueError, TypeError):
+        return None
+    if (
+        direction not in (NEXT, PREVIOUS)
+        or not isinstance(values, list)
+        or len(values) != amount_of_values
+        or not all(isinstance(value, (int, float, str)) for value in values)
+    ):
+        return None
+    return direction, values
+
+
+class KeysetPage:
+    """
+    A page of a ``KeysetPaginator``. It has what the templates use of
+    Django's ``Page``, but its number: previous and next pages are reached
+    through cursors.
+    """
+
+    def __init__(self, object_list, paginator, has_previous, has_next):
+        self.object_list = object_list
+        self.paginator = paginator
+        self._has_previous = has_previous
+        self._has_next = has_next
+
+    def __repr__(self):
+        return f'<KeysetPage of {len(self.object_list)} objects>'
+
+    def __len__(self):
+        return len(self.object_list)
+
+    def __getitem__(self, index):
+        return self.object_list[index]
+
+    def has_previous(self):
+        return self._has_previous
+
+    def has_next(self):
+        return self._has_next
+
+    def has_other_pages(self):
+        return self._has_previous or self._has_next
+
+    @property
+    def previous_cursor(self):
+        if self._has_previous:
+            return self.paginator.get_cursor(PREVIOUS, self.object_list[0])
+
+    @property
+    def next_cursor(self):
+        if self._has_next:
+            return self.paginator.get_cursor(NEXT, self.object_list[-1])
+
+
+class KeysetPaginator:
+    """
+    Paginate ``queryset`` by its ordering, every page being the rows right
+    after (or before) the last (or first) row of the page already seen.
+    Unlike OFFSET, reaching a deep page costs the same as the first one, and
+    rows are never counted.
+
+    The ordering fields (ending with a unique one, like ``-id``) must be
+    attributes of the rows, such as annotations, and never be null. Their
+    values are numbers, strings or datetimes.
+    """
+
+    def __init__(self, queryset, per_page, ordering=None):
+        self.queryset = queryset
+        self.per_page = per_page
+        self.ordering = tuple(ordering or queryset.query.order_by)
+        if not self.ordering or not all(
+            isinstance(field, str) and '__' not in field
+            for field in self.ordering
+        ):
+            raise ImproperlyConfigured(
+                'Keyset pagination needs an ordering by fields of the rows'
+            )
+
+    def get_cursor(self, direction, row):
+        values = [getattr(row, field.lstrip('-')) for field in self.ordering]
+        return encode_cursor(direction, values)
+
+    def get_keyset_filter(self, values, forward):
+        """Rows after ``values``, in the ordering, or before them"""
+        keyset_filter = Q()
+        equal_values = {}
+        for field, value in zip(self.ordering, values):
+            name = field.lstrip('-')
+            lookup = 'lt' if field.startswith('-') == forward else 'gt'
+            keyset_filter |= Q(**equal_values, **{f'{name}__{lookup}': value})
+            equal_values[name] = value
+        return keyset_filter
+
+    def get_page(self, cursor=None):
+        """The page of ``cursor``, the first one if there's no valid cursor"""
+        decoded = decode_cursor(cursor, len(self.ordering)) if cursor else None
+        if decoded is None:
+            direction, values = NEXT, None
+        else:
+            direction, values = decoded
+        forward = direction == NEXT
+
+        ordering = self.ordering
+        if not forward:
+            ordering = [
+                field[1:] if field.startswith('-') else f'-{field}'
+                for field in ordering
+            ]
+        queryset = self.queryset.order_by(*ordering)
+        if values is not None:
+            try:
+                queryset = queryset.filter(
+                    self.get_keyset_filter(values, forward)
+                )
+            except (ValidationError, ValueError, TypeError):
+                # Values not fitting their fields
+                return self.get_page()
+
+        # One more row tells whether there's another page
+        rows = list(queryset[: self.per_page + 1])
+        if not rows and values is not None:
+            # Every row around the cursor is gone
+            return self.get_page()
+        has_more = len(rows) > self.per_page
+        rows = rows[: self.per_page]
+        if forward:
+            return KeysetPage(
+                rows, self, has_previous=values is not None, has_next=has_more
+            )
+        rows.reverse()
+        return KeysetPage(rows, self, has_previous=has_more, has_next=True)
@@ -0,0 +1,123 @@
+import os
+import pstats
+import random
+import sys
+import threading
+import time
+from collections import Counter, defaultdict
+from pathlib import Path
+
+from django.conf import settings
+
+PROFILE_EXTENSION = '.prof'
+STACKS_EXTENSION = '.collapsed'
+
+
+def should_profile(request):
+    """
+    Staff can ask for a profile with the ``PROFILING_HEADER`` header, other
+    requests are profiled with a ``PROFILING_SAMPLE_RATE`` probability.
+    """
+    if request.META.get(settings.PROFILING_HEADER):
+        user = getattr(request, 'user', None)
+        return user is not None and user.is_staff
+    return random.random() < settings.PROFILING_SAMPLE_RATE
+
+
+def collapse_stack(frame):
+    """The stack of ``frame`` in the collapsed format of flamegraphs"""
+    names = []
+    while frame is not None:
+        code = frame.f_code
+        filename = os.path.basename(code.co_filename)
+        names.append(f'{code.co_name} ({filename}:{code.co_firstlineno})')
+        frame = frame.f_back
+    return ';'.join(reversed(names))
+
+
+class StackSampler:
+    """
+    Sample the stack of the thread creating it every ``interval`` seconds,
+    from another thread. Unlike cProfile, it keeps the whole stacks.
+    """
+
+    def __init__(self, interval):
+        self.interval = interval
+        self.thread_id = threading.get_ident()
+        self.stacks = Counter()
+        self.stopped = threading.Event()
+        self.thread = threading.Thread(
+            target=self.run, name='stack-sampler', daemon=True
+        )
+
+    def start(self):
+        self.thread.start()
+
+    def stop(self):
+        self.stopped.set()
+        self.thread.join()
+
+    def run(self):
+        while not self.stopped.wait(self.interval):
+            frame = sys._current_frames().get(self.thread_id)
+            if frame is not None:
+                self.stacks[collapse_stack(frame)] += 1
+
+
+def save_profile(view_name, profile, stacks):
+    """
+    Store ``<view name>.<timestamp>.<pid>.prof`` (pstats) and its
+    ``.collapsed`` stacks in ``PROFILING_DIR``, then drop the oldest
+    profiles beyond ``PROFILING_MAX_PROFILES``.
+    """
+    directory = Path(settings.PROFILING_DIR)
+    directory.mkdir(parents=True, exist_ok=True)
+    name = f'{view_name}.{time.time_ns()}.{os.getpid()}'
+
+    profile.dump_stats(directory / f'{name}{PROFILE_EXTENSION}')
+    with open(directory / f'{name}{STACKS_EXTENSION}', 'w') as stacks_file:
+        for stack, samples in stacks.most_common():
+            stacks_file.write(f'{stack} {samples}\n')
+
+    rotate_profiles(directory, settings.PROFILING_MAX_PROFILES)
+
+
+def rotate_profiles(directory, max_profiles):
+    # Oldest first, by the timestamp of their name
+    profiles = sorted(
+        Path(directory).glob(f'*{PROFILE_EXTENSION}'),
+        key=lambda path: int(path.name.split('.')[1]),
+    )
+    for path in profiles[: max(len(profiles) - max_profiles, 0)]:
+        path.unlink(missing_ok=True)
+        path.with_suffix(STACKS_EXTENSION).unlink(missing_ok=True)
+
+
+def get_profiles_by_view(directory):
+    profiles = defaultdict(list)
+    for path in sorted(Path(directory).glob(f'*{PROFILE_EXTENSION}')):
+        view_name = path.name.split('.')[0]
+        profiles[view_name].append(path)
+    return profiles
+
+
+def get_hot_functions(paths, sort_by, top):
+    """
+    The ``top`` functions of the merged profiles, as ``(function, calls,
+    own seconds, cumulative seconds)`` tuples.
+    """
+    stats = pstats.Stats(*[str(path) for path in paths])
+    stats.sort_stats(sort_by)
+    hot_functions = []
+    for function in stats.fcn_list[:top]:
+        _, calls, own_time, cumulative_time, _ = stats.stats[function]
+        filename, line, name = function
+        hot_functions.append(
+            (
+                f'{name} ({os.path.basename(filename)}:{line})',
+                calls,
+                own_time,
+                cumulative_time,
+            )
+        )
+    return hot_functions
@@ -0,0 +1,78 @@
+import datetime
+import re
+
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.db.models import Q
+from django.utils import timezone
+
+from core.constants import (
+    AMOUNT_OF_DAYS_FOR_POPULARITY,
+    AMOUNT_OF_LISTS_PER_PAGE,
+)
+from lists.models import ListPopularity, QuestionList
+from questions.models import Question
+from votes.models import Vote
+
+# How every database reports a full table scan in its plans
+SEQ_SCAN_PATTERNS = {
+    # 'SCAN lists_questionlist', but not 'SCAN ... USING INDEX ...'
+    'sqlite': re.compile(r'\bSCAN (?:TABLE )?(\w+)(?!.*\bUSING\b)'),
+    'postgresql': re.compile(r'\bSeq Scan on (\w+)'),
+}
+
+
+def get_main_querysets():
+    """
+    The shapes of the hottest queries of the site, for the ids of the first
+    user and list of the database.
+    """
+    user_id = (
+        get_user_model().objects.values_list('id', flat=True).first() or 0
+    )
+    list_id = QuestionList.objects.values_list('id', flat=True).first() or 0
+    votes_field = ListPopularity.get_votes_field(AMOUNT_OF_DAYS_FOR_POPULARITY)
+    since = timezone.now() - datetime.timedelta(
+        days=AMOUNT_OF_DAYS_FOR_POPULARITY
+    )
+    alternatives_chosen = get_user_model().alternatives_chosen.through
+
+    return {
+        'public lists': QuestionList.activated_lists.filter(
+            private=False
+        ).order_by('-id')[:AMOUNT_OF_LISTS_PER_PAGE],
+        'popular lists': QuestionList.activated_lists.filter(
+            private=False, **{f'popularity__{votes_field}__gt': 0}
+        ).order_by(f'-popularity__{votes_field}', '-id')[
+            :AMOUNT_OF_LISTS_PER_PAGE
+        ],
+        'user lists': QuestionList.objects.filter(
+            owner_id=user_id, active=True
+        ).order_by('-id')[:AMOUNT_OF_LISTS_PER_PAGE],
+        'user votes of a list': Vote.objects.filter(
+            user_id=user_id, list_id=list_id
+        ),
+        'recent votes of a list': Vote.objects.filter(
+            list_id=list_id, created__gte=since
+        ),
+        'alternatives chosen by a user': alternatives_chosen.objects.filter(
+            customuser_id=user_id, alternative__question__child_of_id=list_id
+        ),
+        'unanswered questions': Question.objects.filter(
+            child_of_id=list_id
+        ).filter(~Q(alternatives__users=user_id)),
+    }
+
+
+def get_seq_scanned_tables(plan, vendor):
+    tables = set(SEQ_SCAN_PATTERNS[vendor].findall(plan))
+    # Leave out things like sqlite's 'SCAN CONSTANT ROW'
+    return tables & set(connection.introspection.table_names())
+
+
+def count_rows(table):
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f'SELECT COUNT(*) FROM {connection.ops.quote_name(table)}'
+        )
+        return cursor.fetchone()[0]
@@ -0,0 +1,305 @@
+import io
+import itertools
+import random
+
+from django.contrib.auth import get_user_model
+from django.contrib.auth.hashers import make_password
+from django.core.management import call_command
+from django.db import DEFAULT_DB_ALIAS, connection, connections, transaction
+from django.utils import timezone
+
+from core.constants import AMOUNT_OF_QUESTIONS_PER_LIST, DEFAULT_IMAGE_NAME
+from lists.models import QuestionList, UserListPlay
+from lists.popularity import refresh_popularity
+from lists.search import rebuild_search_index
+from questions.models import Alternative, Question
+from users.stats import rebuild_user_stats
+from votes.models import Vote
+
+# Words of the titles of the seeded lists and alternatives
+SEED_WORDS = (
+    'football',
+    'music',
+    'movies',
+    'pizza',
+    'travel',
+    'books',
+    'games',
+    'science',
+    'history',
+    'animals',
+)
+# Share of the seeded lists still being edited, and of the private ones
+DRAFT_LISTS_RATIO = 0.1
+PRIVATE_LISTS_RATIO = 0.05
+# Amount of plays (a user answering a whole list) generated at once
+PLAYS_PER_BATCH = 500
+
+
+class SeedError(Exception):
+    pass
+
+
+def get_batches(iterable, size):
+    iterator = iter(iterable)
+    batch = list(itertools.islice(iterator, size))
+    while batch:
+        yield batch
+        batch = list(itertools.islice(iterator, size))
+
+
+def get_copy_value(value):
+    """``value`` in the text format of Postgres' COPY"""
+    if value is None:
+        return '\\N'
+    if isinstance(value, bool):
+        return 't' if value else 'f'
+    return (
+        str(value)
+        .replace('\\', '\\\\')
+        .replace('\t', '\\t')
+        .replace('\n', '\\n')
+        .replace('\r', '\\r')
+    )
+
+
+def get_rows(fields, instances):
+    """
+    The values of ``fields`` of ``instances``, prepared as ``bulk_create``
+    does.
+    """
+    # Looking the connection up is slow, and it's needed for every value
+    default_connection = connections[DEFAULT_DB_ALIAS]
+    return [
+        [
+            field.get_db_prep_save(
+                field.pre_save(instance, True), default_connection
+            )
+            for field in fields
+        ]
+        for instance in instances
+    ]
+
+
+def insert(model, instances):
+    """
+    Insert ``instances`` at once: with COPY on Postgres, way faster than
+    INSERT there, and with a prepared INSERT elsewhere. Unlike
+    ``bulk_create``, no SQL is built per batch of rows.
+    """
+    fields = [
+        field for field in model._meta.concrete_fields if not field.primary_key
+    ]
+    rows = get_rows(fields, instances)
+    quote_name = connection.ops.quote_name
+    table = quote_name(model._meta.db_table)
+    columns = ', '.join(quote_name(field.column) for field in fields)
+
+    with connection.cursor() as cursor:
+        if connection.vendor == 'postgresql':
+            text = ''.join(
+                '\t'.join(get_copy_value(value) for value in row) + '\n'
+                for row in rows
+            )
+            cursor.cursor.copy_expert(
+                f'COPY {table} ({columns}) FROM STDIN', io.StringIO(text)
+            )
+        else:
+            placeholders = ', '.join(['%s'] * len(fields))
+            cursor.executemany(
+                f'INSERT INTO {table} ({columns}) VALUES ({placeholders})',
+                rows,
+            )
+
+
+def insert_in_batches(model, instances, batch_size):
+    for batch in get_batches(instances, batch_size):
+        insert(model, batch)
+
+
+def insert_and_get_ids(model, instances, batch_size):
+    """Insert ``instances`` by batches, returning the ids they got in order"""
+    ids = []
+    for batch in get_batches(instances, batch_size):
+        last_id = (
+            model.objects.order_by('-id').values_list('id', flat=True).first()
+        )
+        insert(model, batch)
+        # Neither COPY nor INSERT return the ids here
+        ids.extend(
+            model.objects.filter(id__gt=last_id or 0)
+            .order_by('id')
+            .values_list('id', flat=True)
+        )
+    return ids
+
+
+def seed_bulk(users, lists, votes, seed=0, password=None, batch_size=1000):
+    """
+    Add ``users`` users, ``lists`` lists of ``AMOUNT_OF_QUESTIONS_PER_LIST``
+    questions and ``votes`` votes, with whole lists answered (plays) by the
+    users. The same ``seed`` always leads to the same data.
+
+    Rows are bulk inserted, so neither signals nor image processing run:
+    every alternative shares the default image, and the derived data (vote
+    counters, popularity, search index, user stats) is rebuilt at the end.
+    """
+    User = get_user_model()
+    prefix = f'seed-{seed}'
+    if User.objects.filter(username=f'{prefix}-user-0').exists():
+        raise SeedError(f'The database was already seeded with seed {seed}')
+
+    questions_per_list = AMOUNT_OF_QUESTIONS_PER_LIST
+    rng = random.Random(seed)
+    drafts = set(rng.sample(range(lists), int(lists * DRAFT_LISTS_RATIO)))
+    private = set(rng.sample(range(lists), int(lists * PRIVATE_LISTS_RATIO)))
+    # Only active lists can be answered
+    playable = [index for index in range(lists) if index not in drafts]
+    plays = votes // questions_per_list
+    if plays > len(playable) * users:
+        raise SeedError(
+            f'{users} users can not cast {votes} votes on {len(playable)} '
+            'active lists'
+        )
+
+    # Hashing is slow on purpose, so every user shares the same hash
+    password = make_password(password)
+    with transaction.atomic():
+        users_ids = insert_and_get_ids(
+            User,
+            (
+                User(
+                    username=f'{prefix}-user-{i}',
+                    email=f'{prefix}-user-{i}@email.com',
+                    password=password,
+                )
+                for i in range(users)
+            ),
+            batch_size,
+        )
+        lists_ids = insert_and_get_ids(
+            QuestionList,
+            (
+                QuestionList(
+                    title=' '.join(rng.sample(SEED_WORDS, 2)) + f' {i}',
+                    slug=f'{prefix}-list-{i}',
+                    owner_id=rng.choice(users_ids),
+                    active=i not in drafts,
+                    private=i in private,
+                )
+                for i in range(lists)
+            ),
+            batch_size,
+        )
+        questions_ids = insert_and_get_ids(
+            Question,
+            (
+                Question(
+                    title=f'Question {i}',
+                    slug=f'question-{i}',
+                    child_of_id=list_id,
+                )
+                for list_id in lists_ids
+                for i in range(questions_per_list)
+            ),
+            batch_size,
+        )
+        alternatives_ids = insert_and_get_ids(
+            Alternative,
+            (
+                Alternative(
+                    title=title,
+                    question_id=question_id,
+                    image=DEFAULT_IMAGE_NAME,
+                )
+                for question_id in questions_ids
+                for title in rng.sample(SEED_WORDS, 2)
+            ),
+            batch_size,
+        )
+
+        # Share of the votes of every question for its first alternative
+        questions_bias = [rng.random() for _ in questions_ids]
+        playable = rng.sample(playable, len(playable))
+        for start in range(0, plays, PLAYS_PER_BATCH):
+            save_plays(
+                [
+                    # Every user plays different lists
+                    (
+                        k % users,
+                        playable[(k // users + k % users) % len(playable)],
+                    )
+                    for k in range(start, min(start + PLAYS_PER_BATCH, plays))
+                ],
+                users_ids,
+                lists_ids,
+                questions_ids,
+                alternatives_ids,
+                questions_bias,
+                rng,
+                batch_size,
+            )
+
+    call_command('rebuild_vote_counters', stdout=io.StringIO())
+    refresh_popularity()
+    rebuild_search_index()
+    rebuild_user_stats()
+
+
+def save_plays(
+    plays,
+    users_ids,
+    lists_ids,
+    questions_ids,
+    alternatives_ids,
+    questions_bias,
+    rng,
+    batch_size,
+):
+    """
+    Answer every question of the list of every ``(user index, list index)``
+    play, the questions and alternatives of a list being contiguous.
+    """
+    through = get_user_model().alternatives_chosen.through
+    now = timezone.now()
+    votes = []
+    alternatives_chosen = []
+    users_plays = []
+    for user_index, list_index in plays:
+        user_id = users_ids[user_index]
+        list_id = lists_ids[list_index]
+        first_question = list_index * AMOUNT_OF_QUESTIONS_PER_LIST
+        answered = []
+        for question_index in range(
+            first_question, first_question + AMOUNT_OF_QUESTIONS_PER_LIST
+        ):
+            question_id = questions_ids[question_index]
+            second = rng.random() >= questions_bias[question_index]
+            alternative_id = alternatives_ids[2 * question_index + second]
+            votes.append(
+                Vote(
+                    user_id=user_id,
+                    list_id=list_id,
+                    question_id=question_id,
+                    alternative_id=alternative_id,
+                )
+            )
+            alternatives_chosen.append(
+                through(customuser_id=user_id, alternative_id=alternative_id)
+            )
+            answered.append(question_id)
+        users_plays.append(
+            UserListPlay(
+                user_id=user_id,
+                question_list_id=list_id,
+                answered_questions=answered,
+                questions_amount=len(answered),
+                first_played=now,
+                last_played=now,
+                completed=now,
+            )
+        )
+
+    insert_in_batches(Vote, votes, batch_size)
+    insert_in_batches(through, alternatives_chosen, batch_size)
+    insert_in_batches(UserListPlay, users_plays, batch_size)
@@ -0,0 +1,121 @@
+from unittest.mock import patch
+
+from django.test import TestCase
+
+from lists.models import UserListPlay
+
+from ..benchmarks import (
+    BenchmarkError,
+    compare_with_baseline,
+    get_max_rss_kb,
+    get_rss_mb,
+    run_journeys,
+)
+from ..seeding import seed_bulk
+
+
+def get_results(p95=10, queries_max=5, rss_growth_mb=20):
+    return {
+        'views': {
+            'questions_list': {
+                'requests': 3,
+                'latency_ms': {'p50': 5, 'p95': p95, 'p99': p95},
+                'queries_avg': queries_max,
+                'queries_max': queries_max,
+            }
+        },
+        'rss_mb': 500,
+        'rss_growth_mb': rss_growth_mb,
+    }
+
+
+class RunJourneysTests(TestCase):
+    def test_run_journeys(self):
+        # Two pages of lists
+        seed_bulk(users=2, lists=10, votes=20)
+
+        results = run_journeys(iterations=2)
+
+        views = results['views']
+        self.assertEqual(views['questions_list']['requests'], 2 * 3)
+        self.assertEqual(views['search_lists']['requests'], 2)
+        self.assertEqual(views['autocomplete_lists']['requests'], 2)
+        # A GET and a POST per question
+        self.assertEqual(views['answer_list']['requests'], 2 * 2 * 10)
+        self.assertEqual(views['answer_list_at_once']['requests'], 2)
+        self.assertEqual(views['list_results']['requests'], 4)
+        self.assertGreater(views['list_results']['queries_max'], 0)
+        self.assertGreater(results['rss_mb'], 0)
+        self.assertIn('rss_growth_mb', results)
+        # Every runner answered two lists
+        self.assertEqual(
+            UserListPlay.objects.filter(
+                user__username__startswith='benchmark-runner-'
+            ).count(),
+            4,
+        )
+
+    def test_run_journeys_without_lists(self):
+        with self.assertRaises(BenchmarkError):
+            run_journeys(iterations=1)
+
+
+class GetRssTests(TestCase):
+    @patch('core.benchmarks.resource.getrusage')
+    @patch('core.benchmarks.open', side_effect=FileNotFoundError, create=True)
+    def test_without_proc(self, _, getrusage):
+        getrusage.return_value.ru_maxrss = 4096
+
+        with patch('core.benchmarks.sys.platform', 'linux'):
+            self.assertEqual(get_rss_mb(), 4)
+
+    @patch('core.benchmarks.resource.getrusage')
+    def test_max_rss_in_bytes_on_macos(self, getrusage):
+        getrusage.return_value.ru_maxrss = 2048 * 1024
+
+        with patch('core.benchmarks.sys.platform', 'darwin'):
+            self.assertEqual(get_max_rss_kb(), 2048)
+        with patch('core.benchmarks.sys.platform', 'linux'):
+            self.assertEqual(get_max_rss_kb(), 2048 * 1024)
+
+
+class CompareWithBaselineTests(TestCase):
+    def test_no_regressions(self):
+        regressions = compare_with_baseline(
+            get_results(p95=14, rss_growth_mb=39), get_results(), tolerance=0.5
+        )
+
+        self.assertEqual(regressions, [])
+
+    def test_slower(self):
+        regressions = compare_with_baseline(
+            get_results(p95=16), get_results(), tolerance=0.5
+        )
+
+        self.assertEqual(
+            regressions, ['questions_list: p95 of 16 ms, it was 10 ms']
+        )
+
+    def test_more_queries(self):
+        regressions = compare_with_baseline(
+            get_results(queries_max=6), get_results(), tolerance=0.5
+        )
+
+        self.assertEqual(regressions, ['questions_list: 6 queries, it was 5'])
+
+    def test_more_memory(self):
+        regressions = compare_with_baseline(
+            get_results(rss_growth_mb=41), get_results(), tolerance=0.5
+        )
+
+        self.assertEqual(regressions, ['RSS grew 41 MB, it grew 20 MB'])
+
+    def test_view_not_requested(self):
+        results = get_results()
+        results['views'] = {}
+
+        regressions = compare_with_baseline(
+            results, get_results(), tolerance=0.5
+        )
+
+        self.assertEqual(regressions, ['questions_list: not requested'])
@@ -1,14 +1,26 @@
 import io
+import json
+import tempfile
 from pathlib import Path
+from unittest.mock import patch
 
 from django.core.management import call_command
 from django.core.management.base import CommandError
-from django.test import TestCase
+from django.test import TestCase, override_settings
+from django.urls import reverse
 
 from core.constants import (
+    COMMAND_CHECK_QUERY_PLANS_SUCCESS_MESSAGE,
+    COMMAND_PROFILE_REPORT_SUCCESS_MESSAGE,
+    COMMAND_RUN_BENCHMARKS_BASELINE_SAVED_MESSAGE,
+    COMMAND_RUN_BENCHMARKS_OTHER_DATASET_MESSAGE,
+    COMMAND_RUN_BENCHMARKS_SUCCESS_MESSAGE,
     COMMAND_TEST_FOLDER_SUCCESS_MESSAGE,
     COMPLETE_PATH_TO_TEST_IMGS_FOLDER,
 )
+from core.query_plans import get_seq_scanned_tables
+from lists.factories import QuestionListFactory
+from lists.models import QuestionList
 
 
 class DeleteTestImagesFolderCommandTests(TestCase):
@@ -25,3 +37,167 @@ class DeleteTestImagesFolderCommandTests(TestCase):
         out = io.StringIO()
         call_command('delete_test_images_folder', stdout=out)
         self.assertIn(COMMAND_TEST_FOLDER_SUCCESS_MESSAGE, out.getvalue())
+
+
+class CheckQueryPlansCommandTests(TestCase):
+    def test_get_seq_scanned_tables_sqlite(self):
+        plan = (
+            '4 0 0 SCAN lists_questionlist\n'
+            '5 0 0 SCAN votes_vote USING INDEX votes_vote_list_id\n'
+            '6 0 0 SEARCH questions_question USING INDEX child_of_id\n'
+            '7 0 0 SCAN CONSTANT ROW'
+        )
+
+        self.assertEqual(
+            get_seq_scanned_tables(plan, 'sqlite'), {'lists_questionlist'}
+        )
+
+    def test_get_seq_scanned_tables_postgresql(self):
+        plan = (
+            'Limit  (cost=0.28..1.12 rows=6 width=66)\n'
+            '  ->  Seq Scan on votes_vote  (cost=0.00..35.50 rows=2550)\n'
+            '  ->  Index Scan using lists_public_newest_idx on '
+            'lists_questionlist'
+        )
+
+        self.assertEqual(
+            get_seq_scanned_tables(plan, 'postgresql'), {'votes_vote'}
+        )
+
+    def test_command_success(self):
+        QuestionListFactory()
+        out = io.StringIO()
+
+        call_command('check_query_plans', max_rows=0, stdout=out)
+
+        self.assertIn(
+            COMMAND_CHECK_QUERY_PLANS_SUCCESS_MESSAGE, out.getvalue()
+        )
+
+    @patch('core.management.commands.check_query_plans.get_main_querysets')
+    def test_command_fail(self, mock_get_main_querysets):
+        QuestionListFactory()
+        mock_get_main_querysets.return_value = {
+            'lists by title': QuestionList.objects.filter(title='some title')
+        }
+        out = io.StringIO()
+
+        with self.assertRaises(CommandError):
+            call_command('check_query_plans', max_rows=0, stdout=out)
+        self.assertIn('lists by title: full scan of', out.getvalue())
+
+    @patch('core.management.commands.check_query_plans.get_main_querysets')
+    def test_command_small_tables_can_be_scanned(
+        self, mock_get_main_querysets
+    ):
+        QuestionListFactory()
+        mock_get_main_querysets.return_value = {
+            'lists by title': QuestionList.objects.filter(title='some title')
+        }
+
+        call_command('check_query_plans', max_rows=1, stdout=io.StringIO())
+
+
+class ProfileReportCommandTests(TestCase):
+    def test_command_success(self):
+        out = io.StringIO()
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            with override_settings(
+                PROFILING_DIR=temp_dir, PROFILING_SAMPLE_RATE=1
+            ):
+                self.client.get(reverse('about'))
+                self.client.get(reverse('contact'))
+            call_command(
+                'profile_report',
+                directory=temp_dir,
+                view='about',
+                top=3,
+                stdout=out,
+            )
+
+        report = out.getvalue()
+        lines = report.splitlines()
+        self.assertEqual(lines[0], '== about (1 profiles) ==')
+        # Header and the top 3 functions
+        self.assertEqual(lines.index(''), 5)
+        self.assertNotIn('contact', report)
+        self.assertIn(COMMAND_PROFILE_REPORT_SUCCESS_MESSAGE % 1, report)
+
+
+@patch('django.db.connection.creation.destroy_test_db')
+@patch('django.db.connection.creation.create_test_db')
+class RunBenchmarksCommandTests(TestCase):
+    options = {'lists': 3, 'votes': 20, 'users': 2, 'iterations': 1}
+
+    def run_benchmarks(self, baseline, **options):
+        out = io.StringIO()
+        call_command(
+            'run_benchmarks',
+            baseline=baseline,
+            stdout=out,
+            **{**self.options, **options},
+        )
+        return out.getvalue()
+
+    def test_save_baseline(self, *mocks):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            baseline_path = Path(temp_dir) / 'baseline.json'
+            output = self.run_benchmarks(baseline_path, save_baseline=True)
+            baseline = json.loads(baseline_path.read_text())
+
+        self.assertIn('answer_list: 20 requests', output)
+        self.assertIn(
+            COMMAND_RUN_BENCHMARKS_BASELINE_SAVED_MESSAGE % baseline_path,
+            output,
+        )
+        self.assertEqual(baseline['dataset'], self.options)
+        self.assertEqual(baseline['views']['list_results']['requests'], 2)
+
+    def test_command_success(self, *mocks):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            baseline_path = Path(temp_dir) / 'baseline.json'
+            self.run_benchmarks(baseline_path, save_baseline=True)
+
+            output = self.run_benchmarks(baseline_path, tolerance=1000)
+
+        self.assertIn(COMMAND_RUN_BENCHMARKS_SUCCESS_MESSAGE, output)
+
+    def test_command_fail(self, *mocks):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            baseline_path = Path(temp_dir) / 'baseline.json'
+            self.run_benchmarks(baseline_path, save_baseline=True)
+            baseline = json.loads(baseline_path.read_text())
+            baseline['views']['list_results']['queries_max'] = 0
+            baseline_path.write_text(json.dumps(baseline))
+
+            with self.assertRaises(CommandError):
+                self.run_benchmarks(baseline_path, tolerance=1000)
+
+    def test_other_dataset(self, *mocks):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            baseline_path = Path(temp_dir) / 'baseline.json'
+            self.run_benchmarks(baseline_path, save_baseline=True)
+
+            output = self.run_benchmarks(baseline_path, iterations=2)
+
+        self.assertIn(COMMAND_RUN_BENCHMARKS_OTHER_DATASET_MESSAGE, output)
+
+
+class SeedBulkCommandTests(TestCase):
+    def test_command_success(self):
+        out = io.StringIO()
+        call_command('seed_bulk', users=2, lists=3, votes=20, stdout=out)
+
+        self.assertIn(
+            '2 users, 3 lists and 20 votes seeded in', out.getvalue()
+        )
+        self.assertEqual(QuestionList.objects.count(), 3)
+
+    def test_command_fail(self):
+        call_command(
+            'seed_bulk', users=1, lists=1, votes=0, stdout=io.StringIO()
+        )
+
+        with self.assertRaises(CommandError):
+            call_command('seed_bulk', users=1, lists=1, votes=0)
@@ -0,0 +1,107 @@
+import json
+
+from django.test import TestCase, override_settings
+from django.urls import reverse
+
+from lists.factories import QuestionListFactory
+
+from ..metrics import (
+    LATENCY_BUCKETS,
+    RequestMetrics,
+    RequestSample,
+    request_metrics,
+    summarize,
+)
+
+
+def get_sample(latency_ms=1, queries=1, status=200):
+    return RequestSample(
+        status=status,
+        latency_ms=latency_ms,
+        queries=queries,
+        sql_ms=0.5,
+        template_ms=0.25,
+    )
+
+
+class SummarizeTests(TestCase):
+    def test_latency_histogram(self):
+        samples = [get_sample(latency_ms) for latency_ms in (3, 5, 40, 9000)]
+
+        histogram = summarize('lists', samples)['latency_histogram']
+
+        self.assertEqual(histogram['5'], 2)
+        self.assertEqual(histogram['50'], 1)
+        self.assertEqual(histogram['+Inf'], 1)
+        self.assertEqual(len(histogram), len(LATENCY_BUCKETS) + 1)
+
+    def test_percentiles(self):
+        samples = [get_sample(latency_ms) for latency_ms in range(1, 101)]
+
+        latency = summarize('lists', samples)['latency_ms']
+
+        self.assertEqual(latency['p50'], 51)
+        self.assertEqual(latency['p99'], 99)
+        self.assertEqual(latency['max'], 100)
+
+    @override_settings(QUERY_BUDGETS={'lists': 3})
+    def test_queries_over_budget(self):
+        samples = [get_sample(queries=queries) for queries in (2, 3, 4, 8)]
+
+        queries = summarize('lists', samples)['queries']
+
+        self.assertEqual(
+            queries, {'avg': 4.25, 'max': 8, 'budget': 3, 'over_budget': 2}
+        )
+
+    def test_errors(self):
+        samples = [get_sample(status=status) for status in (200, 404, 500)]
+
+        self.assertEqual(summarize('lists', samples)['errors'], 1)
+
+
+class RequestMetricsTests(TestCase):
+    @override_settings(REQUEST_METRICS_WINDOW=2)
+    def test_only_the_latest_samples_are_kept(self):
+        metrics = RequestMetrics()
+        for latency_ms in (100, 1, 2):
+            metrics.record('lists', get_sample(latency_ms))
+
+        summary = metrics.get_summary()
+
+        self.assertEqual(summary['lists']['requests'], 2)
+        self.assertEqual(summary['lists']['latency_ms']['max'], 2)
+
+
+class RequestMetricsMiddlewareTests(TestCase):
+    def setUp(self):
+        request_metrics.reset()
+
+    def test_request_is_recorded_by_url_name(self):
+        QuestionListFactory(active=True)
+
+        with self.assertLogs('core.metrics', level='INFO') as logs:
+            self.client.get(reverse('questions_list'))
+
+        summary = request_metrics.get_summary()['questions_list']
+        record = json.loads(logs.records[0].getMessage())
+        self.assertEqual(summary['requests'], 1)
+        self.assertEqual(summary['queries']['max'], record['queries'])
+        self.assertGreater(record['queries'], 0)
+        self.assertGreater(record['template_ms'], 0)
+        self.assertEqual(record['view'], 'questions_list')
+        self.assertEqual(record['status'], 200)
+
+    def test_unresolved_request(self):
+        self.client.get('/this-does-not-exist/')
+
+        self.assertIn('unresolved', request_metrics.get_summary())
+
+    @override_settings(QUERY_BUDGETS={'questions_list': 0})
+    def test_requests_over_budget_are_logged(self):
+        with self.assertLogs('core.metrics', level='WARNING') as logs:
+            self.client.get(reverse('questions_list'))
+
+        record = json.loads(logs.records[0].getMessage())
+        self.assertEqual(record['event'], 'query_budget_exceeded')
+        self.assertEqual(record['budget'], 0)
@@ -0,0 +1,120 @@
+import datetime
+
+from django.core.exceptions import ImproperlyConfigured
+from django.test import TestCase
+from django.utils import timezone
+
+from lists.factories import QuestionListFactory
+from lists.models import QuestionList
+
+from ..pagination import NEXT, KeysetPaginator, decode_cursor, encode_cursor
+
+
+class CursorTests(TestCase):
+    def test_encode_and_decode(self):
+        cursor = encode_cursor(NEXT, [3, 'title'])
+
+        self.assertNotIn('=', cursor)
+        self.assertEqual(decode_cursor(cursor, 2), (NEXT, [3, 'title']))
+
+    def test_encode_datetimes(self):
+        moment = timezone.make_aware(datetime.datetime(2026, 10, 18, 9, 19, 1))
+
+        cursor = encode_cursor(NEXT, [moment, 3])
+
+        self.assertEqual(
+            decode_cursor(cursor, 2), (NEXT, [moment.isoformat(), 3])
+        )
+
+    def test_decode_invalid_cursor(self):
+        for cursor in ('not a cursor', encode_cursor('x', [3]), '', '%%%'):
+            with self.subTest(cursor=cursor):
+                self.assertIsNone(decode_cursor(cursor, 1))
+
+    def test_decode_cursor_of_other_ordering(self):
+        self.assertIsNone(decode_cursor(encode_cursor(NEXT, [3]), 2))
+
+
+class KeysetPaginatorTests(TestCase):
+    def setUp(self):
+        self.lists = [QuestionListFactory() for _ in range(5)]
+        self.paginator = KeysetPaginator(
+            QuestionList.objects.order_by('-id'), per_page=2
+        )
+
+    def test_first_page(self):
+        page = self.paginator.get_page()
+
+        self.assertEqual(list(page), self.lists[:-3:-1])
+        self.assertFalse(page.has_previous())
+        self.assertTrue(page.has_next())
+        self.assertIsNone(page.previous_cursor)
+
+    def test_pages_are_never_counted(self):
+        with self.assertNumQueries(1):
+            self.paginator.get_page()
+
+    def test_next_pages(self):
+        page = self.paginator.get_page()
+        page = self.paginator.get_page(page.next_cursor)
+
+        self.assertEqual(list(page), [self.lists[2], self.lists[1]])
+        self.assertTrue(page.has_previous())
+        self.assertTrue(page.has_next())
+
+        page = self.paginator.get_page(page.next_cursor)
+
+        self.assertEqual(list(page), [self.lists[0]])
+        self.assertFalse(page.has_next())
+        self.assertIsNone(page.next_cursor)
+
+    def test_previous_page(self):
+        page = self.paginator.get_page()
+        page = self.paginator.get_page(page.next_cursor)
+        page = self.paginator.get_page(page.next_cursor)
+        page = self.paginator.get_page(page.previous_cursor)
+
+        self.assertEqual(list(page), [self.lists[2], self.lists[1]])
+        self.assertTrue(page.has_previous())
+        self.assertTrue(page.has_next())
+
+        page = self.paginator.get_page(page.previous_cursor)
+
+        self.assertEqual(list(page), self.lists[:-3:-1])
+        self.assertFalse(page.has_previous())
+
+    def test_invalid_cursor_returns_first_page(self):
+        page = self.paginator.get_page('not a cursor')
+
+        self.assertEqual(list(page), self.lists[:-3:-1])
+
+    def test_cursor_past_every_row_returns_first_page(self):
+        cursor = encode_cursor(NEXT, [self.lists[0].id])
+
+        page = self.paginator.get_page(cursor)
+
+        self.assertEqual(list(page), self.lists[:-3:-1])
+
+    def test_cursor_with_invalid_values_returns_first_page(self):
+        cursor = encode_cursor(NEXT, ['not an id'])
+
+        page = self.paginator.get_page(cursor)
+
+        self.assertEqual(list(page), self.lists[:-3:-1])
+
+    def test_ordering_by_several_fields(self):
+        QuestionList.objects.update(title='same')
+        last = QuestionListFactory(title='first')
+        paginator = KeysetPaginator(
+            QuestionList.objects.order_by('title', '-id'), per_page=2
+        )
+
+        first_page = paginator.get_page()
+        second_page = paginator.get_page(first_page.next_cursor)
+
+        self.assertEqual(list(first_page), [last, self.lists[4]])
+        self.assertEqual(list(second_page), [self.lists[3], self.lists[2]])
+
+    def test_unordered_queryset(self):
+        with self.assertRaises(ImproperlyConfigured):
+            KeysetPaginator(QuestionList.objects.all(), per_page=2)
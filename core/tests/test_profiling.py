@@ -0,0 +1,108 @@
+import tempfile
+from pathlib import Path
+
+from django.contrib.auth import get_user_model
+from django.test import TestCase, override_settings
+from django.urls import reverse
+
+from core.mixins import LoginUserMixin
+
+from ..profiling import (
+    collapse_stack,
+    get_hot_functions,
+    get_profiles_by_view,
+    rotate_profiles,
+)
+
+
+class ProfilingMixin:
+    def setUp(self):
+        temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        self.directory = Path(temp_dir.name)
+        settings_override = override_settings(PROFILING_DIR=temp_dir.name)
+        settings_override.enable()
+        self.addCleanup(settings_override.disable)
+
+    def get_profiled_views(self):
+        return sorted(get_profiles_by_view(self.directory))
+
+
+class RequestProfilerMiddlewareTests(ProfilingMixin, LoginUserMixin, TestCase):
+    def test_requests_are_not_profiled_by_default(self):
+        self.client.get(reverse('about'))
+
+        self.assertEqual(self.get_profiled_views(), [])
+
+    @override_settings(PROFILING_SAMPLE_RATE=1)
+    def test_sampled_request_is_profiled(self):
+        self.client.get(reverse('about'))
+
+        self.assertEqual(self.get_profiled_views(), ['about'])
+        self.assertEqual(len(list(self.directory.glob('about.*.prof'))), 1)
+        self.assertEqual(
+            len(list(self.directory.glob('about.*.collapsed'))), 1
+        )
+
+    def test_staff_asks_for_a_profile(self):
+        self.create_login_and_verify_user()
+        get_user_model().objects.filter(id=self.user.id).update(is_staff=True)
+
+        self.client.get(reverse('about'), HTTP_X_PROFILE='1')
+
+        self.assertEqual(self.get_profiled_views(), ['about'])
+
+    def test_only_staff_can_ask_for_a_profile(self):
+        self.create_login_and_verify_user()
+
+        self.client.get(reverse('about'), HTTP_X_PROFILE='1')
+
+        self.assertEqual(self.get_profiled_views(), [])
+
+    @override_settings(PROFILING_SAMPLE_RATE=1, PROFILING_MAX_PROFILES=2)
+    def test_only_the_latest_profiles_are_kept(self):
+        for view_name in ('about', 'contact', 'cookies_policy'):
+            self.client.get(reverse(view_name))
+
+        self.assertEqual(
+            self.get_profiled_views(), ['contact', 'cookies_policy']
+        )
+        self.assertEqual(len(list(self.directory.iterdir())), 4)
+
+
+class ProfilingTests(ProfilingMixin, TestCase):
+    def test_collapse_stack(self):
+        def inner():
+            import sys
+
+            return collapse_stack(sys._getframe())
+
+        stack = inner().split(';')
+
+        self.assertTrue(stack[-1].startswith('inner (test_profiling.py:'))
+        self.assertTrue(stack[-2].startswith('test_collapse_stack ('))
+
+    def test_rotate_profiles_removes_the_collapsed_stacks_too(self):
+        for name in ('a.1.1', 'b.2.1'):
+            (self.directory / f'{name}.prof').touch()
+            (self.directory / f'{name}.collapsed').touch()
+
+        rotate_profiles(self.directory, 1)
+
+        self.assertEqual(
+            sorted(path.name for path in self.directory.iterdir()),
+            ['b.2.1.collapsed', 'b.2.1.prof'],
+        )
+
+    @override_settings(PROFILING_SAMPLE_RATE=1)
+    def test_get_hot_functions(self):
+        self.client.get(reverse('about'))
+        self.client.get(reverse('about'))
+
+        paths = get_profiles_by_view(self.directory)['about']
+        hot_functions = get_hot_functions(paths, 'cumtime', 5)
+
+        self.assertEqual(len(paths), 2)
+        self.assertEqual(len(hot_functions), 5)
+        cumulative_times = [function[3] for function in hot_functions]
+        self.assertEqual(cumulative_times, sorted(cumulative_times)[::-1])
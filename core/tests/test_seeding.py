@@ -0,0 +1,93 @@
+from django.contrib.auth import get_user_model
+from django.db.models import Sum
+from django.test import TestCase
+
+from lists.models import ListPopularity, QuestionList, UserListPlay
+from lists.search import search_lists
+from questions.models import Alternative, Question
+from votes.models import Vote
+
+from ..seeding import SeedError, get_copy_value, seed_bulk
+
+
+class SeedBulkTests(TestCase):
+    def test_seed_bulk(self):
+        seed_bulk(users=2, lists=3, votes=40)
+
+        self.assertEqual(get_user_model().objects.count(), 2)
+        self.assertEqual(QuestionList.activated_lists.count(), 3)
+        self.assertEqual(Question.objects.count(), 30)
+        self.assertEqual(Alternative.objects.count(), 60)
+        self.assertEqual(Vote.objects.count(), 40)
+        self.assertEqual(
+            get_user_model().alternatives_chosen.through.objects.count(), 40
+        )
+        # Every play is a completed list
+        self.assertEqual(UserListPlay.objects.count(), 4)
+        for play in UserListPlay.objects.all():
+            self.assertTrue(play.is_completed())
+            self.assertEqual(
+                play.user.alternatives_chosen.filter(
+                    question__child_of=play.question_list
+                ).count(),
+                10,
+            )
+        # The derived data is rebuilt
+        self.assertEqual(
+            Alternative.objects.aggregate(Sum('votes_count')),
+            {'votes_count__sum': 40},
+        )
+        self.assertTrue(ListPopularity.objects.exists())
+        self.assertTrue(search_lists('question'))
+
+    def test_seed_bulk_drafts_and_private_lists(self):
+        seed_bulk(users=1, lists=20, votes=0)
+
+        self.assertEqual(QuestionList.objects.filter(active=False).count(), 2)
+        self.assertEqual(QuestionList.objects.filter(private=True).count(), 1)
+
+    def test_seed_bulk_is_reproducible(self):
+        def get_votes():
+            return list(
+                Vote.objects.order_by('id').values_list(
+                    'user__username', 'list__title', 'alternative__title'
+                )
+            )
+
+        seed_bulk(users=2, lists=3, votes=20, seed=7)
+        first_votes = get_votes()
+        Vote.objects.all().delete()
+        QuestionList.objects.all().delete()
+        get_user_model().objects.all().delete()
+        seed_bulk(users=2, lists=3, votes=20, seed=7)
+
+        self.assertEqual(get_votes(), first_votes)
+
+    def test_seed_bulk_twice_with_the_same_seed(self):
+        seed_bulk(users=1, lists=1, votes=0, seed=3)
+
+        with self.assertRaises(SeedError):
+            seed_bulk(users=1, lists=1, votes=0, seed=3)
+        seed_bulk(users=1, lists=1, votes=0, seed=4)
+
+    def test_seed_bulk_too_many_votes(self):
+        # Every user can answer every list just once
+        with self.assertRaises(SeedError):
+            seed_bulk(users=2, lists=1, votes=30)
+
+    def test_seed_bulk_password(self):
+        seed_bulk(users=2, lists=1, votes=0, password='hola1234')
+
+        for user in get_user_model().objects.all():
+            self.assertTrue(user.check_password('hola1234'))
+
+    def test_seed_bulk_without_password(self):
+        seed_bulk(users=1, lists=1, votes=0)
+
+        self.assertFalse(get_user_model().objects.get().has_usable_password())
+
+    def test_get_copy_value(self):
+        self.assertEqual(get_copy_value(None), '\\N')
+        self.assertEqual(get_copy_value(True), 't')
+        self.assertEqual(get_copy_value(3), '3')
+        self.assertEqual(get_copy_value('a\tb\\c\nd'), 'a\\tb\\\\c\\nd')
@@ -1,13 +1,18 @@
 from http import HTTPStatus
 from unittest.mock import patch
 
+from django.contrib.auth import get_user_model
 from django.contrib.messages import get_messages
+from django.core.cache import cache
 from django.http import HttpResponse
 from django.test import TestCase
 from django.test.client import RequestFactory
 from django.urls import resolve, reverse
 
+from lists.cache import get_cached_list_results
+
 from ..constants import INVALID_HEADER_ON_EMAIL
+from ..metrics import request_metrics
 from ..views import (
     AboutView,
     ContactSuccessView,
@@ -18,6 +23,7 @@ from ..views import (
     handler403,
     handler404,
     handler500,
+    request_metrics_summary,
 )
 
 
@@ -235,3 +241,54 @@ class CookiePolicyViewTests(TestCase):
 
         self.assertTemplateUsed(response, 'cookies_policy.html')
         self.assertEqual(response.status_code, HTTPStatus.OK)
+
+
+class RequestMetricsSummaryViewTests(TestCase):
+    def setUp(self):
+        self.base_url = reverse('request_metrics')
+        request_metrics.reset()
+
+    def test_url_resolves_to_view(self):
+        found = resolve(self.base_url)
+
+        self.assertEqual(found.func, request_metrics_summary)
+
+    def test_staff_only(self):
+        response = self.client.get(self.base_url)
+
+        self.assertEqual(response.status_code, HTTPStatus.FOUND)
+
+    def test_returns_the_summary(self):
+        get_user_model().objects.create_user(
+            username='admin',
+            email='admin@email.com',
+            password='password123',
+            is_staff=True,
+        )
+        self.client.login(email='admin@email.com', password='password123')
+        self.client.get(reverse('about'))
+
+        response = self.client.get(self.base_url)
+
+        self.assertEqual(response.status_code, HTTPStatus.OK)
+        self.assertEqual(response.json()['about']['requests'], 1)
+
+    def test_returns_the_results_cache_hit_rate(self):
+        get_user_model().objects.create_user(
+            username='admin',
+            email='admin@email.com',
+            password='password123',
+            is_staff=True,
+        )
+        self.client.login(email='admin@email.com', password='password123')
+        cache.clear()
+        get_cached_list_results(1, list)
+        get_cached_list_results(1, list)
+        get_cached_list_results(1, list)
+
+        response = self.client.get(self.base_url)
+
+        self.assertEqual(
+            response.json()['results_cache'],
+            {'hits': 2, 'misses': 1, 'hit_rate': 0.667},
+        )
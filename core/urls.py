@@ -48,4 +48,9 @@ urlpatterns = [
         view=views.CookiePolicyView.as_view(),
         name='cookies_policy',
     ),
+    path(
+        route='metrics/',
+        view=views.request_metrics_summary,
+        name='request_metrics',
+    ),
 ]
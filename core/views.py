@@ -1,13 +1,18 @@
 import os
 
 from django.contrib import messages
+from django.contrib.admin.views.decorators import staff_member_required
 from django.core.mail import BadHeaderError, send_mail
+from django.http import JsonResponse
 from django.shortcuts import redirect, render
 from django.views.generic import View
 from django.views.generic.base import TemplateView
 
+from lists.cache import get_results_cache_stats
+
 from .constants import INVALID_HEADER_ON_EMAIL
 from .forms import ContactForm
+from .metrics import request_metrics
 
 FOR_TESTING = False
 
@@ -83,3 +88,19 @@ class HiddenRedPandaView(TemplateView):
 
 class CookiePolicyView(TemplateView):
     template_name = 'cookies_policy.html'
+
+
+@staff_member_required
+def request_metrics_summary(request):
+    """
+    The summary of every view, along with the hits and misses of the cache
+    of the list results
+    """
+    summary = request_metrics.get_summary()
+    results_cache = get_results_cache_stats()
+    lookups = results_cache['hits'] + results_cache['misses']
+    results_cache['hit_rate'] = (
+        round(results_cache['hits'] / lookups, 3) if lookups else None
+    )
+    summary['results_cache'] = results_cache
+    return JsonResponse(summary)
@@ -1,3 +1,4 @@
+from django.core.files.storage import default_storage
 from django.core.management.base import BaseCommand, CommandError
 
 from core.constants import (
@@ -23,6 +24,18 @@ class Command(BaseCommand):
     help = COMMAND_CREATE_DEMO_HELP_TEXT
 
     def handle(self, *args, **options):
+        images_names = [
+            IMAGE_1_NAME,
+            IMAGE_2_NAME,
+            IMAGE_3_NAME,
+            IMAGE_4_NAME,
+            IMAGE_5_NAME,
+            IMAGE_6_NAME,
+        ]
+        # Images are processed in the background, so check them beforehand
+        if not all(default_storage.exists(name) for name in images_names):
+            raise CommandError(COMMAND_CREATE_DEMO_ERROR_MESSAGE)
+
         try:
             demo_list = DemoListFactory(title='Demo List')
 
@@ -1,12 +1,8 @@
-from django.conf import settings
 from django.db import models
 from django.utils.translation import gettext_lazy as _
 
 from core.constants import DEFAULT_IMAGE_NAME
-from questions.utils import (
-    reshape_img_to_square_with_blurry_bg,
-    reshape_img_to_square_with_blurry_bg_gcp,
-)
+from questions.image_queue import enqueue_image_processing
 
 
 class DemoList(models.Model):
@@ -42,9 +38,8 @@ class DemoAlternative(models.Model):
         return self.title
 
     def save(self, *args, **kwargs):
+        # Only freshly uploaded images have to be processed, not every vote
+        image_uploaded = not self.image._committed
         super().save(*args, **kwargs)
-        if settings.STORE_IN_BUCKET:
-            reshape_img_to_square_with_blurry_bg_gcp(self.image.name)
-        else:
-            bg_img = reshape_img_to_square_with_blurry_bg(self.image.path)
-            bg_img.save(self.image.path)
+        if image_uploaded:
+            enqueue_image_processing(self.image.name)
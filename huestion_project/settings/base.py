@@ -1,4 +1,5 @@
 import os
+import tempfile
 from pathlib import Path
 
 import environ
@@ -80,12 +81,16 @@ ACCOUNT_FORMS = {
 ACCOUNT_EMAIL_VERIFICATION = 'none'
 
 MIDDLEWARE = [
+    # First, so it accounts for everything else
+    'core.middleware.RequestMetricsMiddleware',
     'django.middleware.security.SecurityMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.locale.LocaleMiddleware',
     'django.middleware.common.CommonMiddleware',
     'django.middleware.csrf.CsrfViewMiddleware',
     'django.contrib.auth.middleware.AuthenticationMiddleware',
+    # After the authentication, it lets staff ask for profiles
+    'core.middleware.RequestProfilerMiddleware',
     'django.contrib.messages.middleware.MessageMiddleware',
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
 ]
@@ -134,6 +139,36 @@ DATABASES = {
 }
 
 
+# Cache
+# https://docs.djangoproject.com/en/3.1/topics/cache/
+
+CACHES = {
+    'default': {
+        'BACKEND': os.getenv(
+            'CACHE_BACKEND', 'django.core.cache.backends.locmem.LocMemCache'
+        ),
+        'LOCATION': os.getenv('CACHE_LOCATION', 'huestions'),
+        'TIMEOUT': int(os.getenv('CACHE_TIMEOUT', 60 * 60)),
+        'OPTIONS': {
+            'MAX_ENTRIES': int(os.getenv('CACHE_MAX_ENTRIES', 1000)),
+        },
+    }
+}
+# How long the results of a list stay cached, votes invalidate them anyway
+RESULTS_CACHE_TIMEOUT = int(os.getenv('RESULTS_CACHE_TIMEOUT', 60 * 60))
+# The structure of the active lists (see lists/structure.py) is shared
+# through the cache, and kept in every process for a short while too
+LIST_STRUCTURE_CACHE_TIMEOUT = int(
+    os.getenv('LIST_STRUCTURE_CACHE_TIMEOUT', 24 * 60 * 60)
+)
+LIST_STRUCTURE_LOCAL_CACHE_SIZE = int(
+    os.getenv('LIST_STRUCTURE_LOCAL_CACHE_SIZE', 256)
+)
+LIST_STRUCTURE_LOCAL_CACHE_TIMEOUT = int(
+    os.getenv('LIST_STRUCTURE_LOCAL_CACHE_TIMEOUT', 60)
+)
+
+
 # Password validation
 # https://docs.djangoproject.com/en/3.1/ref/settings/#auth-password-validators
 
@@ -183,3 +218,70 @@ MEDIA_ROOT = BASE_DIR / 'media'
 MEDIA_URL = '/media/'
 
 MESSAGE_TAGS = {messages.ERROR: 'danger'}
+
+# Request metrics: the latest REQUEST_METRICS_WINDOW requests of every view
+# are summarized at the request_metrics endpoint (staff only). Requests
+# running more SQL queries than the budget of their view are logged
+REQUEST_METRICS_WINDOW = int(os.getenv('REQUEST_METRICS_WINDOW', 500))
+QUERY_BUDGETS = {
+    'questions_list': 6,
+    'lists': 6,
+    'search_lists': 4,
+    'autocomplete_lists': 2,
+    # Building the plays of the user (and of who shared the list) included,
+    # and the structure of the list when not cached. Counting the answers in
+    # the user stats takes two more: the majority, then a single upsert
+    'answer_list': 28,
+    'answer_list_at_once': 28,
+    'list_results': 20,
+    'user_played_lists': 5,
+    'stats': 5,
+}
+
+LOGGING = {
+    'version': 1,
+    'disable_existing_loggers': False,
+    'handlers': {
+        'console': {'class': 'logging.StreamHandler'},
+    },
+    'loggers': {
+        # A JSON line per request, and per request over its query budget
+        'core.metrics': {
+            'handlers': ['console'],
+            'level': os.getenv('REQUEST_METRICS_LOG_LEVEL', 'INFO'),
+            'propagate': False,
+        },
+    },
+}
+
+# Request profiling: a PROFILING_SAMPLE_RATE share of the requests, and the
+# ones of staff users sending an X-Profile header, are profiled. The latest
+# PROFILING_MAX_PROFILES profiles are kept in PROFILING_DIR, see the
+# profile_report command
+PROFILING_SAMPLE_RATE = float(os.getenv('PROFILING_SAMPLE_RATE', 0))
+PROFILING_HEADER = 'HTTP_X_PROFILE'
+PROFILING_DIR = os.getenv(
+    'PROFILING_DIR', os.path.join(tempfile.gettempdir(), 'huestions-profiles')
+)
+PROFILING_MAX_PROFILES = int(os.getenv('PROFILING_MAX_PROFILES', 200))
+PROFILING_SAMPLE_INTERVAL = 0.005  # seconds, of the stack sampler
+
+# How uploaded images get processed. Available queues:
+# - questions.image_queue.SyncImageQueue: within the request
+# - questions.image_queue.ThreadPoolImageQueue: in background threads
+# - questions.image_queue.DatabaseImageQueue: by the process_image_jobs
+#   command
+IMAGE_PROCESSING_QUEUE = os.getenv(
+    'IMAGE_PROCESSING_QUEUE', 'questions.image_queue.ThreadPoolImageQueue'
+)
+IMAGE_PROCESSING_WORKERS = int(os.getenv('IMAGE_PROCESSING_WORKERS', 2))
+
+# Write-behind votes: instead of writing them to the database within the
+# request, append them to a local spool file. They are moved to the database
+# in batches every VOTES_SPOOL_FLUSH_INTERVAL seconds by a thread, or by the
+# flush_vote_spool command when it is 0
+VOTES_WRITE_BEHIND = os.getenv('VOTES_WRITE_BEHIND', 'False') == 'True'
+VOTES_SPOOL_PATH = os.getenv(
+    'VOTES_SPOOL_PATH', str(BASE_DIR / 'votes_spool.sqlite3')
+)
+VOTES_SPOOL_FLUSH_INTERVAL = int(os.getenv('VOTES_SPOOL_FLUSH_INTERVAL', 5))
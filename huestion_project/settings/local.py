@@ -27,3 +27,8 @@ RECAPTCHA_PRIVATE_KEY = '6LeltbUaAAAAAGDTzDw_IYvlhqO_1wqzTT0rFNim'
 
 # Tests related
 USED_FOR_TESTING = True
+# Only the requests over their query budget
+LOGGING['loggers']['core.metrics']['level'] = 'WARNING'
+
+# Keep image processing deterministic
+IMAGE_PROCESSING_QUEUE = 'questions.image_queue.SyncImageQueue'
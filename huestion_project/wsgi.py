@@ -14,3 +14,8 @@ from django.core.wsgi import get_wsgi_application
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'huestion_project.settings')
 
 application = get_wsgi_application()
+
+# Only the web processes need the autocomplete index, and each worker its own
+from lists.autocomplete import autocomplete_index  # noqa: E402
+
+autocomplete_index.warm()
@@ -1,9 +1,21 @@
 from django.contrib import admin
 
-from .models import QuestionList
+from .models import ListPopularity, QuestionList
 
 
 @admin.register(QuestionList)
 class QuestionListAdmin(admin.ModelAdmin):
     list_display = ('title', 'slug')
     prepopulated_fields = {'slug': ('title',)}
+
+
+@admin.register(ListPopularity)
+class ListPopularityAdmin(admin.ModelAdmin):
+    list_display = (
+        'question_list',
+        'votes_1d',
+        'votes_7d',
+        'votes_10d',
+        'votes_30d',
+        'refreshed',
+    )
@@ -0,0 +1,209 @@
+import logging
+import threading
+import time
+import unicodedata
+
+from django.db import connections
+from django.db.models import Count
+from django.urls import reverse
+from django.utils.http import urlencode
+from taggit.models import Tag
+
+from core.constants import (
+    AUTOCOMPLETE_INDEX_MAX_AGE,
+    AUTOCOMPLETE_MAX_LISTS,
+    AUTOCOMPLETE_MAX_PREFIX_LENGTH,
+    AUTOCOMPLETE_MAX_SUGGESTIONS,
+    AUTOCOMPLETE_MAX_TAGS,
+)
+
+from .models import QuestionList
+
+logger = logging.getLogger(__name__)
+
+# Tags go before lists, since they lead to several lists
+TAG_KIND = 1
+LIST_KIND = 0
+
+
+def normalize(text):
+    """Lowercase ``text`` and strip its accents: 'Acción' -> 'accion'"""
+    text = unicodedata.normalize('NFKD', text.lower())
+    return ''.join(char for char in text if not unicodedata.combining(char))
+
+
+class TrieNode:
+    __slots__ = ('children', 'suggestions')
+
+    def __init__(self):
+        self.children = {}
+        self.suggestions = []
+
+
+class PrefixTrie:
+    """
+    Every node keeps its best suggestions already sorted, so a lookup just
+    walks the prefix. Memory is bounded by the depth of the trie and by the
+    amount of suggestions kept per node.
+
+    A suggestion is a ``(kind, score, label, url)`` tuple, the higher the
+    better. Its label can be found from the beginning of any of its words.
+    """
+
+    def __init__(
+        self,
+        max_depth=AUTOCOMPLETE_MAX_PREFIX_LENGTH,
+        max_suggestions=AUTOCOMPLETE_MAX_SUGGESTIONS,
+    ):
+        self.root = TrieNode()
+        self.max_depth = max_depth
+        self.max_suggestions = max_suggestions
+
+    def insert(self, suggestion):
+        normalized = normalize(suggestion[2])
+        for start, char in enumerate(normalized):
+            word_start = start == 0 or not normalized[start - 1].isalnum()
+            if char.isalnum() and word_start:
+                self._insert_from(normalized[start:], suggestion)
+
+    def _insert_from(self, key, suggestion):
+        node = self.root
+        for char in key[: self.max_depth]:
+            node = node.children.setdefault(char, TrieNode())
+            if any(
+                existing[2:] == suggestion[2:] for existing in node.suggestions
+            ):
+                continue
+            # Readers may be iterating the old list, never mutate it
+            node.suggestions = sorted(
+                node.suggestions + [suggestion], reverse=True
+            )[: self.max_suggestions]
+
+    def lookup(self, query):
+        query = normalize(query).strip().lstrip('#')
+        if not query:
+            return []
+
+        node = self.root
+        for char in query[: self.max_depth]:
+            node = node.children.get(char)
+            if node is None:
+                return []
+
+        suggestions = node.suggestions
+        if len(query) > self.max_depth:
+            suggestions = [
+                suggestion
+                for suggestion in suggestions
+                if query in normalize(suggestion[2])
+            ]
+        return suggestions
+
+
+def get_list_suggestion(question_list):
+    return (
+        LIST_KIND,
+        question_list.id,
+        question_list.title,
+        question_list.get_absolute_url(),
+    )
+
+
+def get_tag_suggestion(tag_name, lists_amount):
+    url = reverse('search_lists') + '?' + urlencode({'q': tag_name})
+    return (TAG_KIND, lists_amount, f'#{tag_name}', url)
+
+
+def build_trie():
+    """
+    Index the newest public lists and the most used tags. Both are capped
+    so the memory used by the trie is too.
+    """
+    trie = PrefixTrie()
+    question_lists = QuestionList.activated_lists.filter(
+        private=False
+    ).order_by('-id')[:AUTOCOMPLETE_MAX_LISTS]
+    for question_list in question_lists.only('id', 'title', 'slug'):
+        trie.insert(get_list_suggestion(question_list))
+
+    tags = (
+        Tag.objects.filter(
+            questionlist__active=True, questionlist__private=False
+        )
+        .annotate(lists_amount=Count('questionlist'))
+        .order_by('-lists_amount')[:AUTOCOMPLETE_MAX_TAGS]
+    )
+    for tag in tags:
+        trie.insert(get_tag_suggestion(tag.name, tag.lists_amount))
+    return trie
+
+
+class AutocompleteIndex:
+    """
+    Trie built from the database when the process starts (see ``warm``) or
+    else the first time it's needed, and built again once it's
+    ``AUTOCOMPLETE_INDEX_MAX_AGE`` seconds old. In between,
+    published lists are added to it one by one and lookups don't touch the
+    database.
+    """
+
+    def __init__(self):
+        self.trie = None
+        self.built_at = 0
+        self.lock = threading.Lock()
+
+    def is_stale(self):
+        return (
+            self.trie is None
+            or time.monotonic() - self.built_at > AUTOCOMPLETE_INDEX_MAX_AGE
+        )
+
+    def get_trie(self):
+        if self.is_stale():
+            with self.lock:
+                if self.is_stale():
+                    self.trie = build_trie()
+                    self.built_at = time.monotonic()
+        return self.trie
+
+    def warm(self):
+        """
+        Build the trie from a thread, so the first lookup of the process
+        doesn't pay for it.
+        """
+        thread = threading.Thread(
+            target=self._warm, name='autocomplete-warm', daemon=True
+        )
+        thread.start()
+        return thread
+
+    def _warm(self):
+        try:
+            self.get_trie()
+        except Exception:
+            logger.exception('Could not build the autocomplete index')
+        finally:
+            # The thread opens its own connection
+            connections.close_all()
+
+    def add_list(self, question_list):
+        # Not built yet: it will include the list anyway
+        if self.trie is None or question_list.private:
+            return
+
+        self.trie.insert(get_list_suggestion(question_list))
+        for tag in question_list.tags.all():
+            # Good enough until the trie is built again
+            self.trie.insert(get_tag_suggestion(tag.name, 1))
+
+    def suggest(self, query):
+        return [
+            {'label': label, 'url': url}
+            for _, _, label, url in self.get_trie().lookup(query)
+        ]
+
+    def reset(self):
+        self.trie = None
+
+
+autocomplete_index = AutocompleteIndex()
@@ -0,0 +1,50 @@
+from django.conf import settings
+from django.core.cache import cache
+
+RESULTS_CACHE_KEY_PREFIX = 'list_results'
+RESULTS_CACHE_HITS_KEY = 'list_results_cache:hits'
+RESULTS_CACHE_MISSES_KEY = 'list_results_cache:misses'
+
+
+def get_results_cache_key(list_id):
+    return f'{RESULTS_CACHE_KEY_PREFIX}:{list_id}'
+
+
+def _increment_counter(key):
+    try:
+        cache.incr(key)
+    except ValueError:
+        if not cache.add(key, 1, timeout=None):
+            cache.incr(key)
+
+
+def get_cached_list_results(list_id, build_results):
+    """
+    Return the cached results of the list, calling ``build_results`` and
+    storing its value when they aren't cached yet.
+    """
+    key = get_results_cache_key(list_id)
+    results = cache.get(key)
+
+    if results is None:
+        _increment_counter(RESULTS_CACHE_MISSES_KEY)
+        results = build_results()
+        cache.set(key, results, settings.RESULTS_CACHE_TIMEOUT)
+    else:
+        _increment_counter(RESULTS_CACHE_HITS_KEY)
+
+    return results
+
+
+def invalidate_list_results(list_id):
+    cache.delete(get_results_cache_key(list_id))
+
+
+def get_results_cache_stats():
+    counters = cache.get_many(
+        [RESULTS_CACHE_HITS_KEY, RESULTS_CACHE_MISSES_KEY]
+    )
+    return {
+        'hits': counters.get(RESULTS_CACHE_HITS_KEY, 0),
+        'misses': counters.get(RESULTS_CACHE_MISSES_KEY, 0),
+    }
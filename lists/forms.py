@@ -12,6 +12,7 @@ from core.constants import (
     SPECIAL_CHARS_ERROR,
 )
 
+from .autocomplete import autocomplete_index
 from .models import QuestionList
 
 
@@ -65,6 +66,7 @@ class CompleteListForm(forms.Form):
     def save(self, *args, **kwargs):
         self.question_list.activate()
         self.question_list.save()
+        autocomplete_index.add_list(self.question_list)
         return self.question_list
 
 
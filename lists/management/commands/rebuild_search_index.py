@@ -0,0 +1,20 @@
+from django.core.management.base import BaseCommand
+
+from core.constants import (
+    COMMAND_REBUILD_SEARCH_INDEX_HELP_TEXT,
+    COMMAND_REBUILD_SEARCH_INDEX_SUCCESS_MESSAGE,
+)
+
+from ...search import rebuild_search_index
+
+
+class Command(BaseCommand):
+    help = COMMAND_REBUILD_SEARCH_INDEX_HELP_TEXT
+
+    def handle(self, *args, **options):
+        indexed = rebuild_search_index()
+        self.stdout.write(
+            self.style.SUCCESS(
+                COMMAND_REBUILD_SEARCH_INDEX_SUCCESS_MESSAGE % indexed
+            )
+        )
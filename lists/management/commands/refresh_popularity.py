@@ -0,0 +1,20 @@
+from django.core.management.base import BaseCommand
+
+from core.constants import (
+    COMMAND_REFRESH_POPULARITY_HELP_TEXT,
+    COMMAND_REFRESH_POPULARITY_SUCCESS_MESSAGE,
+)
+
+from ...popularity import refresh_popularity
+
+
+class Command(BaseCommand):
+    help = COMMAND_REFRESH_POPULARITY_HELP_TEXT
+
+    def handle(self, *args, **options):
+        lists_amount = refresh_popularity()
+        self.stdout.write(
+            self.style.SUCCESS(
+                COMMAND_REFRESH_POPULARITY_SUCCESS_MESSAGE % lists_amount
+            )
+        )
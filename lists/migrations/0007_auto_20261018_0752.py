@@ -0,0 +1,41 @@
+# Generated by Django 3.1.14 on 2026-10-18 07:52
+
+from django.db import migrations
+
+# Every database has its own full-text search, see lists/search.py
+CREATE_SEARCH_INDEX = {
+    'sqlite': [
+        "CREATE VIRTUAL TABLE lists_search_index USING fts5("
+        "title, tags, questions, tokenize='unicode61 remove_diacritics 2')",
+    ],
+    'postgresql': [
+        'CREATE TABLE lists_search_index ('
+        'list_id integer PRIMARY KEY REFERENCES lists_questionlist (id) '
+        'ON DELETE CASCADE DEFERRABLE INITIALLY DEFERRED, '
+        'document tsvector NOT NULL)',
+        'CREATE INDEX lists_search_index_document '
+        'ON lists_search_index USING GIN (document)',
+    ],
+}
+
+
+def create_search_index(apps, schema_editor):
+    vendor = schema_editor.connection.vendor
+    for sql in CREATE_SEARCH_INDEX.get(vendor, []):
+        schema_editor.execute(sql)
+
+
+def drop_search_index(apps, schema_editor):
+    if schema_editor.connection.vendor in CREATE_SEARCH_INDEX:
+        schema_editor.execute('DROP TABLE IF EXISTS lists_search_index')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('lists', '0006_questionlist_private'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_search_index, drop_search_index),
+    ]
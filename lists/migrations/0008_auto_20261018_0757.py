@@ -0,0 +1,61 @@
+# Generated by Django 3.1.14 on 2026-10-18 07:57
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('lists', '0007_auto_20261018_0752'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ListPopularity',
+            fields=[
+                (
+                    'question_list',
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        primary_key=True,
+                        related_name='popularity',
+                        serialize=False,
+                        to='lists.questionlist',
+                    ),
+                ),
+                ('votes_1d', models.PositiveIntegerField(default=0)),
+                ('votes_7d', models.PositiveIntegerField(default=0)),
+                ('votes_10d', models.PositiveIntegerField(default=0)),
+                ('votes_30d', models.PositiveIntegerField(default=0)),
+                ('refreshed', models.DateTimeField(blank=True, null=True)),
+            ],
+            options={
+                'verbose_name_plural': 'list popularities',
+            },
+        ),
+        migrations.AddIndex(
+            model_name='listpopularity',
+            index=models.Index(
+                fields=['-votes_1d'], name='lists_listp_votes_1_6aebaf_idx'
+            ),
+        ),
+        migrations.AddIndex(
+            model_name='listpopularity',
+            index=models.Index(
+                fields=['-votes_7d'], name='lists_listp_votes_7_c377ea_idx'
+            ),
+        ),
+        migrations.AddIndex(
+            model_name='listpopularity',
+            index=models.Index(
+                fields=['-votes_10d'], name='lists_listp_votes_1_bca131_idx'
+            ),
+        ),
+        migrations.AddIndex(
+            model_name='listpopularity',
+            index=models.Index(
+                fields=['-votes_30d'], name='lists_listp_votes_3_ce1b42_idx'
+            ),
+        ),
+    ]
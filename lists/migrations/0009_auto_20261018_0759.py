@@ -0,0 +1,28 @@
+# Generated by Django 3.1.14 on 2026-10-18 07:59
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('lists', '0008_auto_20261018_0757'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='questionlist',
+            index=models.Index(
+                condition=models.Q(('active', True), ('private', False)),
+                fields=['-id'],
+                name='lists_public_newest_idx',
+            ),
+        ),
+        migrations.AddIndex(
+            model_name='questionlist',
+            index=models.Index(
+                fields=['owner', 'active', '-id'],
+                name='lists_quest_owner_i_4a92ed_idx',
+            ),
+        ),
+    ]
@@ -0,0 +1,70 @@
+# Generated by Django 3.1.14 on 2026-10-18 08:01
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('questions', '0012_imageblob'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ('lists', '0009_auto_20261018_0759'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='UserListPlay',
+            fields=[
+                (
+                    'id',
+                    models.AutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name='ID',
+                    ),
+                ),
+                ('created', models.DateTimeField(auto_now_add=True)),
+                ('modified', models.DateTimeField(auto_now=True)),
+                ('answered_questions', models.JSONField(default=list)),
+                (
+                    'questions_amount',
+                    models.PositiveSmallIntegerField(default=0),
+                ),
+                (
+                    'next_question',
+                    models.ForeignKey(
+                        blank=True,
+                        null=True,
+                        on_delete=django.db.models.deletion.SET_NULL,
+                        related_name='+',
+                        to='questions.question',
+                    ),
+                ),
+                (
+                    'question_list',
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name='plays',
+                        to='lists.questionlist',
+                    ),
+                ),
+                (
+                    'user',
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name='plays',
+                        to=settings.AUTH_USER_MODEL,
+                    ),
+                ),
+            ],
+        ),
+        migrations.AddConstraint(
+            model_name='userlistplay',
+            constraint=models.UniqueConstraint(
+                fields=('user', 'question_list'), name='unique_user_list_play'
+            ),
+        ),
+    ]
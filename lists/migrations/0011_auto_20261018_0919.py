@@ -0,0 +1,110 @@
+# Generated by Django 3.1.14 on 2026-10-18 09:19
+
+import itertools
+from collections import defaultdict
+
+from django.db import migrations, models
+
+BATCH_SIZE = 1000
+
+
+def fill_plays(apps, schema_editor):
+    """
+    Every user who voted on a list gets a play of it, its timestamps coming
+    from the votes.
+    """
+    Question = apps.get_model('questions', 'Question')
+    UserListPlay = apps.get_model('lists', 'UserListPlay')
+    Vote = apps.get_model('votes', 'Vote')
+
+    lists_questions = defaultdict(list)
+    for question_id, list_id in Question.objects.order_by('id').values_list(
+        'id', 'child_of_id'
+    ):
+        lists_questions[list_id].append(question_id)
+    plays = {
+        (play.user_id, play.question_list_id): play
+        for play in UserListPlay.objects.all()
+    }
+
+    votes = (
+        Vote.objects.filter(user__isnull=False, list__isnull=False)
+        .order_by('user', 'list')
+        .values_list('user', 'list', 'question', 'created')
+        .iterator()
+    )
+    new_plays = []
+    for (user_id, list_id), list_votes in itertools.groupby(
+        votes, key=lambda vote: vote[:2]
+    ):
+        list_votes = list(list_votes)
+        answered = {vote[2] for vote in list_votes}
+        questions_ids = lists_questions[list_id]
+        next_question_id = next(
+            (
+                question_id
+                for question_id in questions_ids
+                if question_id not in answered
+            ),
+            None,
+        )
+        play = plays.get((user_id, list_id))
+        if play is None:
+            play = UserListPlay(
+                user_id=user_id,
+                question_list_id=list_id,
+                answered_questions=[
+                    question_id
+                    for question_id in questions_ids
+                    if question_id in answered
+                ],
+                next_question_id=next_question_id,
+                questions_amount=len(questions_ids),
+            )
+            new_plays.append(play)
+        play.first_played = min(vote[3] for vote in list_votes)
+        play.last_played = max(vote[3] for vote in list_votes)
+        if play.next_question_id is None:
+            play.completed = play.last_played
+
+    UserListPlay.objects.bulk_create(new_plays, batch_size=BATCH_SIZE)
+    UserListPlay.objects.bulk_update(
+        [play for play in plays.values() if play.last_played],
+        ['first_played', 'last_played', 'completed'],
+        batch_size=BATCH_SIZE,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('questions', '0012_imageblob'),
+        ('votes', '0005_auto_20261018_0807'),
+        ('lists', '0010_auto_20261018_0801'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='userlistplay',
+            name='completed',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='userlistplay',
+            name='first_played',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='userlistplay',
+            name='last_played',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.AddIndex(
+            model_name='userlistplay',
+            index=models.Index(
+                fields=['user', '-last_played', '-id'],
+                name='lists_userl_user_id_ba5a6c_idx',
+            ),
+        ),
+        migrations.RunPython(fill_plays, migrations.RunPython.noop),
+    ]
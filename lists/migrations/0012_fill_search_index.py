@@ -0,0 +1,20 @@
+from django.db import migrations
+
+
+def fill_search_index(apps, schema_editor):
+    from lists.search import SEARCH_BACKENDS, rebuild_search_index
+
+    # Same databases the index is created for, see 0007
+    if schema_editor.connection.vendor in SEARCH_BACKENDS:
+        rebuild_search_index(apps)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('lists', '0011_auto_20261018_0919'),
+    ]
+
+    operations = [
+        migrations.RunPython(fill_search_index, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,19 @@
+from django.db import migrations
+
+
+def fill_list_popularity(apps, schema_editor):
+    from lists.popularity import refresh_popularity
+
+    refresh_popularity(apps=apps)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('lists', '0012_fill_search_index'),
+        ('votes', '0005_auto_20261018_0807'),
+    ]
+
+    operations = [
+        migrations.RunPython(fill_list_popularity, migrations.RunPython.noop),
+    ]
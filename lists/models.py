@@ -1,11 +1,15 @@
+from collections import Counter, defaultdict
+
+from django.apps import apps
 from django.conf import settings
 from django.db import models
 from django.db.models import Q
 from django.urls import reverse
+from django.utils import timezone
 from django.utils.text import slugify
 from taggit.managers import TaggableManager
 
-from core.models import TitleAndTimeStampedModel
+from core.models import TimeStampedModel, TitleAndTimeStampedModel
 
 from .managers import ActivatedListManager
 
@@ -25,6 +29,20 @@ class QuestionList(TitleAndTimeStampedModel):
     objects = models.Manager()
     activated_lists = ActivatedListManager()
 
+    class Meta:
+        indexes = [
+            # Public lists, newest first. Partial, since Django filters
+            # booleans as "active AND NOT private", which can't use a
+            # composite index on (active, private) in SQLite
+            models.Index(
+                fields=['-id'],
+                condition=Q(active=True, private=False),
+                name='lists_public_newest_idx',
+            ),
+            # Lists of a user, newest first
+            models.Index(fields=['owner', 'active', '-id']),
+        ]
+
     def get_absolute_url(self):
         return reverse('answer_list', args=[str(self.slug)])
 
@@ -56,3 +74,260 @@ class QuestionList(TitleAndTimeStampedModel):
 
     def get_amount_of_unanswered_questions(self, user):
         return self.get_unanswered_questions(user).count()
+
+
+class ListPopularity(models.Model):
+    """
+    Votes received by a list during the last days, for several rolling
+    windows. Incremented on every vote and rolled forward (old votes
+    dropped) by the ``refresh_popularity`` command.
+    """
+
+    # Days of every window, and its field
+    WINDOWS = {
+        1: 'votes_1d',
+        7: 'votes_7d',
+        10: 'votes_10d',
+        30: 'votes_30d',
+    }
+
+    question_list = models.OneToOneField(
+        QuestionList,
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name='popularity',
+    )
+    votes_1d = models.PositiveIntegerField(default=0)
+    votes_7d = models.PositiveIntegerField(default=0)
+    votes_10d = models.PositiveIntegerField(default=0)
+    votes_30d = models.PositiveIntegerField(default=0)
+    refreshed = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['-votes_1d']),
+            models.Index(fields=['-votes_7d']),
+            models.Index(fields=['-votes_10d']),
+            models.Index(fields=['-votes_30d']),
+        ]
+        verbose_name_plural = 'list popularities'
+
+    def __str__(self):
+        return f'{self.question_list} popularity'
+
+    @classmethod
+    def get_votes_field(cls, days):
+        return cls.WINDOWS[days]
+
+
+class UserListPlay(TimeStampedModel):
+    """
+    Progress of a user answering a list: the questions already answered and
+    the next one to answer. Built from the votes the first time it's needed
+    and updated on every vote, so the anti-join of
+    ``QuestionList.get_unanswered_questions`` isn't needed anymore.
+
+    It also keeps when the list was first and last played (answered), and
+    completed, so the lists played by a user are its plays with a
+    ``last_played``.
+    """
+
+    user = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name='plays',
+    )
+    question_list = models.ForeignKey(
+        QuestionList, on_delete=models.CASCADE, related_name='plays'
+    )
+    answered_questions = models.JSONField(default=list)
+    next_question = models.ForeignKey(
+        'questions.Question',
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name='+',
+    )
+    questions_amount = models.PositiveSmallIntegerField(default=0)
+    first_played = models.DateTimeField(null=True, blank=True)
+    last_played = models.DateTimeField(null=True, blank=True)
+    completed = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        indexes = [
+            # The lists played by a user, the last played first
+            models.Index(fields=['user', '-last_played', '-id']),
+        ]
+        constraints = [
+            models.UniqueConstraint(
+                fields=['user', 'question_list'], name='unique_user_list_play'
+            )
+        ]
+
+    def __str__(self):
+        return f'{self.user} playing {self.question_list}'
+
+    @classmethod
+    def get_for(cls, user, question_list):
+        """``question_list`` may also be the structure of the list"""
+        play = cls.objects.filter(
+            user=user, question_list_id=question_list.id
+        ).first()
+        if play is None:
+            play, _ = cls.objects.get_or_create(
+                user=user,
+                question_list_id=question_list.id,
+                defaults=cls._get_progress(user, question_list.id),
+            )
+        return play
+
+    @staticmethod
+    def _get_progress(user, question_list_id):
+        questions_ids = list(
+            apps.get_model('questions', 'Question')
+            .objects.filter(child_of_id=question_list_id)
+            .values_list('id', flat=True)
+        )
+        answered = set(
+            user.alternatives_chosen.filter(
+                question__child_of_id=question_list_id
+            ).values_list('question_id', flat=True)
+        )
+        return {
+            'answered_questions': [
+                question_id
+                for question_id in questions_ids
+                if question_id in answered
+            ],
+            'next_question_id': next(
+                (
+                    question_id
+                    for question_id in questions_ids
+                    if question_id not in answered
+                ),
+                None,
+            ),
+            'questions_amount': len(questions_ids),
+        }
+
+    @classmethod
+    def record_answer(cls, user, question):
+        cls.record_answers(user, question.child_of_id, [question.id])
+
+    @classmethod
+    def record_answers(
+        cls, user, question_list_id, questions_ids, owner_id=None, stats=None
+    ):
+        """
+        Move forward the play of ``user``, building it first if needed. Must
+        run within the transaction of the votes. Return the ids of the
+        questions that weren't answered yet. The owner of the list is looked
+        up when ``owner_id`` isn't given, see ``record_stats`` for ``stats``.
+        """
+        plays = cls.objects.select_for_update().filter(
+            user=user, question_list_id=question_list_id
+        )
+        play = plays.first()
+        built = play is None
+        if built:
+            # The votes already saved are part of the progress
+            cls.objects.get_or_create(
+                user=user,
+                question_list_id=question_list_id,
+                defaults=cls._get_progress(user, question_list_id),
+            )
+            play = plays.get()
+
+        new_ids = [
+            question_id
+            for question_id in questions_ids
+            if question_id not in play.answered_questions
+        ]
+        if not new_ids and not built:
+            return new_ids
+
+        if new_ids:
+            play.answered_questions.extend(new_ids)
+            list_questions_ids = (
+                apps.get_model('questions', 'Question')
+                .objects.filter(child_of_id=question_list_id)
+                .values_list('id', flat=True)
+            )
+            play.next_question_id = next(
+                (
+                    question_id
+                    for question_id in list_questions_ids
+                    if question_id not in play.answered_questions
+                ),
+                None,
+            )
+        started = play.first_played is None
+        was_completed = play.completed is not None
+        play.set_played(timezone.now())
+        play.save()
+        play.record_stats(
+            started=started,
+            completed=play.completed is not None and not was_completed,
+            owner_id=owner_id,
+            stats=stats,
+        )
+        return new_ids
+
+    @classmethod
+    def reset_list(cls, question_list_id):
+        """
+        Build again the progress of the plays of a list whose questions
+        changed. The plays never played are deleted instead, they are built
+        again the next time they are needed.
+        """
+        plays = cls.objects.filter(question_list_id=question_list_id)
+        plays.filter(last_played=None).delete()
+        for play in plays.select_related('user'):
+            progress = cls._get_progress(play.user, question_list_id)
+            for field, value in progress.items():
+                setattr(play, field, value)
+            if play.completed is not None and not play.is_completed():
+                play.completed = None
+                apps.get_model('users', 'UserStats').increment(
+                    play.user_id, lists_completed=-1
+                )
+            play.save()
+
+    def record_stats(self, started, completed, owner_id=None, stats=None):
+        """
+        Count a play just started, or completed, in the user stats. They are
+        added to ``stats`` (``{user id: Counter}``) when given, for the
+        caller to save them along with other stats, and saved right away
+        otherwise.
+        """
+        amounts = defaultdict(Counter) if stats is None else stats
+        if completed:
+            amounts[self.user_id]['lists_completed'] += 1
+        if started:
+            if owner_id is None:
+                owner_id = (
+                    QuestionList.objects.filter(id=self.question_list_id)
+                    .values_list('owner_id', flat=True)
+                    .first()
+                )
+            if owner_id is not None and owner_id != self.user_id:
+                amounts[owner_id]['own_lists_plays'] += 1
+        if stats is None:
+            apps.get_model('users', 'UserStats').add(amounts)
+
+    def set_played(self, when):
+        if self.first_played is None:
+            self.first_played = when
+        self.last_played = when
+        if self.completed is None and self.is_completed():
+            self.completed = when
+
+    def is_completed(self):
+        return self.next_question_id is None
+
+    def get_amount_of_unanswered_questions(self):
+        return self.questions_amount - len(self.answered_questions)
+
+    def get_percentage(self):
+        """Share of the list done once the next question gets answered"""
+        return (len(self.answered_questions) + 1) / self.questions_amount * 100
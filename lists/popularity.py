@@ -0,0 +1,92 @@
+import datetime
+
+from django.apps import apps as global_apps
+from django.db import IntegrityError, transaction
+from django.db.models import Count, F, Q
+from django.utils import timezone
+
+from .models import ListPopularity
+
+
+def record_list_vote(list_id, amount=1):
+    """New votes are within every window"""
+    increments = {
+        field: F(field) + amount for field in ListPopularity.WINDOWS.values()
+    }
+    if ListPopularity.objects.filter(question_list_id=list_id).update(
+        **increments
+    ):
+        return
+
+    try:
+        with transaction.atomic():
+            ListPopularity.objects.create(
+                question_list_id=list_id,
+                **{field: amount for field in ListPopularity.WINDOWS.values()},
+            )
+    except IntegrityError:
+        # Someone else created it meanwhile
+        ListPopularity.objects.filter(question_list_id=list_id).update(
+            **increments
+        )
+
+
+def refresh_popularity(now=None, apps=global_apps):
+    """
+    Count again the votes of every window, dropping the ones that got too
+    old. Return the amount of lists with recent votes. Migrations pass their
+    ``apps``.
+    """
+    Vote = apps.get_model('votes', 'Vote')
+    # Migration models have no WINDOWS, so only the table is taken from them
+    Popularity = apps.get_model('lists', 'ListPopularity')
+    now = now or timezone.now()
+    windows = {
+        field: Count(
+            'id', filter=Q(created__gte=now - datetime.timedelta(days=days))
+        )
+        for days, field in ListPopularity.WINDOWS.items()
+    }
+    oldest = now - datetime.timedelta(days=max(ListPopularity.WINDOWS))
+
+    counts = (
+        Vote.objects.filter(created__gte=oldest, list__isnull=False)
+        .values('list')
+        .annotate(**windows)
+        .order_by()
+    )
+    popularities = [
+        Popularity(
+            question_list_id=row['list'],
+            refreshed=now,
+            **{field: row[field] for field in windows},
+        )
+        for row in counts
+    ]
+    lists_ids = [popularity.question_list_id for popularity in popularities]
+
+    with transaction.atomic():
+        existing_ids = set(
+            Popularity.objects.filter(
+                question_list_id__in=lists_ids
+            ).values_list('question_list_id', flat=True)
+        )
+        Popularity.objects.bulk_update(
+            [p for p in popularities if p.question_list_id in existing_ids],
+            [*windows, 'refreshed'],
+            batch_size=500,
+        )
+        Popularity.objects.bulk_create(
+            [
+                p
+                for p in popularities
+                if p.question_list_id not in existing_ids
+            ],
+            batch_size=500,
+        )
+        # No votes at all during the longest window
+        Popularity.objects.filter(votes_30d__gt=0).exclude(
+            question_list_id__in=lists_ids
+        ).update(refreshed=now, **{field: 0 for field in windows})
+
+    return len(popularities)
@@ -0,0 +1,216 @@
+import re
+from collections import defaultdict, namedtuple
+
+from django.apps import apps as global_apps
+from django.core.exceptions import ImproperlyConfigured
+from django.db import connection, transaction
+from django.db.models import Prefetch
+
+from core.constants import MAX_SEARCH_RESULTS
+
+SEARCH_INDEX_TABLE = 'lists_search_index'
+
+SearchDocument = namedtuple(
+    'SearchDocument', ['list_id', 'title', 'tags', 'questions']
+)
+
+
+def get_search_documents(lists_ids=None, apps=global_apps):
+    """
+    Text to index for every searchable (active and public) list, or just
+    for the ones of ``lists_ids``. Migrations pass their ``apps``.
+    """
+    QuestionList = apps.get_model('lists', 'QuestionList')
+    Question = apps.get_model('questions', 'Question')
+    TaggedItem = apps.get_model('taggit', 'TaggedItem')
+
+    question_lists = (
+        QuestionList.objects.filter(active=True, private=False)
+        .prefetch_related(
+            Prefetch(
+                'questions',
+                queryset=Question.objects.prefetch_related('alternatives'),
+            ),
+        )
+        .order_by('id')
+    )
+    if lists_ids is not None:
+        question_lists = question_lists.filter(id__in=lists_ids)
+    question_lists = list(question_lists)
+
+    # Through the tagged items: migration models have no tags manager
+    tags = defaultdict(list)
+    for list_id, tag_name in (
+        TaggedItem.objects.filter(
+            content_type__app_label='lists',
+            content_type__model='questionlist',
+            object_id__in=[
+                question_list.id for question_list in question_lists
+            ],
+        )
+        .order_by('id')
+        .values_list('object_id', 'tag__name')
+    ):
+        tags[list_id].append(tag_name)
+
+    return [
+        SearchDocument(
+            list_id=question_list.id,
+            title=question_list.title,
+            tags=' '.join(tags[question_list.id]),
+            questions=get_questions_text(question_list),
+        )
+        for question_list in question_lists
+    ]
+
+
+def get_questions_text(question_list):
+    titles = []
+    for question in question_list.questions.all():
+        titles.append(question.title)
+        titles.extend(
+            alternative.title for alternative in question.alternatives.all()
+        )
+    return ' '.join(titles)
+
+
+def get_search_words(query):
+    # Only words reach the search engines, never their query syntax
+    return re.findall(r'\w+', query or '')
+
+
+class SQLiteSearchBackend:
+    """
+    FTS5 virtual table, ranked by bm25. Every word of the query is matched
+    as a prefix.
+    """
+
+    # bm25 weights of the title, tags and questions columns
+    WEIGHTS = (10.0, 5.0, 1.0)
+
+    def index(self, documents):
+        with connection.cursor() as cursor:
+            cursor.executemany(
+                f'INSERT INTO {SEARCH_INDEX_TABLE} '
+                '(rowid, title, tags, questions) VALUES (%s, %s, %s, %s)',
+                documents,
+            )
+
+    def remove(self, lists_ids):
+        with connection.cursor() as cursor:
+            cursor.executemany(
+                f'DELETE FROM {SEARCH_INDEX_TABLE} WHERE rowid = %s',
+                [(list_id,) for list_id in lists_ids],
+            )
+
+    def clear(self):
+        with connection.cursor() as cursor:
+            cursor.execute(f'DELETE FROM {SEARCH_INDEX_TABLE}')
+
+    def search(self, words, limit):
+        match = ' '.join(f'"{word}"*' for word in words)
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f'SELECT rowid FROM {SEARCH_INDEX_TABLE} '
+                f'WHERE {SEARCH_INDEX_TABLE} MATCH %s '
+                f'ORDER BY bm25({SEARCH_INDEX_TABLE}, %s, %s, %s), rowid DESC '
+                'LIMIT %s',
+                [match, *self.WEIGHTS, limit],
+            )
+            return [row[0] for row in cursor.fetchall()]
+
+
+class PostgresSearchBackend:
+    """
+    Weighted tsvector column with a GIN index, ranked by ts_rank. Every word
+    of the query is matched as a prefix.
+    """
+
+    # The site is multilingual, so words are not stemmed
+    CONFIG = 'simple'
+
+    def index(self, documents):
+        with connection.cursor() as cursor:
+            cursor.executemany(
+                f'INSERT INTO {SEARCH_INDEX_TABLE} (list_id, document) '
+                f"VALUES (%s, setweight(to_tsvector('{self.CONFIG}', %s), 'A')"
+                f" || setweight(to_tsvector('{self.CONFIG}', %s), 'B')"
+                f" || setweight(to_tsvector('{self.CONFIG}', %s), 'C')) "
+                'ON CONFLICT (list_id) DO UPDATE '
+                'SET document = EXCLUDED.document',
+                documents,
+            )
+
+    def remove(self, lists_ids):
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f'DELETE FROM {SEARCH_INDEX_TABLE} WHERE list_id = ANY(%s)',
+                [list(lists_ids)],
+            )
+
+    def clear(self):
+        with connection.cursor() as cursor:
+            cursor.execute(f'TRUNCATE {SEARCH_INDEX_TABLE}')
+
+    def search(self, words, limit):
+        tsquery = ' & '.join(f'{word}:*' for word in words)
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f'SELECT list_id FROM {SEARCH_INDEX_TABLE}, '
+                f"to_tsquery('{self.CONFIG}', %s) query "
+                'WHERE document @@ query '
+                'ORDER BY ts_rank(document, query) DESC, list_id DESC '
+                'LIMIT %s',
+                [tsquery, limit],
+            )
+            return [row[0] for row in cursor.fetchall()]
+
+
+SEARCH_BACKENDS = {
+    'sqlite': SQLiteSearchBackend,
+    'postgresql': PostgresSearchBackend,
+}
+
+
+def get_search_backend_class(vendor):
+    try:
+        return SEARCH_BACKENDS[vendor]
+    except KeyError:
+        raise ImproperlyConfigured(f'Lists search does not support {vendor}')
+
+
+def get_search_backend():
+    return get_search_backend_class(connection.vendor)()
+
+
+def index_list(list_id):
+    """
+    Index the list again, or drop it from the index if it isn't searchable
+    (anymore).
+    """
+    backend = get_search_backend()
+    backend.remove([list_id])
+    backend.index(get_search_documents([list_id]))
+
+
+def remove_list(list_id):
+    get_search_backend().remove([list_id])
+
+
+def rebuild_search_index(apps=global_apps):
+    backend = get_search_backend()
+    documents = get_search_documents(apps=apps)
+    with transaction.atomic():
+        backend.clear()
+        backend.index(documents)
+    return len(documents)
+
+
+def search_lists(query):
+    """
+    Ids of the searchable lists matching ``query``, best ranked first.
+    """
+    words = get_search_words(query)
+    if not words:
+        return []
+    return get_search_backend().search(words, MAX_SEARCH_RESULTS)
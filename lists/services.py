@@ -0,0 +1,96 @@
+from collections import namedtuple
+from itertools import groupby
+from operator import attrgetter
+
+from django.contrib.auth import get_user_model
+
+from questions.models import Alternative
+
+from .cache import get_cached_list_results
+
+QuestionResults = namedtuple(
+    'QuestionResults',
+    ['question', 'alternatives', 'user_alternative', 'shared_by_alternative'],
+)
+
+
+def get_list_votes_summary(question_list):
+    """
+    Return ``(question, alternatives)`` pairs for ``question_list`` where
+    every alternative has its ``votes_percentage``. The percentages come
+    from the denormalized vote counters, so this is a single query.
+    """
+    alternatives = (
+        Alternative.objects.filter(question__child_of_id=question_list.id)
+        .select_related('question')
+        .order_by('question_id', 'id')
+    )
+
+    summary = []
+    for question, group in groupby(alternatives, key=attrgetter('question')):
+        group = list(group)
+        for alternative in group:
+            alternative.votes_percentage = (
+                alternative.get_votes_count_percentage()
+            )
+        summary.append((question, group))
+    return summary
+
+
+def get_chosen_alternatives_ids(question_list, users):
+    """
+    Return a dict with the ids of the alternatives of ``question_list``
+    chosen by each one of ``users``, using a single query.
+    """
+    through = get_user_model().alternatives_chosen.through
+    chosen = {user.id: set() for user in users}
+
+    rows = through.objects.filter(
+        customuser__in=users,
+        alternative__question__child_of_id=question_list.id,
+    ).values_list('customuser_id', 'alternative_id')
+    for user_id, alternative_id in rows:
+        chosen[user_id].add(alternative_id)
+    return chosen
+
+
+def _get_chosen_alternative(alternatives, chosen_ids):
+    for alternative in alternatives:
+        if alternative.id in chosen_ids:
+            return alternative
+    return None
+
+
+def get_list_results(question_list, user, shared_by=None):
+    """
+    Build the results table of ``question_list`` (or its structure) for
+    ``user``.
+
+    The votes summary is shared by everybody, so it's cached per list. Only
+    the picks of ``user`` (and ``shared_by`` when given) are queried on each
+    call.
+    """
+    summary = get_cached_list_results(
+        question_list.id, lambda: get_list_votes_summary(question_list)
+    )
+    users = [user] if shared_by is None else [user, shared_by]
+    chosen = get_chosen_alternatives_ids(question_list, users)
+
+    results = []
+    for question, alternatives in summary:
+        shared_by_alternative = None
+        if shared_by is not None:
+            shared_by_alternative = _get_chosen_alternative(
+                alternatives, chosen[shared_by.id]
+            )
+        results.append(
+            QuestionResults(
+                question=question,
+                alternatives=alternatives,
+                user_alternative=_get_chosen_alternative(
+                    alternatives, chosen[user.id]
+                ),
+                shared_by_alternative=shared_by_alternative,
+            )
+        )
+    return results
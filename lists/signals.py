@@ -0,0 +1,78 @@
+from django.db.models.signals import m2m_changed, post_delete, post_save
+from django.dispatch import receiver
+
+from .cache import invalidate_list_results
+from .models import QuestionList, UserListPlay
+from .popularity import record_list_vote
+from .search import index_list, remove_list
+from .structure import invalidate_list_structure, invalidate_lists_structures
+
+
+@receiver(post_save, sender=QuestionList)
+def invalidate_results_on_list_save(sender, instance, **kwargs):
+    invalidate_list_results(instance.id)
+
+
+@receiver(post_save, sender='questions.Question')
+@receiver(post_delete, sender='questions.Question')
+def invalidate_results_on_question_change(sender, instance, **kwargs):
+    invalidate_list_results(instance.child_of_id)
+
+
+@receiver(post_save, sender=QuestionList)
+@receiver(post_delete, sender=QuestionList)
+def invalidate_structure_on_list_change(sender, instance, **kwargs):
+    invalidate_list_structure(instance.slug)
+
+
+@receiver(post_save, sender='questions.Question')
+@receiver(post_delete, sender='questions.Question')
+def invalidate_structure_on_question_change(sender, instance, **kwargs):
+    invalidate_lists_structures([instance.child_of_id])
+
+
+@receiver(post_save, sender='questions.Alternative')
+@receiver(post_delete, sender='questions.Alternative')
+def invalidate_structure_on_alternative_change(sender, instance, **kwargs):
+    invalidate_lists_structures([instance.question.child_of_id])
+
+
+@receiver(post_save, sender=QuestionList)
+def index_list_on_save(sender, instance, **kwargs):
+    index_list(instance.id)
+
+
+@receiver(post_delete, sender=QuestionList)
+def remove_list_on_delete(sender, instance, **kwargs):
+    remove_list(instance.id)
+
+
+@receiver(m2m_changed, sender=QuestionList.tags.through)
+def index_list_on_tags_change(sender, instance, action, **kwargs):
+    if isinstance(instance, QuestionList) and action.startswith('post_'):
+        index_list(instance.id)
+
+
+@receiver(post_save, sender='questions.Question')
+@receiver(post_delete, sender='questions.Question')
+def index_list_on_question_change(sender, instance, **kwargs):
+    index_list(instance.child_of_id)
+
+
+@receiver(post_save, sender='questions.Alternative')
+@receiver(post_delete, sender='questions.Alternative')
+def index_list_on_alternative_change(sender, instance, **kwargs):
+    index_list(instance.question.child_of_id)
+
+
+@receiver(post_save, sender='votes.Vote')
+def record_list_vote_on_vote(sender, instance, created, **kwargs):
+    if created and instance.list_id:
+        record_list_vote(instance.list_id)
+
+
+@receiver(post_save, sender='questions.Question')
+@receiver(post_delete, sender='questions.Question')
+def reset_plays_on_questions_change(sender, instance, **kwargs):
+    if kwargs.get('created', True):
+        UserListPlay.reset_list(instance.child_of_id)
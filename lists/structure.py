@@ -0,0 +1,197 @@
+import threading
+import time
+from collections import OrderedDict, namedtuple
+
+from django.conf import settings
+from django.core.cache import cache
+
+from questions.models import Alternative, Question
+
+from .models import QuestionList
+
+STRUCTURE_CACHE_KEY_PREFIX = 'list_structure'
+
+
+class AlternativeStructure(
+    namedtuple(
+        'AlternativeStructure',
+        [
+            'id',
+            'question_id',
+            'title',
+            'image_url',
+            'image_derivatives',
+            'attribution',
+        ],
+    )
+):
+    __slots__ = ()
+
+    def __str__(self):
+        return self.title
+
+
+class QuestionStructure(
+    namedtuple('QuestionStructure', ['id', 'title', 'alternatives'])
+):
+    __slots__ = ()
+
+    def __str__(self):
+        return self.title
+
+
+class ListStructure(
+    namedtuple(
+        'ListStructure', ['id', 'slug', 'title', 'private', 'questions']
+    )
+):
+    """
+    Read-only snapshot of an active list: its questions and their
+    alternatives, with their images. It has the attributes of a
+    ``QuestionList`` the answer, results and credits pages use.
+    """
+
+    __slots__ = ()
+    # Only active lists have a structure
+    active = True
+
+    def __str__(self):
+        return self.title
+
+    def get_question(self, question_id):
+        for question in self.questions:
+            if question.id == question_id:
+                return question
+        return None
+
+
+class LocalCache:
+    """
+    Least recently used values of this process, each one kept for
+    ``timeout`` seconds at most: other processes can't invalidate them.
+    """
+
+    def __init__(self, max_size, timeout):
+        self.max_size = max_size
+        self.timeout = timeout
+        self.entries = OrderedDict()
+        self.lock = threading.Lock()
+
+    def get(self, key):
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is None:
+                return None
+            value, expires = entry
+            if expires <= time.monotonic():
+                del self.entries[key]
+                return None
+            self.entries.move_to_end(key)
+            return value
+
+    def set(self, key, value):
+        with self.lock:
+            self.entries[key] = (value, time.monotonic() + self.timeout)
+            self.entries.move_to_end(key)
+            while len(self.entries) > self.max_size:
+                self.entries.popitem(last=False)
+
+    def delete(self, key):
+        with self.lock:
+            self.entries.pop(key, None)
+
+    def clear(self):
+        with self.lock:
+            self.entries.clear()
+
+
+local_structures = LocalCache(
+    settings.LIST_STRUCTURE_LOCAL_CACHE_SIZE,
+    settings.LIST_STRUCTURE_LOCAL_CACHE_TIMEOUT,
+)
+
+
+def get_structure_cache_key(slug):
+    return f'{STRUCTURE_CACHE_KEY_PREFIX}:{slug}'
+
+
+def build_list_structure(slug):
+    """
+    The structure of the list, ``None`` if it isn't active. Two queries:
+    the list along with its questions, then their alternatives.
+    """
+    rows = list(
+        QuestionList.activated_lists.filter(slug=slug)
+        .values_list('id', 'title', 'private', 'questions', 'questions__title')
+        .order_by('questions')
+    )
+    if not rows:
+        return None
+    list_id, title, private = rows[0][:3]
+
+    alternatives = {}
+    for alternative in Alternative.objects.filter(
+        question__child_of_id=list_id
+    ).order_by('id'):
+        alternatives.setdefault(alternative.question_id, []).append(
+            AlternativeStructure(
+                id=alternative.id,
+                question_id=alternative.question_id,
+                title=alternative.title,
+                image_url=alternative.image_url,
+                image_derivatives=alternative.image_derivatives,
+                attribution=alternative.attribution,
+            )
+        )
+    questions = tuple(
+        QuestionStructure(
+            id=question_id,
+            title=question_title,
+            alternatives=tuple(alternatives.get(question_id, ())),
+        )
+        # A list without questions has a single row, without question
+        for _, _, _, question_id, question_title in rows
+        if question_id is not None
+    )
+    return ListStructure(
+        id=list_id,
+        slug=slug,
+        title=title,
+        private=private,
+        questions=questions,
+    )
+
+
+def get_list_structure(slug):
+    """
+    The structure of the active list ``slug``, ``None`` if there's no such
+    list. Lists are only edited while they aren't active, so it's taken from
+    this process first, then from the cache, and only built when missing in
+    both.
+    """
+    structure = local_structures.get(slug)
+    if structure is not None:
+        return structure
+
+    key = get_structure_cache_key(slug)
+    structure = cache.get(key)
+    if structure is None:
+        structure = build_list_structure(slug)
+        if structure is None:
+            return None
+        cache.set(key, structure, settings.LIST_STRUCTURE_CACHE_TIMEOUT)
+    local_structures.set(slug, structure)
+    return structure
+
+
+def invalidate_list_structure(slug):
+    """Other processes keep theirs until it times out"""
+    cache.delete(get_structure_cache_key(slug))
+    local_structures.delete(slug)
+
+
+def invalidate_lists_structures(lists_ids):
+    for slug in QuestionList.objects.filter(id__in=lists_ids).values_list(
+        'slug', flat=True
+    ):
+        invalidate_list_structure(slug)
@@ -0,0 +1,119 @@
+from django.test import TestCase, TransactionTestCase
+
+from ..autocomplete import PrefixTrie, autocomplete_index, normalize
+from ..factories import QuestionListFactory
+from ..forms import CompleteListForm
+
+
+class PrefixTrieTests(TestCase):
+    def test_normalize(self):
+        self.assertEqual(normalize('Acción'), 'accion')
+
+    def test_lookup_from_any_word(self):
+        trie = PrefixTrie()
+        suggestion = (0, 1, 'Food lovers', '/food-lovers/')
+        trie.insert(suggestion)
+
+        self.assertEqual(trie.lookup('foo'), [suggestion])
+        self.assertEqual(trie.lookup('LOV'), [suggestion])
+        self.assertEqual(trie.lookup('ood'), [])
+        self.assertEqual(trie.lookup('  '), [])
+
+    def test_lookup_without_accents(self):
+        trie = PrefixTrie()
+        suggestion = (0, 1, 'Listo para la acción', '/listo/')
+        trie.insert(suggestion)
+
+        self.assertEqual(trie.lookup('accio'), [suggestion])
+
+    def test_best_suggestions_are_kept(self):
+        trie = PrefixTrie(max_suggestions=2)
+        for score in range(5):
+            trie.insert((0, score, f'Pizza {score}', f'/{score}/'))
+
+        self.assertEqual(
+            [suggestion[1] for suggestion in trie.lookup('pizza')], [4, 3]
+        )
+
+    def test_lookup_longer_than_the_trie(self):
+        trie = PrefixTrie(max_depth=3)
+        pizza = (0, 1, 'Pizza', '/pizza/')
+        trie.insert(pizza)
+        trie.insert((0, 2, 'Pizarra', '/pizarra/'))
+
+        self.assertEqual(trie.lookup('pizz'), [pizza])
+
+    def test_same_suggestion_is_kept_once(self):
+        trie = PrefixTrie()
+        trie.insert((0, 1, 'Pizza pizza', '/pizza/'))
+        trie.insert((0, 1, 'Pizza pizza', '/pizza/'))
+
+        self.assertEqual(len(trie.lookup('pizza')), 1)
+
+
+class AutocompleteIndexTests(TestCase):
+    def setUp(self):
+        autocomplete_index.reset()
+        self.question_list = QuestionListFactory(
+            title='Food lovers', active=True
+        )
+        self.question_list.tags.add('cooking')
+
+    def test_suggest_lists_and_tags(self):
+        suggestions = autocomplete_index.suggest('c')
+
+        self.assertEqual(suggestions[0]['label'], '#cooking')
+        self.assertEqual(
+            autocomplete_index.suggest('food'),
+            [
+                {
+                    'label': 'Food lovers',
+                    'url': self.question_list.get_absolute_url(),
+                }
+            ],
+        )
+
+    def test_inactive_and_private_lists_are_not_suggested(self):
+        QuestionListFactory(title='Food draft')
+        QuestionListFactory(title='Food secret', active=True, private=True)
+
+        self.assertEqual(
+            [s['label'] for s in autocomplete_index.suggest('food')],
+            ['Food lovers'],
+        )
+
+    def test_lookups_do_not_touch_the_database(self):
+        autocomplete_index.suggest('food')
+
+        with self.assertNumQueries(0):
+            autocomplete_index.suggest('lov')
+
+    def test_published_list_is_added(self):
+        autocomplete_index.suggest('food')
+        question_list = QuestionListFactory(title='Sushi')
+        question_list.tags.add('japan')
+
+        CompleteListForm(question_list=question_list).save()
+
+        with self.assertNumQueries(0):
+            self.assertEqual(
+                autocomplete_index.suggest('sushi')[0]['label'], 'Sushi'
+            )
+            self.assertEqual(
+                autocomplete_index.suggest('jap')[0]['label'], '#japan'
+            )
+
+
+class AutocompleteIndexWarmTests(TransactionTestCase):
+    # The trie is built from another thread, which needs committed data
+    def setUp(self):
+        autocomplete_index.reset()
+        QuestionListFactory(title='Food lovers', active=True)
+
+    def test_warm_builds_the_trie(self):
+        autocomplete_index.warm().join()
+
+        with self.assertNumQueries(0):
+            self.assertEqual(
+                autocomplete_index.suggest('food')[0]['label'], 'Food lovers'
+            )
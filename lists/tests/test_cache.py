@@ -0,0 +1,77 @@
+from django.core.cache import cache
+from django.test import TestCase
+
+from questions.factories import AlternativeFactory, QuestionFactory
+from users.factories import UserFactory
+
+from ..cache import (
+    get_cached_list_results,
+    get_results_cache_key,
+    get_results_cache_stats,
+    invalidate_list_results,
+)
+from ..factories import QuestionListFactory
+from ..services import get_list_results
+
+
+class ListResultsCacheTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.question_list = QuestionListFactory(title='cached list')
+
+    def test_miss_then_hit(self):
+        calls = []
+
+        def build_results():
+            calls.append(1)
+            return ['results']
+
+        first = get_cached_list_results(self.question_list.id, build_results)
+        second = get_cached_list_results(self.question_list.id, build_results)
+
+        self.assertEqual(first, ['results'])
+        self.assertEqual(second, ['results'])
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(get_results_cache_stats(), {'hits': 1, 'misses': 1})
+
+    def test_invalidate_list_results(self):
+        get_cached_list_results(self.question_list.id, lambda: [])
+
+        invalidate_list_results(self.question_list.id)
+
+        self.assertIsNone(
+            cache.get(get_results_cache_key(self.question_list.id))
+        )
+
+    def test_adding_a_question_invalidates_the_results(self):
+        get_cached_list_results(self.question_list.id, lambda: [])
+
+        QuestionFactory(child_of=self.question_list)
+
+        self.assertIsNone(
+            cache.get(get_results_cache_key(self.question_list.id))
+        )
+
+    def test_deleting_a_question_invalidates_the_results(self):
+        question = QuestionFactory(child_of=self.question_list)
+        get_cached_list_results(self.question_list.id, lambda: [])
+
+        question.delete()
+
+        self.assertIsNone(
+            cache.get(get_results_cache_key(self.question_list.id))
+        )
+
+    def test_cached_percentages_are_refreshed_after_invalidation(self):
+        user = UserFactory(username='javi')
+        question = QuestionFactory(child_of=self.question_list)
+        alternative = AlternativeFactory(question=question)
+        AlternativeFactory(question=question)
+        get_list_results(self.question_list, user)
+
+        alternative.vote_for_this_alternative(user)
+        invalidate_list_results(self.question_list.id)
+        results = get_list_results(self.question_list, user)
+
+        self.assertEqual(results[0].alternatives[0].votes_percentage, 100)
+        self.assertEqual(results[0].user_alternative, alternative)
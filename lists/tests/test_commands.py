@@ -0,0 +1,47 @@
+import io
+
+from django.core.management import call_command
+from django.test import TestCase
+
+from core.constants import (
+    COMMAND_REBUILD_SEARCH_INDEX_SUCCESS_MESSAGE,
+    COMMAND_REFRESH_POPULARITY_SUCCESS_MESSAGE,
+)
+from votes.factories import VoteFactory
+
+from ..factories import QuestionListFactory
+from ..models import ListPopularity
+from ..search import get_search_backend, search_lists
+
+
+class RebuildSearchIndexCommandTests(TestCase):
+    def setUp(self):
+        self.question_list = QuestionListFactory(
+            title='Food lovers', active=True
+        )
+        get_search_backend().clear()
+
+    def test_command_success(self):
+        out = io.StringIO()
+        call_command('rebuild_search_index', stdout=out)
+
+        self.assertIn(
+            COMMAND_REBUILD_SEARCH_INDEX_SUCCESS_MESSAGE % 1, out.getvalue()
+        )
+        self.assertEqual(search_lists('food'), [self.question_list.id])
+
+
+class RefreshPopularityCommandTests(TestCase):
+    def setUp(self):
+        self.question_list = QuestionListFactory()
+        VoteFactory(list=self.question_list)
+        ListPopularity.objects.update(votes_1d=0)
+
+    def test_command_success(self):
+        out = io.StringIO()
+        call_command('refresh_popularity', stdout=out)
+
+        self.assertIn(
+            COMMAND_REFRESH_POPULARITY_SUCCESS_MESSAGE % 1, out.getvalue()
+        )
+        self.assertEqual(ListPopularity.objects.get().votes_1d, 1)
@@ -6,7 +6,7 @@ from questions.factories import AlternativeFactory, QuestionFactory
 from users.factories import UserFactory
 
 from ..factories import QuestionListFactory
-from ..models import QuestionList
+from ..models import QuestionList, UserListPlay
 
 
 class QuestionListModelTests(TestModelStrMixin, TestCase):
@@ -95,3 +95,119 @@ class QuestionListModelTests(TestModelStrMixin, TestCase):
         self.assertEqual(
             question_list.get_amount_of_unanswered_questions(user), 2
         )
+
+
+class UserListPlayModelTests(TestCase):
+    def setUp(self):
+        self.user = UserFactory(username='testuser')
+        self.question_list = QuestionListFactory(title='awesome list')
+        self.alternatives = []
+        for _ in range(3):
+            question = QuestionFactory(child_of=self.question_list)
+            AlternativeFactory(question=question)
+            self.alternatives.append(AlternativeFactory(question=question))
+
+    def test_get_for_builds_the_play_from_the_votes(self):
+        self.alternatives[1].vote_for_this_alternative(self.user)
+
+        play = UserListPlay.get_for(self.user, self.question_list)
+
+        self.assertEqual(
+            play.answered_questions, [self.alternatives[1].question_id]
+        )
+        self.assertEqual(
+            play.next_question_id, self.alternatives[0].question_id
+        )
+        self.assertEqual(play.get_amount_of_unanswered_questions(), 2)
+
+    def test_get_for_reuses_the_play(self):
+        play = UserListPlay.get_for(self.user, self.question_list)
+
+        with self.assertNumQueries(1):
+            same_play = UserListPlay.get_for(self.user, self.question_list)
+
+        self.assertEqual(play, same_play)
+
+    def test_vote_moves_the_play_forward(self):
+        play = UserListPlay.get_for(self.user, self.question_list)
+
+        self.alternatives[0].vote_for_this_alternative(self.user)
+        play.refresh_from_db()
+
+        self.assertEqual(
+            play.next_question_id, self.alternatives[1].question_id
+        )
+        self.assertEqual(play.get_percentage(), 2 / 3 * 100)
+
+    def test_play_is_completed(self):
+        play = UserListPlay.get_for(self.user, self.question_list)
+
+        for alternative in self.alternatives:
+            alternative.vote_for_this_alternative(self.user)
+        play.refresh_from_db()
+
+        self.assertTrue(play.is_completed())
+        self.assertEqual(play.get_amount_of_unanswered_questions(), 0)
+
+    def test_new_question_resets_the_plays_of_the_list(self):
+        UserListPlay.get_for(self.user, self.question_list)
+
+        QuestionFactory(child_of=self.question_list)
+
+        self.assertFalse(
+            UserListPlay.objects.filter(
+                question_list=self.question_list
+            ).exists()
+        )
+        self.assertEqual(
+            UserListPlay.get_for(
+                self.user, self.question_list
+            ).questions_amount,
+            4,
+        )
+
+    def test_first_vote_builds_the_play(self):
+        self.alternatives[0].vote_for_this_alternative(self.user)
+
+        play = UserListPlay.objects.get(
+            user=self.user, question_list=self.question_list
+        )
+        self.assertEqual(
+            play.answered_questions, [self.alternatives[0].question_id]
+        )
+        self.assertIsNotNone(play.first_played)
+        self.assertEqual(play.last_played, play.first_played)
+        self.assertIsNone(play.completed)
+
+    def test_votes_record_when_the_list_was_played(self):
+        self.alternatives[0].vote_for_this_alternative(self.user)
+        first_played = UserListPlay.get_for(
+            self.user, self.question_list
+        ).first_played
+
+        for alternative in self.alternatives[1:]:
+            alternative.vote_for_this_alternative(self.user)
+        play = UserListPlay.get_for(self.user, self.question_list)
+
+        self.assertEqual(play.first_played, first_played)
+        self.assertGreater(play.last_played, first_played)
+        self.assertEqual(play.completed, play.last_played)
+
+    def test_get_for_is_not_playing(self):
+        play = UserListPlay.get_for(self.user, self.question_list)
+
+        self.assertIsNone(play.first_played)
+        self.assertIsNone(play.last_played)
+
+    def test_new_question_keeps_the_played_plays(self):
+        for alternative in self.alternatives:
+            alternative.vote_for_this_alternative(self.user)
+
+        QuestionFactory(child_of=self.question_list)
+        play = UserListPlay.get_for(self.user, self.question_list)
+
+        self.assertIsNotNone(play.last_played)
+        self.assertEqual(play.questions_amount, 4)
+        self.assertEqual(play.get_amount_of_unanswered_questions(), 1)
+        self.assertFalse(play.is_completed())
+        self.assertIsNone(play.completed)
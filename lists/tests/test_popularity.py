@@ -0,0 +1,87 @@
+import datetime
+
+from django.test import TestCase
+from django.utils import timezone
+
+from votes.factories import VoteFactory
+from votes.models import Vote
+
+from ..factories import QuestionListFactory
+from ..models import ListPopularity
+from ..popularity import record_list_vote, refresh_popularity
+
+
+class RecordListVoteTests(TestCase):
+    def setUp(self):
+        self.question_list = QuestionListFactory()
+
+    def test_first_vote_creates_the_popularity(self):
+        record_list_vote(self.question_list.id)
+
+        popularity = ListPopularity.objects.get()
+        self.assertEqual(popularity.question_list, self.question_list)
+        self.assertEqual(popularity.votes_1d, 1)
+        self.assertEqual(popularity.votes_30d, 1)
+
+    def test_votes_are_counted_on_insert(self):
+        VoteFactory(list=self.question_list)
+        VoteFactory(list=self.question_list)
+
+        popularity = ListPopularity.objects.get()
+        self.assertEqual(popularity.votes_1d, 2)
+        self.assertEqual(popularity.votes_7d, 2)
+        self.assertEqual(popularity.votes_10d, 2)
+        self.assertEqual(popularity.votes_30d, 2)
+
+    def test_updating_a_vote_is_not_counted(self):
+        vote = VoteFactory(list=self.question_list)
+
+        vote.save()
+
+        self.assertEqual(ListPopularity.objects.get().votes_1d, 1)
+
+
+class RefreshPopularityTests(TestCase):
+    def setUp(self):
+        self.question_list = QuestionListFactory()
+        self.now = timezone.now()
+
+    def vote_days_ago(self, days, question_list=None):
+        vote = VoteFactory(list=question_list or self.question_list)
+        Vote.objects.filter(id=vote.id).update(
+            created=self.now - datetime.timedelta(days=days, hours=1)
+        )
+
+    def test_old_votes_are_dropped(self):
+        self.vote_days_ago(0)
+        self.vote_days_ago(3)
+        self.vote_days_ago(8)
+        self.vote_days_ago(20)
+        self.vote_days_ago(40)
+
+        lists_amount = refresh_popularity(self.now)
+
+        popularity = ListPopularity.objects.get()
+        self.assertEqual(lists_amount, 1)
+        self.assertEqual(popularity.votes_1d, 1)
+        self.assertEqual(popularity.votes_7d, 2)
+        self.assertEqual(popularity.votes_10d, 3)
+        self.assertEqual(popularity.votes_30d, 4)
+        self.assertEqual(popularity.refreshed, self.now)
+
+    def test_lists_without_recent_votes_are_reset(self):
+        self.vote_days_ago(40)
+
+        refresh_popularity(self.now)
+
+        popularity = ListPopularity.objects.get()
+        self.assertEqual(popularity.votes_1d, 0)
+        self.assertEqual(popularity.votes_30d, 0)
+
+    def test_missing_popularities_are_created(self):
+        self.vote_days_ago(2)
+        ListPopularity.objects.all().delete()
+
+        refresh_popularity(self.now)
+
+        self.assertEqual(ListPopularity.objects.get().votes_7d, 1)
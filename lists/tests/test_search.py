@@ -0,0 +1,93 @@
+from django.test import TestCase
+
+from questions.factories import AlternativeFactory, QuestionFactory
+
+from ..factories import QuestionListFactory
+from ..search import (
+    get_search_backend,
+    get_search_words,
+    rebuild_search_index,
+    search_lists,
+)
+
+
+class SearchListsTests(TestCase):
+    def setUp(self):
+        self.question_list = QuestionListFactory(
+            title='Food lovers', active=True
+        )
+        self.question = QuestionFactory(
+            title='Which one is better?', child_of=self.question_list
+        )
+        AlternativeFactory(title='Pizza', question=self.question)
+        AlternativeFactory(title='Burger', question=self.question)
+
+    def test_get_search_words(self):
+        self.assertEqual(
+            get_search_words('"pizza" OR burger*'), ['pizza', 'OR', 'burger']
+        )
+        self.assertEqual(get_search_words(None), [])
+
+    def test_search_by_title(self):
+        self.assertEqual(search_lists('lovers'), [self.question_list.id])
+
+    def test_search_by_prefix(self):
+        self.assertEqual(search_lists('foo lov'), [self.question_list.id])
+
+    def test_search_by_tag(self):
+        self.question_list.tags.add('cooking')
+
+        self.assertEqual(search_lists('cooking'), [self.question_list.id])
+
+    def test_search_by_question_and_alternative_titles(self):
+        self.assertEqual(search_lists('better'), [self.question_list.id])
+        self.assertEqual(search_lists('pizza'), [self.question_list.id])
+
+    def test_every_word_has_to_match(self):
+        self.assertEqual(search_lists('pizza sushi'), [])
+
+    def test_empty_query(self):
+        self.assertEqual(search_lists('?!'), [])
+
+    def test_title_ranks_above_alternatives(self):
+        pizza_list = QuestionListFactory(title='Pizza toppings', active=True)
+
+        self.assertEqual(
+            search_lists('pizza'), [pizza_list.id, self.question_list.id]
+        )
+
+    def test_inactive_and_private_lists_are_not_indexed(self):
+        QuestionListFactory(title='Food draft')
+        QuestionListFactory(title='Food secret', active=True, private=True)
+
+        self.assertEqual(search_lists('food'), [self.question_list.id])
+
+    def test_list_is_indexed_when_published(self):
+        question_list = QuestionListFactory(title='Sushi')
+        self.assertEqual(search_lists('sushi'), [])
+
+        question_list.activate()
+        question_list.save()
+
+        self.assertEqual(search_lists('sushi'), [question_list.id])
+
+    def test_changes_are_indexed(self):
+        self.question.title = 'Which one is tastier?'
+        self.question.save()
+
+        self.assertEqual(search_lists('better'), [])
+        self.assertEqual(search_lists('tastier'), [self.question_list.id])
+
+    def test_deleted_list_is_removed(self):
+        self.question_list.delete()
+
+        self.assertEqual(search_lists('food'), [])
+
+    def test_rebuild_search_index(self):
+        get_search_backend().clear()
+        self.assertEqual(search_lists('food'), [])
+
+        indexed = rebuild_search_index()
+
+        self.assertEqual(indexed, 1)
+        self.assertEqual(search_lists('food'), [self.question_list.id])
@@ -0,0 +1,220 @@
+import tracemalloc
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.db.models import F
+from django.test import TestCase
+
+from questions.factories import AlternativeFactory, QuestionFactory
+from questions.models import Alternative
+from users.factories import UserFactory
+
+from ..factories import QuestionListFactory
+from ..models import QuestionList
+from ..services import (
+    get_chosen_alternatives_ids,
+    get_list_results,
+    get_list_votes_summary,
+)
+
+
+class GetListResultsTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.user = UserFactory(username='javi')
+        self.friend = UserFactory(username='jorge')
+        self.question_list = QuestionListFactory(title='results list')
+        self.question_1 = QuestionFactory(
+            title='first', child_of=self.question_list
+        )
+        self.alternative_1 = AlternativeFactory(
+            title='a1', question=self.question_1
+        )
+        self.alternative_2 = AlternativeFactory(
+            title='a2', question=self.question_1
+        )
+        self.question_2 = QuestionFactory(
+            title='second', child_of=self.question_list
+        )
+        self.alternative_3 = AlternativeFactory(
+            title='a3', question=self.question_2
+        )
+        self.alternative_4 = AlternativeFactory(
+            title='a4', question=self.question_2
+        )
+        self.alternative_1.vote_for_this_alternative(self.user)
+        self.alternative_2.vote_for_this_alternative(self.friend)
+        self.alternative_4.vote_for_this_alternative(self.user)
+        self.alternative_4.vote_for_this_alternative(self.friend)
+
+    def test_results_are_grouped_by_question(self):
+        results = get_list_results(self.question_list, self.user)
+
+        self.assertEqual(
+            [row.question for row in results],
+            [self.question_1, self.question_2],
+        )
+        self.assertEqual(
+            results[0].alternatives, [self.alternative_1, self.alternative_2]
+        )
+        self.assertEqual(
+            results[1].alternatives, [self.alternative_3, self.alternative_4]
+        )
+
+    def test_results_percentages(self):
+        results = get_list_results(self.question_list, self.user)
+
+        self.assertEqual(
+            [a.votes_percentage for a in results[0].alternatives], [50, 50]
+        )
+        self.assertEqual(
+            [a.votes_percentage for a in results[1].alternatives], [0, 100]
+        )
+
+    def test_results_user_alternatives(self):
+        results = get_list_results(
+            self.question_list, self.user, shared_by=self.friend
+        )
+
+        self.assertEqual(results[0].user_alternative, self.alternative_1)
+        self.assertEqual(results[1].user_alternative, self.alternative_4)
+        self.assertEqual(results[0].shared_by_alternative, self.alternative_2)
+        self.assertEqual(results[1].shared_by_alternative, self.alternative_4)
+
+    def test_results_without_shared_by(self):
+        results = get_list_results(self.question_list, self.user)
+
+        self.assertIsNone(results[0].shared_by_alternative)
+        self.assertIsNone(results[1].shared_by_alternative)
+
+    def test_results_are_built_with_two_queries_at_most(self):
+        for i in range(5):
+            question = QuestionFactory(
+                title=f'extra {i}', child_of=self.question_list
+            )
+            AlternativeFactory(question=question)
+            AlternativeFactory(question=question)
+
+        # votes summary + picks of both users
+        with self.assertNumQueries(2):
+            results = get_list_results(
+                self.question_list, self.user, shared_by=self.friend
+            )
+
+        self.assertEqual(len(results), 7)
+
+    def test_cached_results_only_query_the_picks(self):
+        get_list_results(self.question_list, self.user)
+
+        with self.assertNumQueries(1):
+            results = get_list_results(
+                self.question_list, self.user, shared_by=self.friend
+            )
+
+        self.assertEqual(results[0].shared_by_alternative, self.alternative_2)
+
+    def test_get_list_votes_summary_is_a_single_query(self):
+        with self.assertNumQueries(1):
+            summary = get_list_votes_summary(self.question_list)
+
+        self.assertEqual(
+            summary,
+            [
+                (self.question_1, [self.alternative_1, self.alternative_2]),
+                (self.question_2, [self.alternative_3, self.alternative_4]),
+            ],
+        )
+
+    def test_get_chosen_alternatives_ids(self):
+        with self.assertNumQueries(1):
+            chosen = get_chosen_alternatives_ids(
+                self.question_list, [self.user, self.friend]
+            )
+
+        self.assertEqual(
+            chosen,
+            {
+                self.user.id: {self.alternative_1.id, self.alternative_4.id},
+                self.friend.id: {self.alternative_2.id, self.alternative_4.id},
+            },
+        )
+
+
+class ListResultsMemoryTests(TestCase):
+    def setUp(self):
+        self.user = UserFactory()
+        self.question_list = QuestionListFactory()
+        for _ in range(3):
+            question = QuestionFactory(child_of=self.question_list)
+            AlternativeFactory(question=question)
+            AlternativeFactory(question=question)
+        self.voters = 0
+
+    def add_voters(self, amount):
+        CustomUser = get_user_model()
+        CustomUser.objects.bulk_create(
+            [
+                CustomUser(
+                    username=f'voter{self.voters + i}',
+                    email=f'voter{self.voters + i}@email.com',
+                )
+                for i in range(amount)
+            ]
+        )
+        self.voters += amount
+        through = CustomUser.alternatives_chosen.through
+        alternatives = Alternative.objects.filter(
+            question__child_of=self.question_list
+        )
+        voters_ids = CustomUser.objects.filter(
+            username__startswith='voter'
+        ).values_list('id', flat=True)
+        through.objects.bulk_create(
+            [
+                through(customuser_id=user_id, alternative_id=alternative.id)
+                for user_id in voters_ids
+                for alternative in alternatives
+            ],
+            ignore_conflicts=True,
+        )
+        alternatives.update(votes_count=F('votes_count') + amount)
+
+    def measure_peak_memory(self, function):
+        cache.clear()
+        tracemalloc.start()
+        try:
+            function()
+            return tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+
+    def get_results(self):
+        return get_list_results(self.question_list, self.user)
+
+    def prefetch_voters(self):
+        return list(
+            QuestionList.objects.filter(
+                id=self.question_list.id
+            ).prefetch_related('questions__alternatives__users')
+        )
+
+    def test_memory_does_not_grow_with_the_votes(self):
+        self.add_voters(10)
+        self.measure_peak_memory(self.get_results)  # warm up
+        few_votes_peak = self.measure_peak_memory(self.get_results)
+
+        self.add_voters(1000)
+        many_votes_peak = self.measure_peak_memory(self.get_results)
+
+        self.assertLess(many_votes_peak, few_votes_peak * 1.2)
+
+    def test_prefetching_the_voters_grows_with_the_votes(self):
+        # What the results used to do, it keeps the test above honest
+        self.add_voters(10)
+        self.measure_peak_memory(self.prefetch_voters)  # warm up
+        few_votes_peak = self.measure_peak_memory(self.prefetch_voters)
+
+        self.add_voters(1000)
+        many_votes_peak = self.measure_peak_memory(self.prefetch_voters)
+
+        self.assertGreater(many_votes_peak, few_votes_peak * 10)
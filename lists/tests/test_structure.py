@@ -0,0 +1,145 @@
+from unittest.mock import patch
+
+from django.core.cache import cache
+from django.test import TestCase
+
+from questions.factories import AlternativeFactory, QuestionFactory
+from questions.image_queue import process_and_store_image
+
+from ..factories import QuestionListFactory
+from ..structure import (
+    LocalCache,
+    get_list_structure,
+    get_structure_cache_key,
+    local_structures,
+)
+
+
+class ListStructureTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        local_structures.clear()
+        self.question_list = QuestionListFactory(
+            title='awesome list', active=True
+        )
+        self.questions = []
+        for i in range(2):
+            question = QuestionFactory(
+                title=f'question {i}', child_of=self.question_list
+            )
+            AlternativeFactory(title=f'alternative {i}a', question=question)
+            AlternativeFactory(
+                title=f'alternative {i}b',
+                question=question,
+                attribution='someone',
+            )
+            self.questions.append(question)
+
+    def test_get_list_structure(self):
+        structure = get_list_structure(self.question_list.slug)
+
+        self.assertEqual(structure.id, self.question_list.id)
+        self.assertEqual(str(structure), 'awesome list')
+        self.assertTrue(structure.active)
+        self.assertEqual(
+            [str(question) for question in structure.questions],
+            ['question 0', 'question 1'],
+        )
+        question = structure.get_question(self.questions[1].id)
+        self.assertEqual(
+            [str(alternative) for alternative in question.alternatives],
+            ['alternative 1a', 'alternative 1b'],
+        )
+        self.assertEqual(question.alternatives[1].attribution, 'someone')
+        self.assertTrue(question.alternatives[0].image_url)
+
+    def test_inactive_and_missing_lists_have_no_structure(self):
+        inactive_list = QuestionListFactory(title='draft')
+
+        self.assertIsNone(get_list_structure(inactive_list.slug))
+        self.assertIsNone(get_list_structure('missing'))
+
+    def test_list_without_questions(self):
+        empty_list = QuestionListFactory(title='empty', active=True)
+
+        self.assertEqual(get_list_structure(empty_list.slug).questions, ())
+
+    def test_structure_is_built_with_two_queries(self):
+        with self.assertNumQueries(2):
+            get_list_structure(self.question_list.slug)
+
+    def test_structure_is_kept_in_the_process(self):
+        get_list_structure(self.question_list.slug)
+
+        with self.assertNumQueries(0):
+            get_list_structure(self.question_list.slug)
+
+    def test_structure_is_shared_through_the_cache(self):
+        structure = get_list_structure(self.question_list.slug)
+        # Another process
+        local_structures.clear()
+
+        with self.assertNumQueries(0):
+            self.assertEqual(
+                get_list_structure(self.question_list.slug), structure
+            )
+
+    def test_changes_invalidate_the_structure(self):
+        changes = {
+            'list': lambda: self.question_list.save(),
+            'question': lambda: QuestionFactory(child_of=self.question_list),
+            'alternative': lambda: AlternativeFactory(
+                question=self.questions[0]
+            ),
+        }
+        for change, apply_change in changes.items():
+            with self.subTest(change=change):
+                get_list_structure(self.question_list.slug)
+
+                apply_change()
+
+                self.assertIsNone(
+                    cache.get(get_structure_cache_key(self.question_list.slug))
+                )
+                self.assertIsNone(
+                    local_structures.get(self.question_list.slug)
+                )
+
+    @patch('questions.image_queue.process_image')
+    def test_processed_images_invalidate_the_structure(self, process_image):
+        process_image.return_value = {'webp': {'200': 'image.webp'}}
+        get_list_structure(self.question_list.slug)
+        alternative = self.questions[0].alternatives.first()
+
+        process_and_store_image(alternative.image.name)
+
+        question = get_list_structure(self.question_list.slug).questions[0]
+        self.assertEqual(
+            question.alternatives[0].image_derivatives,
+            {'webp': {'200': 'image.webp'}},
+        )
+
+
+class LocalCacheTests(TestCase):
+    def test_least_recently_used_are_dropped(self):
+        local_cache = LocalCache(max_size=2, timeout=60)
+        local_cache.set('a', 1)
+        local_cache.set('b', 2)
+        local_cache.get('a')
+
+        local_cache.set('c', 3)
+
+        self.assertEqual(local_cache.get('a'), 1)
+        self.assertIsNone(local_cache.get('b'))
+        self.assertEqual(local_cache.get('c'), 3)
+
+    @patch('lists.structure.time.monotonic')
+    def test_values_time_out(self, monotonic):
+        local_cache = LocalCache(max_size=2, timeout=60)
+        monotonic.return_value = 100
+        local_cache.set('a', 1)
+
+        monotonic.return_value = 159
+        self.assertEqual(local_cache.get('a'), 1)
+        monotonic.return_value = 160
+        self.assertIsNone(local_cache.get('a'))
@@ -6,6 +6,7 @@ from django.test import TestCase, override_settings
 from django.urls import resolve, reverse
 
 from core.constants import (
+    AMOUNT_OF_LISTS_PER_PAGE,
     LIST_COMPLETION_ERROR_MESSAGE,
     MUST_COMPLETE_LIST_BEFORE_SEING_RESULTS,
     USER_THAT_SHARED_LIST_HAVENT_COMPLETED_IT,
@@ -13,16 +14,21 @@ from core.constants import (
 from core.mixins import TestViewsMixin
 from questions.factories import AlternativeFactory, QuestionFactory
 from users.factories import UserFactory
+from votes.factories import VoteFactory
 
+from ..autocomplete import autocomplete_index
+from ..cache import get_results_cache_stats
 from ..factories import QuestionListFactory
-from ..models import QuestionList
+from ..models import ListPopularity, QuestionList
 from ..views import (
     DeleteListView,
     EditListView,
     ListResultsView,
     QuestionsListView,
     SearchListsView,
+    autocomplete_lists,
     create_list,
+    refresh_popularity_job,
 )
 
 
@@ -49,6 +55,33 @@ class QuestionsListViewTests(TestCase):
         self.assertTemplateUsed(response, QuestionsListView.template_name)
         self.assertEqual(response.status_code, HTTPStatus.OK)
 
+    def test_lists_ordered_by_popularity(self):
+        list_1 = QuestionListFactory(title='list 1', active=True)
+        list_2 = QuestionListFactory(title='list 2', active=True)
+        inactive_list = QuestionListFactory(title='list 3')
+        QuestionListFactory(title='list 4', active=True)
+        VoteFactory(list=list_1)
+        VoteFactory(list=list_2)
+        VoteFactory(list=list_2)
+        VoteFactory(list=inactive_list)
+
+        # The lists and their tags, they are never counted
+        with self.assertNumQueries(2):
+            response = self.client.get(self.base_url)
+            question_lists = list(response.context['object_list'])
+
+        self.assertEqual(question_lists, [list_2, list_1])
+        self.assertEqual(question_lists[0].votes_amount, 2)
+
+    def test_next_page_keeps_the_filter(self):
+        for _ in range(AMOUNT_OF_LISTS_PER_PAGE + 1):
+            QuestionListFactory(active=True)
+
+        response = self.client.get(self.base_url, data={'filter': 'all'})
+        cursor = response.context['page_obj'].next_cursor
+
+        self.assertContains(response, f'?filter=all&cursor={cursor}')
+
 
 class ListResultsViewTests(TestViewsMixin, TestCase):
     def setUp(self):
@@ -100,6 +133,53 @@ class ListResultsViewTests(TestViewsMixin, TestCase):
         self.assertEqual(response.status_code, HTTPStatus.OK)
         self.assertTemplateUsed(response, ListResultsView.template_name)
 
+    def test_query_count_doesnt_grow_with_the_amount_of_questions(self):
+        question_list = QuestionListFactory(
+            title='many questions', active=True
+        )
+        user_that_shared_list = UserFactory(username='first-user')
+        url = reverse(
+            'list_results', args=[question_list.slug, user_that_shared_list]
+        )
+
+        def add_answered_question(title):
+            question = QuestionFactory(title=title, child_of=question_list)
+            alternative = AlternativeFactory(question=question)
+            AlternativeFactory(question=question)
+            alternative.vote_for_this_alternative(self.user)
+            alternative.vote_for_this_alternative(user_that_shared_list)
+
+        add_answered_question('first question')
+        # Build the plays (and cache the votes summary) first
+        self.client.get(url)
+        # session, user, play, sharer, sharer play and picks: the list is
+        # cached
+        with self.assertNumQueries(6):
+            self.client.get(url)
+
+        for i in range(5):
+            add_answered_question(f'question {i}')
+        self.client.get(url)
+        with self.assertNumQueries(6):
+            response = self.client.get(url)
+
+        self.assertEqual(response.status_code, HTTPStatus.OK)
+
+    def test_results_are_cached_until_someone_votes(self):
+        question_list = QuestionListFactory(title='cached list')
+        question = QuestionFactory(child_of=question_list)
+        alternative = AlternativeFactory(question=question)
+        AlternativeFactory(question=question)
+        alternative.vote_for_this_alternative(self.user)
+        url = reverse('list_results', args=[question_list.slug])
+
+        self.client.get(url)
+        stats = get_results_cache_stats()
+        response = self.client.get(url)
+
+        self.assertEqual(get_results_cache_stats()['hits'], stats['hits'] + 1)
+        self.assertEqual(response.status_code, HTTPStatus.OK)
+
     def test_redirect_with_invitation_if_user_havent_completed_the_list(self):
         user = UserFactory()
         question_list = QuestionListFactory(title="user won't do this list")
@@ -343,6 +423,40 @@ class DeleteListViewTests(TestViewsMixin, TestCase):
         )
 
 
+class AutocompleteListsViewTests(TestCase):
+    def setUp(self):
+        autocomplete_index.reset()
+        self.base_url = reverse('autocomplete_lists')
+
+    def test_url_resolves_to_view(self):
+        found = resolve(self.base_url)
+
+        self.assertEqual(found.func, autocomplete_lists)
+
+    def test_view_get(self):
+        question_list = QuestionListFactory(title='Food lovers', active=True)
+
+        response = self.client.get(self.base_url, data={'q': 'foo'})
+
+        self.assertEqual(response.status_code, HTTPStatus.OK)
+        self.assertEqual(
+            response.json(),
+            {
+                'suggestions': [
+                    {
+                        'label': 'Food lovers',
+                        'url': question_list.get_absolute_url(),
+                    }
+                ]
+            },
+        )
+
+    def test_view_get_without_query(self):
+        response = self.client.get(self.base_url)
+
+        self.assertEqual(response.json(), {'suggestions': []})
+
+
 class SearchListsViewTests(TestCase):
     def setUp(self):
         self.base_url = reverse('search_lists')
@@ -364,3 +478,73 @@ class SearchListsViewTests(TestCase):
 
         self.assertTemplateUsed(response, SearchListsView.template_name)
         self.assertEqual(response.status_code, HTTPStatus.OK)
+
+    def test_results_are_ranked(self):
+        food_list = QuestionListFactory(title='Food lovers', active=True)
+        question = QuestionFactory(title='Best food', child_of=food_list)
+        AlternativeFactory(title='Pizza', question=question)
+        pizza_list = QuestionListFactory(title='Pizza toppings', active=True)
+        QuestionListFactory(title='Sushi', active=True)
+
+        response = self.client.get(self.base_url, data={'q': 'pizza'})
+
+        self.assertEqual(
+            list(response.context['lists']), [pizza_list, food_list]
+        )
+
+    def test_empty_query_returns_every_list(self):
+        list_1 = QuestionListFactory(title='Food lovers', active=True)
+        list_2 = QuestionListFactory(title='Sushi', active=True)
+
+        response = self.client.get(self.base_url, data={'q': ''})
+
+        self.assertEqual(list(response.context['lists']), [list_2, list_1])
+
+    def test_next_page_keeps_the_query(self):
+        for i in range(AMOUNT_OF_LISTS_PER_PAGE + 1):
+            QuestionListFactory(title=f'Pizza {i}', active=True)
+
+        response = self.client.get(self.base_url, data={'q': 'pizza'})
+        first_page = list(response.context['lists'])
+        cursor = response.context['page_obj'].next_cursor
+
+        self.assertEqual(
+            response.context['lists_found'], AMOUNT_OF_LISTS_PER_PAGE + 1
+        )
+        self.assertContains(response, f'?q=pizza&cursor={cursor}')
+
+        response = self.client.get(
+            self.base_url, data={'q': 'pizza', 'cursor': cursor}
+        )
+        second_page = list(response.context['lists'])
+
+        self.assertEqual(len(second_page), 1)
+        self.assertNotIn(second_page[0], first_page)
+
+
+class RefreshPopularityJobTests(TestCase):
+    def setUp(self):
+        self.base_url = reverse('refresh_popularity_job')
+
+    def test_url_resolves_to_view(self):
+        found = resolve(self.base_url)
+
+        self.assertEqual(found.func, refresh_popularity_job)
+
+    def test_only_app_engine_cron(self):
+        response = self.client.get(self.base_url)
+
+        self.assertEqual(response.status_code, HTTPStatus.FORBIDDEN)
+
+    def test_view_get(self):
+        question_list = QuestionListFactory(active=True)
+        VoteFactory(list=question_list)
+        ListPopularity.objects.all().delete()
+
+        response = self.client.get(self.base_url, HTTP_X_APPENGINE_CRON='true')
+
+        self.assertEqual(response.json(), {'lists': 1})
+        self.assertEqual(
+            ListPopularity.objects.get(question_list=question_list).votes_1d,
+            1,
+        )
@@ -38,4 +38,14 @@ urlpatterns = [
         view=views.SearchListsView.as_view(),
         name='search_lists',
     ),
+    path(
+        route='lists/autocomplete/',
+        view=views.autocomplete_lists,
+        name='autocomplete_lists',
+    ),
+    path(
+        route='cron/refresh-popularity/',
+        view=views.refresh_popularity_job,
+        name='refresh_popularity_job',
+    ),
 ]
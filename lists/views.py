@@ -1,12 +1,12 @@
-import datetime
-
 from django.contrib import messages
 from django.contrib.auth.decorators import login_required
 from django.contrib.auth.mixins import LoginRequiredMixin
 from django.contrib.messages.views import SuccessMessageMixin
-from django.db.models import Count, Q
+from django.core.exceptions import PermissionDenied
+from django.db.models import Case, F, IntegerField, When
+from django.http import JsonResponse
 from django.shortcuts import redirect, render, reverse
-from django.utils import timezone
+from django.views.decorators.http import require_GET
 from django.views.generic import DeleteView, DetailView, ListView, UpdateView
 
 from core.constants import (
@@ -20,15 +20,21 @@ from core.constants import (
     MUST_COMPLETE_LIST_BEFORE_SEING_RESULTS,
     USER_THAT_SHARED_LIST_HAVENT_COMPLETED_IT,
 )
-from core.mixins import CustomUserPassesTestMixin
+from core.mixins import CustomUserPassesTestMixin, KeysetPaginationMixin
 from core.utils import redirect_and_check_if_list_was_shared
 from users.models import CustomUser
+from votes.services import flush_user_vote_spool
 
+from .autocomplete import autocomplete_index
 from .forms import CompleteListForm, CreateQuestionListForm, EditListForm
-from .models import QuestionList
+from .models import ListPopularity, QuestionList, UserListPlay
+from .popularity import refresh_popularity
+from .search import get_search_words, search_lists
+from .services import get_list_results
+from .structure import get_list_structure
 
 
-class QuestionsListView(ListView):
+class QuestionsListView(KeysetPaginationMixin, ListView):
     template_name = 'lists.html'
     paginate_by = AMOUNT_OF_LISTS_PER_PAGE
 
@@ -43,16 +49,15 @@ class QuestionsListView(ListView):
                 .prefetch_related('tags')
             )
         else:
-            date_to_compare_against = timezone.now() - datetime.timedelta(
-                days=AMOUNT_OF_DAYS_FOR_POPULARITY
+            votes_field = ListPopularity.get_votes_field(
+                AMOUNT_OF_DAYS_FOR_POPULARITY
             )
             return (
-                QuestionList.objects.filter(
-                    votes__created__gte=date_to_compare_against
+                QuestionList.activated_lists.filter(
+                    private=False, **{f'popularity__{votes_field}__gt': 0}
                 )
-                .filter(private=False)
-                .annotate(votes_amount=Count('id'))
-                .order_by('-votes_amount')
+                .annotate(votes_amount=F(f'popularity__{votes_field}'))
+                .order_by('-votes_amount', '-id')
                 .select_related('owner')
                 .prefetch_related('tags')
             )
@@ -60,16 +65,23 @@ class QuestionsListView(ListView):
 
 class ListResultsView(LoginRequiredMixin, DetailView):
     template_name = 'list_results.html'
+    context_object_name = 'questionlist'
 
     def get_queryset(self):
-        return QuestionList.objects.all().prefetch_related(
-            'questions__alternatives__users'
+        return QuestionList.objects.all()
+
+    def get_object(self, queryset=None):
+        # Lists not active yet have no structure
+        return get_list_structure(self.kwargs['slug']) or super().get_object(
+            queryset
         )
 
     def get(self, request, *args, **kwargs):
         self.object = self.get_object()
 
-        if self.object.get_amount_of_unanswered_questions(request.user) == 0:
+        if UserListPlay.get_for(request.user, self.object).is_completed():
+            # In write-behind mode the last answers may still be spooled
+            flush_user_vote_spool(request.user)
             self.shared_by = kwargs.get('username', '')
             context = self.get_context_data(object=self.object)
             return self.render_to_response(context)
@@ -83,38 +95,23 @@ class ListResultsView(LoginRequiredMixin, DetailView):
 
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
-        questions = self.object.questions.all()
-
-        user_alternatives = []
-        for q in questions:
-            user_alternatives.append(
-                [q, q.get_user_voted_alternative(self.request.user)]
-            )
-        context['questions_and_user_alternatives'] = user_alternatives
+        shared_by = None
 
         if self.shared_by:
             shared_by = CustomUser.objects.get(username=self.shared_by)
-            if self.object.get_amount_of_unanswered_questions(shared_by) == 0:
-                shared_alternatives = []
-                for q in questions:
-                    shared_alternatives.append(
-                        [
-                            q,
-                            q.get_user_voted_alternative(self.request.user),
-                            q.get_user_voted_alternative(shared_by),
-                        ]
-                    )
+            if UserListPlay.get_for(shared_by, self.object).is_completed():
                 context['shared_user'] = shared_by
-                context[
-                    'questions_and_user_alternatives'
-                ] = shared_alternatives
             else:
+                shared_by = None
                 messages.add_message(
                     self.request,
                     messages.INFO,
                     USER_THAT_SHARED_LIST_HAVENT_COMPLETED_IT,
                 )
 
+        context['results'] = get_list_results(
+            self.object, self.request.user, shared_by=shared_by
+        )
         return context
 
 
@@ -220,25 +217,59 @@ class DeleteListView(
         return response
 
 
-class SearchListsView(ListView):
+class SearchListsView(KeysetPaginationMixin, ListView):
     context_object_name = 'lists'
     template_name = 'search_results.html'
     paginate_by = AMOUNT_OF_LISTS_PER_PAGE
 
     def get_queryset(self):
         self.q = self.request.GET.get('q')
-        return (
-            QuestionList.activated_lists.filter(
-                Q(title__icontains=self.q) | Q(tags__name__icontains=self.q)
-            )
-            .filter(private=False)
-            .order_by('-id')
+        self.lists_found = None
+        question_lists = (
+            QuestionList.activated_lists.filter(private=False)
             .prefetch_related('tags')
             .select_related('owner')
-            .distinct()
+        )
+        if not get_search_words(self.q):
+            return question_lists.order_by('-id')
+
+        lists_ids = search_lists(self.q)
+        # Search results are bounded, so they are never counted
+        self.lists_found = len(lists_ids)
+        if not lists_ids:
+            return question_lists.none().order_by('-id')
+        ranking = Case(
+            *[
+                When(id=list_id, then=position)
+                for position, list_id in enumerate(lists_ids)
+            ],
+            output_field=IntegerField(),
+        )
+        return (
+            question_lists.filter(id__in=lists_ids)
+            .annotate(search_rank=ranking)
+            .order_by('search_rank')
         )
 
     def get_context_data(self, *, object_list=None, **kwargs):
         context = super().get_context_data(**kwargs)
         context['query'] = self.q
+        context['lists_found'] = self.lists_found
         return context
+
+
+def autocomplete_lists(request):
+    suggestions = autocomplete_index.suggest(request.GET.get('q', ''))
+    return JsonResponse({'suggestions': suggestions})
+
+
+@require_GET
+def refresh_popularity_job(request):
+    """
+    Periodic ``refresh_popularity``, run by the cron of App Engine (see
+    cron.yaml). App Engine drops its cron header from outside requests.
+    """
+    if request.headers.get('X-Appengine-Cron') != 'true':
+        raise PermissionDenied
+    lists_amount = refresh_popularity()
+    return JsonResponse({'lists': lists_amount})
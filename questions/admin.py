@@ -1,6 +1,6 @@
 from django.contrib import admin
 
-from .models import Alternative, Question
+from .models import Alternative, ImageBlob, ImageJob, Question
 
 
 @admin.register(Alternative)
@@ -11,3 +11,14 @@ class AlternativeAdmin(admin.ModelAdmin):
 @admin.register(Question)
 class QuestionAdmin(admin.ModelAdmin):
     list_display = ('title', 'child_of')
+
+
+@admin.register(ImageJob)
+class ImageJobAdmin(admin.ModelAdmin):
+    list_display = ('img_name', 'status', 'attempts', 'created')
+    list_filter = ('status',)
+
+
+@admin.register(ImageBlob)
+class ImageBlobAdmin(admin.ModelAdmin):
+    list_display = ('img_name', 'ref_count', 'created')
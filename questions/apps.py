@@ -3,3 +3,6 @@ from django.apps import AppConfig
 
 class QuestionsConfig(AppConfig):
     name = 'questions'
+
+    def ready(self):
+        from . import signals  # noqa
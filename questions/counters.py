@@ -0,0 +1,35 @@
+from django.apps import apps as global_apps
+from django.db import transaction
+from django.db.models import Count, OuterRef, Subquery, Sum
+from django.db.models.functions import Coalesce
+
+
+def rebuild_vote_counters(apps=global_apps):
+    """
+    Count again the votes of every alternative and question from the
+    alternatives chosen by the users. Migrations pass their ``apps``.
+    """
+    Alternative = apps.get_model('questions', 'Alternative')
+    Question = apps.get_model('questions', 'Question')
+    through = apps.get_model('users', 'CustomUser').alternatives_chosen.through
+
+    votes_per_alternative = (
+        through.objects.filter(alternative=OuterRef('pk'))
+        .values('alternative')
+        .annotate(amount=Count('id'))
+        .values('amount')
+    )
+    votes_per_question = (
+        Alternative.objects.filter(question=OuterRef('pk'))
+        .values('question')
+        .annotate(amount=Sum('votes_count'))
+        .values('amount')
+    )
+
+    with transaction.atomic():
+        Alternative.objects.update(
+            votes_count=Coalesce(Subquery(votes_per_alternative), 0)
+        )
+        Question.objects.update(
+            total_votes=Coalesce(Subquery(votes_per_question), 0)
+        )
@@ -16,9 +16,15 @@ from core.constants import (
     MAX_AND_SPECIAL_CHARS_ATTRIBUTIONS,
     SPECIAL_CHARS_ERROR,
 )
+from lists.structure import QuestionStructure
 
+from .image_store import save_alternative_with_image
 from .models import Alternative, Question
-from .validators import file_extension_validator, file_size_validator
+from .validators import (
+    file_extension_validator,
+    file_size_validator,
+    image_pixels_validator,
+)
 
 
 class AnswerQuestionForm(forms.Form):
@@ -26,19 +32,33 @@ class AnswerQuestionForm(forms.Form):
         label=_('Alternatives'), widget=forms.RadioSelect
     )
 
-    def __init__(self, question_id, *args, **kwargs):
+    def __init__(self, question, *args, alternatives=None, **kwargs):
+        """
+        ``question`` may be a ``Question``, its id or its structure (see
+        ``lists/structure.py``), which already has the alternatives. Pass
+        its ``alternatives`` when they are already loaded.
+        """
         super().__init__(*args, **kwargs)
 
-        question = Question.objects.get(id=question_id)
-        alternative_1, alternative_2 = question.alternatives.all()
+        if alternatives is None:
+            if isinstance(question, QuestionStructure):
+                alternatives = question.alternatives
+            else:
+                if not isinstance(question, Question):
+                    question = Question.objects.get(id=question)
+                alternatives = question.alternatives.all()
+        alternative_1, alternative_2 = alternatives
 
         self.fields['alternatives'].choices = [
             (alternative_1.id, alternative_1.title),
             (alternative_2.id, alternative_2.title),
         ]
 
-        self.img_1_url = alternative_1.image.url
-        self.img_2_url = alternative_2.image.url
+        self.alternative_1 = alternative_1
+        self.alternative_2 = alternative_2
+
+        self.img_1_url = alternative_1.image_url
+        self.img_2_url = alternative_2.image_url
 
         self.attribution_1 = alternative_1.attribution
         self.attribution_2 = alternative_2.attribution
@@ -80,7 +100,11 @@ class AddAlternativesForm(forms.Form):
     image_1 = forms.ImageField(
         label=_('(Optional) Image 1'),
         required=False,
-        validators=[file_size_validator, file_extension_validator],
+        validators=[
+            file_size_validator,
+            file_extension_validator,
+            image_pixels_validator,
+        ],
         help_text=FILE_TOO_LARGE_HELPER,
     )
     alternative_1 = forms.CharField(
@@ -110,7 +134,11 @@ class AddAlternativesForm(forms.Form):
     image_2 = forms.ImageField(
         label=_('(Optional) Image 2'),
         required=False,
-        validators=[file_size_validator, file_extension_validator],
+        validators=[
+            file_size_validator,
+            file_extension_validator,
+            image_pixels_validator,
+        ],
         help_text=FILE_TOO_LARGE_HELPER,
     )
     alternative_2 = forms.CharField(
@@ -156,11 +184,13 @@ class AddAlternativesForm(forms.Form):
             )
         else:
             if cleaned_data.get('image_1'):
-                alternative_1 = Alternative.objects.create(
-                    title=cleaned_data.get('alternative_1'),
-                    image=cleaned_data.get('image_1'),
-                    question=question,
-                    attribution=cleaned_data.get('attribution_1'),
+                alternative_1 = save_alternative_with_image(
+                    Alternative(
+                        title=cleaned_data.get('alternative_1'),
+                        question=question,
+                        attribution=cleaned_data.get('attribution_1'),
+                    ),
+                    cleaned_data.get('image_1'),
                 )
             else:
                 alternative_1 = Alternative.objects.create(
@@ -170,11 +200,13 @@ class AddAlternativesForm(forms.Form):
                 )
 
             if cleaned_data.get('image_2'):
-                alternative_2 = Alternative.objects.create(
-                    title=cleaned_data.get('alternative_2'),
-                    image=cleaned_data.get('image_2'),
-                    question=question,
-                    attribution=cleaned_data.get('attribution_2'),
+                alternative_2 = save_alternative_with_image(
+                    Alternative(
+                        title=cleaned_data.get('alternative_2'),
+                        question=question,
+                        attribution=cleaned_data.get('attribution_2'),
+                    ),
+                    cleaned_data.get('image_2'),
                 )
             else:
                 alternative_2 = Alternative.objects.create(
@@ -0,0 +1,93 @@
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+
+from django.conf import settings
+from django.db import connections, transaction
+from django.utils.module_loading import import_string
+
+from .utils import process_image
+
+logger = logging.getLogger(__name__)
+
+
+def process_and_store_image(img_name):
+    """
+    Process the image and store its derivatives in every alternative using
+    it.
+    """
+    from lists.structure import invalidate_lists_structures
+
+    from .models import Alternative
+
+    derivatives = process_image(img_name)
+    alternatives = Alternative.objects.filter(image=img_name)
+    alternatives.update(image_derivatives=derivatives)
+    # No post_save signal is sent for them
+    invalidate_lists_structures(alternatives.values('question__child_of'))
+
+
+def process_image_and_log_errors(img_name):
+    try:
+        process_and_store_image(img_name)
+    except Exception:
+        logger.exception('Could not process the image %s', img_name)
+    finally:
+        # Every thread opens its own connection
+        connections.close_all()
+
+
+class SyncImageQueue:
+    """
+    Process the image right away, within the request.
+    """
+
+    def enqueue(self, img_name):
+        process_and_store_image(img_name)
+
+
+class ThreadPoolImageQueue:
+    """
+    Process the image in a pool of threads living in the same process, so
+    the request doesn't wait for Pillow nor for the bucket round-trips.
+    Until it's done the original upload is served. The job is only submitted
+    once the transaction commits, or the thread wouldn't see the alternative.
+    """
+
+    def __init__(self):
+        self.executor = ThreadPoolExecutor(
+            max_workers=settings.IMAGE_PROCESSING_WORKERS,
+            thread_name_prefix='image-processing',
+        )
+
+    def enqueue(self, img_name):
+        transaction.on_commit(
+            lambda: self.executor.submit(
+                process_image_and_log_errors, img_name
+            )
+        )
+
+
+class DatabaseImageQueue:
+    """
+    Store a job in the database, the ``process_image_jobs`` command takes
+    care of it. Jobs survive restarts and don't need any broker.
+    """
+
+    def enqueue(self, img_name):
+        from .models import ImageJob
+
+        ImageJob.objects.create(img_name=img_name)
+
+
+@lru_cache(maxsize=None)
+def _get_image_queue(queue_path):
+    return import_string(queue_path)()
+
+
+def get_image_queue():
+    return _get_image_queue(settings.IMAGE_PROCESSING_QUEUE)
+
+
+def enqueue_image_processing(img_name):
+    get_image_queue().enqueue(img_name)
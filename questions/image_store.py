@@ -0,0 +1,76 @@
+import hashlib
+
+from django.core.files.storage import default_storage as storage
+from django.db import transaction
+from django.db.models import F
+
+
+def get_sha256(img_file):
+    sha256 = hashlib.sha256()
+    for chunk in img_file.chunks():
+        sha256.update(chunk)
+    img_file.seek(0)
+    return sha256.hexdigest()
+
+
+def save_alternative_with_image(alternative, img_file):
+    """
+    Save ``alternative`` with the uploaded ``img_file``. If the very same
+    image is already stored, the alternative just points to it (and to its
+    derivatives): nothing is processed nor written to the storage.
+    """
+    from .models import Alternative, ImageBlob
+
+    sha256 = get_sha256(img_file)
+
+    # A blob without references may be being deleted, so it can't be claimed
+    claimed = ImageBlob.objects.filter(sha256=sha256, ref_count__gt=0).update(
+        ref_count=F('ref_count') + 1
+    )
+    if claimed:
+        img_name = ImageBlob.objects.values_list('img_name', flat=True).get(
+            sha256=sha256
+        )
+        alternative.image = img_name
+        alternative.image_derivatives = (
+            Alternative.objects.filter(image=img_name)
+            .values_list('image_derivatives', flat=True)
+            .first()
+        ) or {}
+        alternative.save()
+        return alternative
+
+    alternative.image = img_file
+    alternative.save()
+    # If the same image got stored meanwhile, this copy just isn't shared
+    ImageBlob.objects.get_or_create(
+        sha256=sha256,
+        defaults={'img_name': alternative.image.name, 'ref_count': 1},
+    )
+    return alternative
+
+
+def delete_image_files(img_name, derivatives):
+    storage.delete(img_name)
+    for names in derivatives.values():
+        for name in names.values():
+            storage.delete(name)
+
+
+def release_image(img_name, derivatives):
+    """
+    Drop a reference to the stored image ``img_name``. The last one deletes
+    the image and its ``derivatives`` from the storage.
+    """
+    from .models import ImageBlob
+
+    ImageBlob.objects.filter(img_name=img_name, ref_count__gt=0).update(
+        ref_count=F('ref_count') - 1
+    )
+    deleted, _ = ImageBlob.objects.filter(
+        img_name=img_name, ref_count=0
+    ).delete()
+    if deleted:
+        transaction.on_commit(
+            lambda: delete_image_files(img_name, derivatives)
+        )
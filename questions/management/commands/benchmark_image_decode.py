@@ -0,0 +1,126 @@
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from PIL import Image
+
+from core.constants import (
+    COMMAND_BENCHMARK_IMAGE_DECODE_HELP_TEXT,
+    COMMAND_BENCHMARK_IMAGE_DECODE_SUCCESS_MESSAGE,
+)
+
+# Every measure runs in a fresh interpreter, since the peak RSS of a process
+# never goes down. VmHWM is read instead of getrusage's ru_maxrss, because on
+# Linux the latter carries the peak of the parent process over fork/exec.
+# Without /proc (macOS) ru_maxrss is all there is
+MEASURE_SCRIPT = '''
+import sys
+
+import django
+
+django.setup()
+
+from PIL import Image, ImageFilter
+
+from core.benchmarks import get_max_rss_kb, read_memory_status_kb
+from questions.utils import reshape_img_to_square_with_blurry_bg
+
+
+def peak_rss():
+    peak = read_memory_status_kb('VmHWM')
+    return get_max_rss_kb() if peak is None else peak
+
+
+def full_decode(path):
+    # What reshape_img_to_square_with_blurry_bg used to do
+    img = Image.open(path)
+    bg_img = img.resize((200, 200)).filter(ImageFilter.GaussianBlur(5))
+    img.thumbnail((200, 200))
+    bg_img.paste(img)
+    return bg_img
+
+
+variant, path = sys.argv[1:]
+before = peak_rss()
+if variant == 'full_decode':
+    full_decode(path)
+else:
+    reshape_img_to_square_with_blurry_bg(path)
+after = peak_rss()
+print(after - before)
+'''
+VARIANTS = ('full_decode', 'bounded')
+
+
+class Command(BaseCommand):
+    help = COMMAND_BENCHMARK_IMAGE_DECODE_HELP_TEXT
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--width',
+            type=int,
+            default=6000,
+            help='Width of the generated JPEG',
+        )
+        parser.add_argument(
+            '--height',
+            type=int,
+            default=4000,
+            help='Height of the generated JPEG',
+        )
+        parser.add_argument(
+            '--runs',
+            type=int,
+            default=3,
+            help='Amount of measures per variant (the median is reported)',
+        )
+
+    def handle(self, *args, **options):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'benchmark.jpg')
+            self.create_compressed_jpeg(
+                path, options['width'], options['height']
+            )
+            self.stdout.write(
+                f'{options["width"]}x{options["height"]} JPEG of '
+                f'{os.path.getsize(path) / 1000:.0f} kB'
+            )
+
+            peaks = {}
+            for variant in VARIANTS:
+                peaks[variant] = statistics.median(
+                    self.measure_peak_rss(variant, path)
+                    for _ in range(options['runs'])
+                )
+                self.stdout.write(
+                    f'{variant}: +{peaks[variant] / 1024:.1f} MB peak RSS'
+                )
+
+        ratio = peaks['full_decode'] / max(peaks['bounded'], 1)
+        self.stdout.write(
+            self.style.SUCCESS(
+                COMMAND_BENCHMARK_IMAGE_DECODE_SUCCESS_MESSAGE % ratio
+            )
+        )
+
+    def create_compressed_jpeg(self, path, width, height):
+        # A smooth gradient: tiny on disk, huge once decoded
+        gradient = Image.linear_gradient('L').resize((width, height))
+        mirrored = gradient.transpose(Image.FLIP_LEFT_RIGHT)
+        img = Image.merge('RGB', (gradient, mirrored, gradient))
+        img.save(path, format='JPEG', quality=85)
+
+    def measure_peak_rss(self, variant, path):
+        """Peak RSS increase, in kB, of processing ``path`` with ``variant``"""
+        result = subprocess.run(
+            [sys.executable, '-c', MEASURE_SCRIPT, variant, path],
+            cwd=settings.BASE_DIR,
+            capture_output=True,
+            check=True,
+            text=True,
+        )
+        return int(result.stdout.split()[-1])
@@ -0,0 +1,65 @@
+from django.core.management.base import BaseCommand
+from django.db.models import F
+
+from core.constants import (
+    COMMAND_PROCESS_IMAGE_JOBS_HELP_TEXT,
+    COMMAND_PROCESS_IMAGE_JOBS_SUCCESS_MESSAGE,
+    IMAGE_JOB_MAX_ATTEMPTS,
+)
+
+from ...image_queue import process_and_store_image
+from ...models import ImageJob
+
+
+class Command(BaseCommand):
+    help = COMMAND_PROCESS_IMAGE_JOBS_HELP_TEXT
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--limit',
+            type=int,
+            default=100,
+            help='Maximum amount of jobs to process',
+        )
+        parser.add_argument(
+            '--max-attempts',
+            type=int,
+            default=IMAGE_JOB_MAX_ATTEMPTS,
+            help='Give up on a job after failing this amount of times',
+        )
+
+    def handle(self, *args, **options):
+        jobs_ids = ImageJob.objects.filter(
+            status=ImageJob.PENDING
+        ).values_list('id', flat=True)[: options['limit']]
+        processed = 0
+
+        for job_id in list(jobs_ids):
+            # Claiming the job this way let several workers run at once
+            claimed = ImageJob.objects.filter(
+                id=job_id, status=ImageJob.PENDING
+            ).update(status=ImageJob.PROCESSING, attempts=F('attempts') + 1)
+            if not claimed:
+                continue
+
+            job = ImageJob.objects.get(id=job_id)
+            try:
+                process_and_store_image(job.img_name)
+            except Exception as e:
+                job.error = str(e)
+                if job.attempts >= options['max_attempts']:
+                    job.status = ImageJob.FAILED
+                else:
+                    job.status = ImageJob.PENDING
+                job.save(update_fields=['error', 'status', 'modified'])
+                continue
+
+            job.status = ImageJob.DONE
+            job.save(update_fields=['status', 'modified'])
+            processed += 1
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                COMMAND_PROCESS_IMAGE_JOBS_SUCCESS_MESSAGE % processed
+            )
+        )
@@ -0,0 +1,18 @@
+from django.core.management.base import BaseCommand
+
+from core.constants import (
+    COMMAND_REBUILD_VOTE_COUNTERS_HELP_TEXT,
+    COMMAND_REBUILD_VOTE_COUNTERS_SUCCESS_MESSAGE,
+)
+
+from ...counters import rebuild_vote_counters
+
+
+class Command(BaseCommand):
+    help = COMMAND_REBUILD_VOTE_COUNTERS_HELP_TEXT
+
+    def handle(self, *args, **options):
+        rebuild_vote_counters()
+        self.stdout.write(
+            self.style.SUCCESS(COMMAND_REBUILD_VOTE_COUNTERS_SUCCESS_MESSAGE)
+        )
@@ -0,0 +1,23 @@
+# Generated by Django 3.1.14 on 2026-10-18 07:32
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('questions', '0008_auto_20210430_0318'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='alternative',
+            name='votes_count',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='question',
+            name='total_votes',
+            field=models.PositiveIntegerField(default=0),
+        ),
+    ]
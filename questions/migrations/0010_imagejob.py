@@ -0,0 +1,49 @@
+# Generated by Django 3.1.14 on 2026-10-18 07:39
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('questions', '0009_auto_20261018_0732'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ImageJob',
+            fields=[
+                (
+                    'id',
+                    models.AutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name='ID',
+                    ),
+                ),
+                ('created', models.DateTimeField(auto_now_add=True)),
+                ('modified', models.DateTimeField(auto_now=True)),
+                ('img_name', models.CharField(max_length=255)),
+                (
+                    'status',
+                    models.CharField(
+                        choices=[
+                            ('pending', 'Pending'),
+                            ('processing', 'Processing'),
+                            ('done', 'Done'),
+                            ('failed', 'Failed'),
+                        ],
+                        db_index=True,
+                        default='pending',
+                        max_length=10,
+                    ),
+                ),
+                ('attempts', models.PositiveSmallIntegerField(default=0)),
+                ('error', models.TextField(blank=True, default='')),
+            ],
+            options={
+                'ordering': ('id',),
+            },
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 3.1.14 on 2026-10-18 07:41
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('questions', '0010_imagejob'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='alternative',
+            name='image_derivatives',
+            field=models.JSONField(blank=True, default=dict),
+        ),
+    ]
@@ -0,0 +1,35 @@
+# Generated by Django 3.1.14 on 2026-10-18 07:48
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('questions', '0011_alternative_image_derivatives'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ImageBlob',
+            fields=[
+                (
+                    'id',
+                    models.AutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name='ID',
+                    ),
+                ),
+                ('created', models.DateTimeField(auto_now_add=True)),
+                ('modified', models.DateTimeField(auto_now=True)),
+                ('sha256', models.CharField(max_length=64, unique=True)),
+                ('img_name', models.CharField(db_index=True, max_length=255)),
+                ('ref_count', models.PositiveIntegerField(default=0)),
+            ],
+            options={
+                'ordering': ('id',),
+            },
+        ),
+    ]
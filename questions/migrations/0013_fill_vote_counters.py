@@ -0,0 +1,19 @@
+from django.db import migrations
+
+
+def fill_vote_counters(apps, schema_editor):
+    from questions.counters import rebuild_vote_counters
+
+    rebuild_vote_counters(apps)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('users', '0001_initial'),
+        ('questions', '0012_imageblob'),
+    ]
+
+    operations = [
+        migrations.RunPython(fill_vote_counters, migrations.RunPython.noop),
+    ]
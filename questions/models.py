@@ -1,20 +1,17 @@
 import datetime
 
-from django.conf import settings
-from django.db import models
+from django.db import models, transaction
+from django.db.models import F
 from django.urls import reverse
 from django.utils import timezone
 from django.utils.text import slugify
 from django.utils.translation import gettext_lazy as _
 
 from core.constants import DEFAULT_IMAGE_NAME
-from core.models import TitleAndTimeStampedModel
-from lists.models import QuestionList
+from core.models import TimeStampedModel, TitleAndTimeStampedModel
+from lists.models import QuestionList, UserListPlay
 
-from .utils import (
-    reshape_img_to_square_with_blurry_bg,
-    reshape_img_to_square_with_blurry_bg_gcp,
-)
+from .image_queue import enqueue_image_processing
 
 
 class Question(TitleAndTimeStampedModel):
@@ -22,6 +19,7 @@ class Question(TitleAndTimeStampedModel):
     child_of = models.ForeignKey(
         QuestionList, on_delete=models.CASCADE, related_name='questions'
     )
+    total_votes = models.PositiveIntegerField(default=0)
 
     class Meta:
         ordering = ('id',)
@@ -64,10 +62,8 @@ class Question(TitleAndTimeStampedModel):
         return False
 
     def get_user_voted_alternative(self, user):
-        for alternative in self.alternatives.all():
-            if user in alternative.users.all():
-                return alternative
-        return None
+        # Never load the voters, there may be lots of them
+        return self.alternatives.filter(users=user).first()
 
 
 class Alternative(TitleAndTimeStampedModel):
@@ -84,14 +80,19 @@ class Alternative(TitleAndTimeStampedModel):
         null=True,
         blank=True,
     )
+    votes_count = models.PositiveIntegerField(default=0)
+    image_derivatives = models.JSONField(default=dict, blank=True)
 
     def save(self, *args, **kwargs):
+        # Only freshly uploaded images have to be processed
+        image_uploaded = not self.image._committed
         super().save(*args, **kwargs)
-        if settings.STORE_IN_BUCKET:
-            reshape_img_to_square_with_blurry_bg_gcp(self.image.name)
-        else:
-            bg_img = reshape_img_to_square_with_blurry_bg(self.image.path)
-            bg_img.save(self.image.path)
+        if image_uploaded:
+            enqueue_image_processing(self.image.name)
+
+    @property
+    def image_url(self):
+        return self.image.url
 
     def get_votes_amount(self):
         return self.users.all().count()
@@ -107,5 +108,71 @@ class Alternative(TitleAndTimeStampedModel):
             )
         )
 
+    def get_votes_count_percentage(self):
+        """
+        Same as ``get_votes_percentage`` but based on the denormalized
+        counters, so it doesn't hit the database.
+        """
+        if self.question.total_votes == 0:
+            return 0
+        return float(
+            "{:.2f}".format(self.votes_count / self.question.total_votes * 100)
+        )
+
+    def increment_votes_count(self):
+        Alternative.objects.filter(id=self.id).update(
+            votes_count=F('votes_count') + 1
+        )
+        Question.objects.filter(id=self.question_id).update(
+            total_votes=F('total_votes') + 1
+        )
+
     def vote_for_this_alternative(self, user):
-        self.users.add(user)
+        with transaction.atomic():
+            # Counted first, the stats of the user compare with them
+            self.increment_votes_count()
+            self.users.add(user)
+            UserListPlay.record_answer(user, self.question)
+
+
+class ImageJob(TimeStampedModel):
+    PENDING = 'pending'
+    PROCESSING = 'processing'
+    DONE = 'done'
+    FAILED = 'failed'
+    STATUS_CHOICES = [
+        (PENDING, _('Pending')),
+        (PROCESSING, _('Processing')),
+        (DONE, _('Done')),
+        (FAILED, _('Failed')),
+    ]
+
+    img_name = models.CharField(max_length=255)
+    status = models.CharField(
+        max_length=10, choices=STATUS_CHOICES, default=PENDING, db_index=True
+    )
+    attempts = models.PositiveSmallIntegerField(default=0)
+    error = models.TextField(default='', blank=True)
+
+    class Meta:
+        ordering = ('id',)
+
+    def __str__(self):
+        return f'{self.img_name} ({self.status})'
+
+
+class ImageBlob(TimeStampedModel):
+    """
+    An uploaded image, addressed by its content. Every alternative uploading
+    the same image shares the stored one, while something references it.
+    """
+
+    sha256 = models.CharField(max_length=64, unique=True)
+    img_name = models.CharField(max_length=255, db_index=True)
+    ref_count = models.PositiveIntegerField(default=0)
+
+    class Meta:
+        ordering = ('id',)
+
+    def __str__(self):
+        return f'{self.img_name} ({self.ref_count})'
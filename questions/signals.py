@@ -0,0 +1,10 @@
+from django.db.models.signals import post_delete
+from django.dispatch import receiver
+
+from .image_store import release_image
+from .models import Alternative
+
+
+@receiver(post_delete, sender=Alternative)
+def release_image_on_alternative_delete(sender, instance, **kwargs):
+    release_image(instance.image.name, instance.image_derivatives)
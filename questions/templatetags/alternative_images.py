@@ -0,0 +1,38 @@
+from django import template
+from django.core.files.storage import default_storage as storage
+
+register = template.Library()
+
+
+def _get_srcset(derivatives):
+    return ', '.join(
+        f'{storage.url(name)} {size}w'
+        for size, name in sorted(
+            derivatives.items(), key=lambda item: int(item[0])
+        )
+    )
+
+
+@register.inclusion_tag('snippets/alternative_picture.html')
+def alternative_picture(alternative, size):
+    """
+    Render the image of ``alternative`` for a slot of ``size`` pixels,
+    letting the browser pick the closest derivative and WebP when it
+    supports it. Images not processed yet are rendered as they are.
+    """
+    derivatives = alternative.image_derivatives or {}
+    webp_derivatives = derivatives.get('webp', {})
+    fallback_derivatives = derivatives.get('jpeg') or derivatives.get('png')
+
+    context = {'size': size, 'src': alternative.image_url}
+    if webp_derivatives and fallback_derivatives:
+        sizes = sorted(int(s) for s in fallback_derivatives)
+        src_size = next((s for s in sizes if s >= size), sizes[-1])
+        context.update(
+            {
+                'src': storage.url(fallback_derivatives[str(src_size)]),
+                'webp_srcset': _get_srcset(webp_derivatives),
+                'srcset': _get_srcset(fallback_derivatives),
+            }
+        )
+    return context
@@ -0,0 +1,127 @@
+import io
+from unittest.mock import patch
+
+from django.core.management import call_command
+from django.test import TestCase
+
+from core.constants import (
+    COMMAND_BENCHMARK_IMAGE_DECODE_SUCCESS_MESSAGE,
+    COMMAND_PROCESS_IMAGE_JOBS_SUCCESS_MESSAGE,
+    COMMAND_REBUILD_VOTE_COUNTERS_SUCCESS_MESSAGE,
+)
+from users.factories import UserFactory
+
+from ..factories import AlternativeFactory, QuestionFactory
+from ..models import Alternative, ImageJob, Question
+
+
+class RebuildVoteCountersCommandTests(TestCase):
+    def setUp(self):
+        self.question = QuestionFactory()
+        self.alternative_1 = AlternativeFactory(question=self.question)
+        self.alternative_2 = AlternativeFactory(question=self.question)
+        # Bypass the counters on purpose, like old data would do
+        self.alternative_1.users.add(UserFactory(username='javi'))
+        self.alternative_1.users.add(UserFactory(username='jorge'))
+        self.alternative_2.users.add(UserFactory(username='pedro'))
+
+    def test_command_success(self):
+        out = io.StringIO()
+        call_command('rebuild_vote_counters', stdout=out)
+
+        self.assertEqual(
+            Alternative.objects.get(id=self.alternative_1.id).votes_count, 2
+        )
+        self.assertEqual(
+            Alternative.objects.get(id=self.alternative_2.id).votes_count, 1
+        )
+        self.assertEqual(
+            Question.objects.get(id=self.question.id).total_votes, 3
+        )
+        self.assertIn(
+            COMMAND_REBUILD_VOTE_COUNTERS_SUCCESS_MESSAGE, out.getvalue()
+        )
+
+    def test_command_resets_counters_without_votes(self):
+        question = QuestionFactory(title='no votes')
+        alternative = AlternativeFactory(question=question)
+        Alternative.objects.filter(id=alternative.id).update(votes_count=7)
+        Question.objects.filter(id=question.id).update(total_votes=7)
+
+        call_command('rebuild_vote_counters', stdout=io.StringIO())
+
+        self.assertEqual(
+            Alternative.objects.get(id=alternative.id).votes_count, 0
+        )
+        self.assertEqual(Question.objects.get(id=question.id).total_votes, 0)
+
+
+@patch(
+    'questions.management.commands.process_image_jobs.process_and_store_image'
+)
+class ProcessImageJobsCommandTests(TestCase):
+    def test_command_success(self, mock):
+        job = ImageJob.objects.create(img_name='alternative_pics/a.jpg')
+        out = io.StringIO()
+
+        call_command('process_image_jobs', stdout=out)
+        job.refresh_from_db()
+
+        mock.assert_called_once_with('alternative_pics/a.jpg')
+        self.assertEqual(job.status, ImageJob.DONE)
+        self.assertEqual(job.attempts, 1)
+        self.assertIn(
+            COMMAND_PROCESS_IMAGE_JOBS_SUCCESS_MESSAGE % 1, out.getvalue()
+        )
+
+    def test_command_skips_jobs_already_done(self, mock):
+        ImageJob.objects.create(
+            img_name='alternative_pics/a.jpg', status=ImageJob.DONE
+        )
+
+        call_command('process_image_jobs', stdout=io.StringIO())
+
+        mock.assert_not_called()
+
+    def test_command_retries_failed_jobs(self, mock):
+        mock.side_effect = FileNotFoundError('missing')
+        job = ImageJob.objects.create(img_name='alternative_pics/a.jpg')
+
+        call_command('process_image_jobs', stdout=io.StringIO())
+        job.refresh_from_db()
+
+        self.assertEqual(job.status, ImageJob.PENDING)
+        self.assertEqual(job.error, 'missing')
+
+    def test_command_gives_up_after_max_attempts(self, mock):
+        mock.side_effect = FileNotFoundError('missing')
+        job = ImageJob.objects.create(img_name='alternative_pics/a.jpg')
+
+        for _ in range(3):
+            call_command(
+                'process_image_jobs', '--max-attempts=3', stdout=io.StringIO()
+            )
+        job.refresh_from_db()
+
+        self.assertEqual(job.status, ImageJob.FAILED)
+        self.assertEqual(job.attempts, 3)
+
+
+class BenchmarkImageDecodeCommandTests(TestCase):
+    def test_command_success(self):
+        out = io.StringIO()
+        call_command(
+            'benchmark_image_decode',
+            width=800,
+            height=600,
+            runs=1,
+            stdout=out,
+        )
+
+        output = out.getvalue()
+        self.assertIn('full_decode: +', output)
+        self.assertIn('bounded: +', output)
+        self.assertIn(
+            COMMAND_BENCHMARK_IMAGE_DECODE_SUCCESS_MESSAGE.split('%')[0],
+            output,
+        )
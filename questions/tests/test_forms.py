@@ -10,6 +10,7 @@ from core.constants import (
     DEFAULT_IMAGE_NAME,
     FILE_EXTENSION_ERROR,
     FILE_TOO_LARGE_ERROR,
+    FILE_TOO_MANY_PIXELS_ERROR,
     LIST_REACHED_MAXIMUM_OF_QUESTION,
     SPECIAL_CHARS_ERROR,
 )
@@ -40,6 +41,24 @@ class AnswerQuestionFormTests(TestCase):
             alternative_2.__str__(), form.fields['alternatives'].choices[1][1]
         )
 
+    def test_generate_the_form_with_loaded_alternatives(self):
+        question = QuestionFactory(title='What is this question')
+        AlternativeFactory(title='a1', question=question)
+        AlternativeFactory(title='a2', question=question)
+        alternatives = list(question.alternatives.all())
+
+        with self.assertNumQueries(0):
+            form = AnswerQuestionForm(question, alternatives=alternatives)
+
+        self.assertEqual(
+            form.fields['alternatives'].choices,
+            [
+                (alternative.id, alternative.title)
+                for alternative in alternatives
+            ],
+        )
+        self.assertEqual(form.alternative_2, alternatives[1])
+
 
 class AnswerQuestionFormViewTests(LoginUserMixin, TestCase):
     def test_get_success(self):
@@ -59,6 +78,25 @@ class AnswerQuestionFormViewTests(LoginUserMixin, TestCase):
         self.assertContains(response, 'id="id_alternatives_0"')
         self.assertContains(response, 'id="id_alternatives_1"')
 
+    def test_get_queries(self):
+        question_list = QuestionListFactory(title='awesome list', active=True)
+        for _ in range(3):
+            question = QuestionFactory(child_of=question_list)
+            AlternativeFactory(question=question)
+            AlternativeFactory(question=question)
+        self.create_login_and_verify_user()
+        question.alternatives.first().vote_for_this_alternative(self.user)
+        url = reverse('answer_list', args=[question_list.slug])
+        # Build the play
+        self.client.get(url)
+
+        # session, user and play: the list, its questions and alternatives
+        # are cached
+        with self.assertNumQueries(3):
+            response = self.client.get(url)
+
+        self.assertEqual(response.status_code, HTTPStatus.OK)
+
     def test_post_success_and_adds_user_to_alternative(self):
         question_list = QuestionListFactory(title='awesome list')
 
@@ -216,6 +254,11 @@ class AddAlternativesFormTests(LoginUserMixin, TestCase):
             image_1.unlink()
         if image_2.is_file():
             image_2.unlink()
+        derivatives_folder = Path(
+            settings.MEDIA_ROOT / 'alternative_pics' / 'derivatives'
+        )
+        for derivative in derivatives_folder.glob('IFT[12]_image_for_*'):
+            derivative.unlink()
 
     def test_get_form_success(self):
         self.create_login_and_verify_user()
@@ -313,7 +356,9 @@ class AddAlternativesFormTests(LoginUserMixin, TestCase):
 
     def test_add_alternatives_with_form_and_with_image(self):
         image_1 = create_an_img_ready_for_models(self.NAME_FOR_IMAGE_1)
-        image_2 = create_an_img_ready_for_models(self.NAME_FOR_IMAGE_2)
+        image_2 = create_an_img_ready_for_models(
+            self.NAME_FOR_IMAGE_2, color='white'
+        )
 
         form = AddAlternativesForm(
             data={
@@ -410,6 +455,20 @@ class AddAlternativesFormTests(LoginUserMixin, TestCase):
 
         self.assertEqual(form.errors['image_1'], [FILE_TOO_LARGE_ERROR])
 
+    @patch('questions.validators.MAX_IMAGE_PIXELS', 0)
+    def test_add_alternatives_with_form_with_image_too_many_pixels(self):
+        image_1 = create_an_img_ready_for_models(self.NAME_FOR_IMAGE_1)
+
+        form = AddAlternativesForm(
+            data={
+                'alternative_1': 'Yes',
+                'alternative_2': 'No',
+            },
+            files={'image_1': image_1},
+        )
+
+        self.assertEqual(form.errors['image_1'], [FILE_TOO_MANY_PIXELS_ERROR])
+
     @patch('questions.validators.IMAGE_VALID_EXTENSIONS', ['.png'])
     def test_add_alternatives_with_form_with_invalid_image_extension(self):
         image_1 = create_an_img_ready_for_models(self.NAME_FOR_IMAGE_1)
@@ -0,0 +1,92 @@
+from unittest.mock import patch
+
+from django.db import transaction
+from django.test import TestCase, TransactionTestCase, override_settings
+from PIL import Image
+
+from ..factories import AlternativeFactory
+from ..image_queue import (
+    DatabaseImageQueue,
+    SyncImageQueue,
+    ThreadPoolImageQueue,
+    get_image_queue,
+    process_image_and_log_errors,
+)
+from ..models import Alternative, ImageJob
+
+
+class ImageQueueTests(TestCase):
+    def test_get_image_queue(self):
+        self.assertIsInstance(get_image_queue(), SyncImageQueue)
+
+    @override_settings(
+        IMAGE_PROCESSING_QUEUE='questions.image_queue.DatabaseImageQueue'
+    )
+    def test_get_image_queue_from_settings(self):
+        self.assertIsInstance(get_image_queue(), DatabaseImageQueue)
+
+    def test_sync_queue_reshapes_the_image(self):
+        alternative = AlternativeFactory(image__width=400, image__height=100)
+
+        with Image.open(alternative.image.path) as img:
+            self.assertEqual(img.size, (200, 200))
+
+    def test_sync_queue_stores_the_derivatives(self):
+        alternative = Alternative.objects.get(id=AlternativeFactory().id)
+
+        self.assertEqual(set(alternative.image_derivatives), {'webp', 'jpeg'})
+
+    @override_settings(
+        IMAGE_PROCESSING_QUEUE='questions.image_queue.DatabaseImageQueue'
+    )
+    def test_database_queue_stores_a_job(self):
+        alternative = AlternativeFactory()
+
+        job = ImageJob.objects.get()
+        self.assertEqual(job.img_name, alternative.image.name)
+        self.assertEqual(job.status, ImageJob.PENDING)
+
+    @patch('questions.image_queue.process_and_store_image')
+    def test_only_uploaded_images_are_processed(self, mock):
+        alternative = AlternativeFactory()
+        mock.reset_mock()
+
+        alternative.title = 'new title'
+        alternative.save()
+        Alternative.objects.create(
+            title='default image', question=alternative.question
+        )
+
+        mock.assert_not_called()
+
+
+class ThreadPoolImageQueueTests(TransactionTestCase):
+    @patch('questions.image_queue.process_and_store_image')
+    def test_thread_pool_queue(self, mock):
+        queue = ThreadPoolImageQueue()
+
+        queue.enqueue('alternative_pics/some_image.jpg')
+        queue.executor.shutdown(wait=True)
+
+        mock.assert_called_once_with('alternative_pics/some_image.jpg')
+
+    @patch('questions.image_queue.process_and_store_image')
+    def test_thread_pool_queue_swallows_errors(self, mock):
+        mock.side_effect = OSError
+        queue = ThreadPoolImageQueue()
+
+        with self.assertLogs('questions.image_queue', level='ERROR'):
+            queue.enqueue('alternative_pics/some_image.jpg')
+            queue.executor.shutdown(wait=True)
+
+    def test_thread_pool_queue_waits_for_the_commit(self):
+        queue = ThreadPoolImageQueue()
+
+        with patch.object(queue.executor, 'submit') as submit:
+            with transaction.atomic():
+                queue.enqueue('alternative_pics/some_image.jpg')
+                submit.assert_not_called()
+
+        submit.assert_called_once_with(
+            process_image_and_log_errors, 'alternative_pics/some_image.jpg'
+        )
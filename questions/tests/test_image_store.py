@@ -0,0 +1,117 @@
+from pathlib import Path
+from unittest.mock import patch
+
+from django.conf import settings
+from django.core.files.storage import default_storage as storage
+from django.test import TestCase, TransactionTestCase
+
+from ..factories import AlternativeFactory, QuestionFactory
+from ..image_store import get_sha256, save_alternative_with_image
+from ..models import Alternative, ImageBlob
+from ..utils import create_an_img_ready_for_models
+
+
+class ImageStoreMixin:
+    NAME_FOR_IMAGE_1 = 'IST1_image_for_testing.jpg'
+    NAME_FOR_IMAGE_2 = 'IST2_image_for_testing.jpg'
+
+    def setUp(self):
+        self.question = QuestionFactory()
+        pics_folder = Path(settings.MEDIA_ROOT / 'alternative_pics')
+        for pattern in ('IST[12]_image_for_*', 'derivatives/IST[12]_*'):
+            for path in pics_folder.glob(pattern):
+                path.unlink()
+
+    def save_alternative(self, img_name, color=0):
+        return save_alternative_with_image(
+            Alternative(title='Pizza', question=self.question),
+            create_an_img_ready_for_models(img_name, color=color),
+        )
+
+
+class SaveAlternativeWithImageTests(ImageStoreMixin, TestCase):
+    def test_get_sha256_rewinds_the_file(self):
+        img_file = create_an_img_ready_for_models(self.NAME_FOR_IMAGE_1)
+
+        self.assertEqual(get_sha256(img_file), get_sha256(img_file))
+        self.assertEqual(len(get_sha256(img_file)), 64)
+
+    def test_first_upload_creates_a_blob(self):
+        alternative = self.save_alternative(self.NAME_FOR_IMAGE_1)
+
+        blob = ImageBlob.objects.get()
+        self.assertEqual(blob.img_name, alternative.image.name)
+        self.assertEqual(blob.ref_count, 1)
+
+    def test_same_image_is_stored_and_processed_once(self):
+        with patch(
+            'questions.image_queue.process_image', return_value={}
+        ) as mock_process:
+            alternative_1 = self.save_alternative(self.NAME_FOR_IMAGE_1)
+            alternative_2 = self.save_alternative(self.NAME_FOR_IMAGE_2)
+
+        self.assertEqual(alternative_1.image.name, alternative_2.image.name)
+        self.assertFalse(
+            storage.exists(f'alternative_pics/{self.NAME_FOR_IMAGE_2}')
+        )
+        mock_process.assert_called_once_with(alternative_1.image.name)
+        self.assertEqual(ImageBlob.objects.get().ref_count, 2)
+
+    def test_shared_image_reuses_the_derivatives(self):
+        alternative_1 = self.save_alternative(self.NAME_FOR_IMAGE_1)
+        alternative_1.refresh_from_db()
+
+        alternative_2 = self.save_alternative(self.NAME_FOR_IMAGE_2)
+
+        self.assertNotEqual(alternative_1.image_derivatives, {})
+        self.assertEqual(
+            alternative_2.image_derivatives, alternative_1.image_derivatives
+        )
+
+    def test_different_images_are_not_shared(self):
+        alternative_1 = self.save_alternative(self.NAME_FOR_IMAGE_1)
+        alternative_2 = self.save_alternative(
+            self.NAME_FOR_IMAGE_2, color='white'
+        )
+
+        self.assertNotEqual(alternative_1.image.name, alternative_2.image.name)
+        self.assertEqual(ImageBlob.objects.count(), 2)
+
+
+class ReleaseImageTests(ImageStoreMixin, TransactionTestCase):
+    def test_image_is_kept_while_referenced(self):
+        alternative_1 = self.save_alternative(self.NAME_FOR_IMAGE_1)
+        alternative_2 = self.save_alternative(self.NAME_FOR_IMAGE_2)
+
+        alternative_1.delete()
+
+        self.assertEqual(ImageBlob.objects.get().ref_count, 1)
+        self.assertTrue(storage.exists(alternative_2.image.name))
+
+    def test_deleting_the_question_collects_the_image(self):
+        alternative = self.save_alternative(self.NAME_FOR_IMAGE_1)
+        self.save_alternative(self.NAME_FOR_IMAGE_2)
+        alternative.refresh_from_db()
+
+        self.question.delete()
+
+        self.assertFalse(ImageBlob.objects.exists())
+        self.assertFalse(storage.exists(alternative.image.name))
+        for names in alternative.image_derivatives.values():
+            for name in names.values():
+                self.assertFalse(storage.exists(name))
+
+    def test_deleting_the_list_collects_the_image(self):
+        alternative = self.save_alternative(self.NAME_FOR_IMAGE_1)
+
+        self.question.child_of.delete()
+
+        self.assertFalse(ImageBlob.objects.exists())
+        self.assertFalse(storage.exists(alternative.image.name))
+
+    def test_image_without_blob_is_left_alone(self):
+        alternative = AlternativeFactory(question=self.question)
+
+        alternative.delete()
+
+        self.assertTrue(storage.exists(alternative.image.name))
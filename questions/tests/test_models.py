@@ -8,7 +8,7 @@ from core.mixins import TestModelStrMixin
 from users.factories import UserFactory
 
 from ..factories import AlternativeFactory, QuestionFactory
-from ..models import Question
+from ..models import Alternative, Question
 
 
 class QuestionModelTests(TestModelStrMixin, TestCase):
@@ -130,8 +130,42 @@ class AlternativeModelTests(TestModelStrMixin, TestCase):
             ],
         )
 
+    def test_vote_for_this_alternative_updates_counters(self):
+        alternative = AlternativeFactory(title='awesome alternative')
+
+        alternative.vote_for_this_alternative(self.user)
+        alternative = Alternative.objects.select_related('question').get(
+            id=alternative.id
+        )
+
+        self.assertEqual(alternative.votes_count, 1)
+        self.assertEqual(alternative.question.total_votes, 1)
+
+    def test_get_votes_count_percentage(self):
+        question = QuestionFactory(title='cool?')
+        alternative_1 = AlternativeFactory(title='a1', question=question)
+        alternative_2 = AlternativeFactory(title='a2', question=question)
+        alternative_1.vote_for_this_alternative(self.user)
+        alternative_1.vote_for_this_alternative(UserFactory(username='u1'))
+        alternative_2.vote_for_this_alternative(UserFactory(username='u2'))
+        alternative_2.vote_for_this_alternative(UserFactory(username='u3'))
+        alternative_2.vote_for_this_alternative(UserFactory(username='u4'))
+
+        alternative_1, alternative_2 = Alternative.objects.filter(
+            question=question
+        ).select_related('question')
+
+        with self.assertNumQueries(0):
+            self.assertEqual(alternative_1.get_votes_count_percentage(), 40)
+            self.assertEqual(alternative_2.get_votes_count_percentage(), 60)
+
+    def test_get_votes_count_percentage_with_no_votes(self):
+        alternative = AlternativeFactory(title='awesome alternative')
+
+        self.assertEqual(alternative.get_votes_count_percentage(), 0)
+
     @override_settings(STORE_IN_BUCKET=True)
-    @patch('questions.models.reshape_img_to_square_with_blurry_bg_gcp')
+    @patch('questions.utils.reshape_img_to_square_with_blurry_bg_gcp')
     def test_store_alternative_in_bucket(self, mock):
         mock.return_value = True
         alternative = AlternativeFactory(title='awesome alternative')
@@ -0,0 +1,49 @@
+from django.template import Context, Template
+from django.test import TestCase
+
+from ..factories import AlternativeFactory
+from ..models import Alternative
+
+
+class AlternativePictureTagTests(TestCase):
+    template = Template(
+        '{% load alternative_images %}'
+        '{% alternative_picture alternative size %}'
+    )
+
+    def render(self, alternative, size):
+        return self.template.render(
+            Context({'alternative': alternative, 'size': size})
+        )
+
+    def test_processed_image(self):
+        alternative = Alternative.objects.get(id=AlternativeFactory().id)
+
+        html = self.render(alternative, 96)
+
+        self.assertIn('<picture>', html)
+        self.assertIn('type="image/webp"', html)
+        self.assertIn('sizes="96px"', html)
+        self.assertIn(
+            alternative.image_derivatives['jpeg']['96'].split('/')[-1], html
+        )
+        self.assertIn('400w', html)
+
+    def test_src_is_never_smaller_than_the_slot(self):
+        alternative = Alternative.objects.get(id=AlternativeFactory().id)
+
+        html = self.render(alternative, 150)
+
+        self.assertIn(
+            'src="/media/' + alternative.image_derivatives['jpeg']['200'],
+            html,
+        )
+
+    def test_image_not_processed_yet(self):
+        alternative = AlternativeFactory()
+        alternative.image_derivatives = {}
+
+        html = self.render(alternative, 96)
+
+        self.assertNotIn('<picture>', html)
+        self.assertIn(f'src="{alternative.image.url}"', html)
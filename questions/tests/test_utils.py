@@ -0,0 +1,83 @@
+from io import BytesIO
+from unittest.mock import patch
+
+from django.core.files.base import ContentFile
+from django.core.files.storage import default_storage as storage
+from django.test import TestCase
+from PIL import Image
+
+from core.constants import TEST_FOLDER_TO_STORE_IMAGES
+
+from ..utils import (
+    create_image_derivatives,
+    get_fallback_format,
+    make_square_with_blurry_bg,
+    open_img_for_size,
+)
+
+
+class ImageDerivativesTests(TestCase):
+    def store_image(self, name, img_format):
+        img = Image.new(mode='RGBA', size=(300, 120), color='red')
+        if img_format == 'JPEG':
+            img = img.convert('RGB')
+        path = f'alternative_pics/{TEST_FOLDER_TO_STORE_IMAGES}/{name}'
+        with ContentFile(b'') as content:
+            img.save(content, format=img_format)
+            return storage.save(path, content)
+
+    def test_make_square_with_blurry_bg(self):
+        img = Image.new(mode='RGB', size=(300, 120))
+
+        self.assertEqual(make_square_with_blurry_bg(img, 96).size, (96, 96))
+
+    def test_get_fallback_format(self):
+        self.assertEqual(get_fallback_format('pics/pizza.PNG'), 'png')
+        self.assertEqual(get_fallback_format('pics/pizza.jpg'), 'jpeg')
+        self.assertEqual(get_fallback_format('pics/pizza.jpeg'), 'jpeg')
+
+    def test_create_image_derivatives(self):
+        img_name = self.store_image('derivatives.jpg', 'JPEG')
+
+        derivatives = create_image_derivatives(img_name)
+
+        self.assertEqual(set(derivatives), {'webp', 'jpeg'})
+        for img_format, names in derivatives.items():
+            self.assertEqual(sorted(names, key=int), ['96', '200', '400'])
+            for size, name in names.items():
+                with Image.open(storage.path(name)) as img:
+                    self.assertEqual(img.size, (int(size), int(size)))
+                    self.assertEqual(img.format, img_format.upper())
+
+    def test_create_image_derivatives_keeps_png(self):
+        img_name = self.store_image('derivatives.png', 'PNG')
+
+        derivatives = create_image_derivatives(img_name)
+
+        self.assertEqual(set(derivatives), {'webp', 'png'})
+
+
+class OpenImgForSizeTests(TestCase):
+    def create_jpeg(self, size):
+        img_file = BytesIO()
+        Image.new(mode='RGB', size=size, color='red').save(img_file, 'JPEG')
+        img_file.seek(0)
+        return img_file
+
+    def test_jpeg_is_decoded_downscaled(self):
+        img = open_img_for_size(self.create_jpeg((1600, 1200)), 200)
+        img.load()
+
+        # Smallest DCT scale (1/4) that keeps both sides over 200
+        self.assertEqual(img.size, (400, 300))
+
+    def test_small_jpeg_is_not_downscaled(self):
+        img = open_img_for_size(self.create_jpeg((300, 120)), 200)
+        img.load()
+
+        self.assertEqual(img.size, (300, 120))
+
+    @patch('questions.utils.MAX_IMAGE_PIXELS', 1000)
+    def test_image_over_the_pixels_budget(self):
+        with self.assertRaises(Image.DecompressionBombError):
+            open_img_for_size(self.create_jpeg((100, 11)), 200)
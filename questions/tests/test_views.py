@@ -4,19 +4,27 @@ from http import HTTPStatus
 from allauth.account.models import EmailAddress
 from django.contrib.auth import get_user_model
 from django.contrib.messages import get_messages
+from django.core.cache import cache
 from django.core.management import call_command
+from django.db import connection
 from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
 from django.urls import resolve, reverse
 
 from core.constants import (
     ALREADY_ANSWERED_ALL_THE_QUESTIONS,
+    ANSWERS_MUST_BELONG_TO_THE_LIST,
     ATTEMPT_TO_SEE_AN_INCOMPLETE_LIST_MESSAGE,
     DONT_TRY_WEIRD_STUFF,
+    INVALID_ANSWERS_PAYLOAD,
+    ONE_ANSWER_PER_QUESTION,
 )
-from core.mixins import TestViewsMixin
+from core.mixins import LoginUserMixin, TestViewsMixin
 from demo.factories import DemoListFactory
+from lists.cache import get_results_cache_key
 from lists.models import QuestionList
 from users.factories import UserFactory
+from users.models import UserStats
 from votes.models import Vote
 
 from ..factories import (
@@ -32,6 +40,7 @@ from ..views import (
     DeleteQuestionView,
     EditQuestionView,
     ImagesCreditView,
+    answer_list_at_once,
     home,
 )
 
@@ -93,7 +102,8 @@ class AnswerQuestionViewGetTests(TestCase):
         some_list = QuestionListFactory(active=True)
         question_1 = QuestionFactory(child_of=some_list)
         question_2 = QuestionFactory(child_of=some_list)
-        AlternativeFactory(question=question_1)
+        AlternativeFactory(title='first alternative', question=question_1)
+        AlternativeFactory(title='second alternative', question=question_1)
         AlternativeFactory(question=question_2)
         self.base_url = reverse('answer_list', args=[some_list.slug])
 
@@ -112,6 +122,13 @@ class AnswerQuestionViewGetTests(TestCase):
             response, AnswerQuestionView.template_name_not_auth
         )
 
+    def test_alternatives_are_shown_when_not_logged_in(self):
+        response = self.client.get(self.base_url)
+
+        self.assertContains(response, 'first alternative')
+        self.assertContains(response, 'second alternative')
+        self.assertContains(response, 'class="is-rounded"', count=2)
+
 
 class AnswerQuestionViewTests(TestCase):
     def setUp(self):
@@ -253,6 +270,67 @@ class AnswerQuestionViewTests(TestCase):
         self.assertEqual(Vote.objects.last().list.__str__(), 'post list')
         self.assertEqual(vote.shared_by, None)
 
+    def test_post_again_after_answering_all_the_questions(self):
+        question_list = QuestionListFactory(title='post list', owner=self.user)
+        question = QuestionFactory(
+            title='post question', child_of=question_list
+        )
+        alternative = AlternativeFactory(
+            title='post alternative', question=question
+        )
+        url = reverse('answer_list', args=[question_list.slug])
+        data = {
+            'alternatives': alternative.id,
+            'list_slug': question_list.slug,
+        }
+
+        self.client.post(url, data=data)
+        response = self.client.post(url, data=data)
+
+        self.assertEqual(response.status_code, HTTPStatus.FOUND)
+        self.assertEqual(
+            response['Location'],
+            reverse('list_results', args=[question_list.slug]),
+        )
+        self.assertEqual(Vote.objects.filter(user=self.user).count(), 1)
+
+    def test_post_success_updates_vote_counters(self):
+        question_list = QuestionListFactory(title='post list', owner=self.user)
+        question = QuestionFactory(
+            title='post question', child_of=question_list
+        )
+        AlternativeFactory(title='post alternative 1', question=question)
+        alternative = AlternativeFactory(
+            title='post alternative 2', question=question
+        )
+        url = reverse('answer_list', args=[question_list.slug])
+
+        self.client.post(url, data={'alternatives': alternative.id})
+        alternative = Alternative.objects.select_related('question').get(
+            id=alternative.id
+        )
+
+        self.assertEqual(alternative.votes_count, 1)
+        self.assertEqual(alternative.question.total_votes, 1)
+
+    def test_post_success_invalidates_cached_results(self):
+        question_list = QuestionListFactory(title='post list', owner=self.user)
+        question = QuestionFactory(
+            title='post question', child_of=question_list
+        )
+        alternative = AlternativeFactory(
+            title='post alternative 1', question=question
+        )
+        AlternativeFactory(title='post alternative 2', question=question)
+        cache.set(get_results_cache_key(question_list.id), [])
+
+        self.client.post(
+            reverse('answer_list', args=[question_list.slug]),
+            data={'alternatives': alternative.id},
+        )
+
+        self.assertIsNone(cache.get(get_results_cache_key(question_list.id)))
+
     def test_post_success_with_invitation_go_to_results(self):
         user = UserFactory()
         question_list = QuestionListFactory(title='post list', owner=self.user)
@@ -438,6 +516,157 @@ class AnswerQuestionViewTests(TestCase):
         self.client.login(email=email, password='password123')
 
 
+class AnswerListAtOnceViewTests(LoginUserMixin, TestCase):
+    def setUp(self):
+        self.create_login_and_verify_user()
+        self.question_list = QuestionListFactory(active=True)
+        self.alternatives = []
+        for _ in range(3):
+            question = QuestionFactory(child_of=self.question_list)
+            self.alternatives.append(AlternativeFactory(question=question))
+            AlternativeFactory(question=question)
+        self.url = reverse(
+            'answer_list_at_once', args=[self.question_list.slug]
+        )
+
+    def post_answers(self, alternatives_ids, url=None):
+        return self.client.post(
+            url or self.url,
+            data={'alternatives': alternatives_ids},
+            content_type='application/json',
+        )
+
+    def test_resolves_to_view(self):
+        found = resolve(self.url)
+
+        self.assertEqual(found.func, answer_list_at_once)
+
+    def test_answer_all_the_questions(self):
+        alternatives_ids = [
+            alternative.id for alternative in self.alternatives
+        ]
+
+        response = self.post_answers(alternatives_ids)
+
+        self.assertEqual(response.status_code, HTTPStatus.OK)
+        self.assertEqual(
+            response.json(),
+            {
+                'votes': 3,
+                'next': reverse(
+                    'list_results', args=[self.question_list.slug]
+                ),
+            },
+        )
+        self.assertEqual(
+            sorted(
+                Vote.objects.filter(user=self.user).values_list(
+                    'alternative_id', flat=True
+                )
+            ),
+            alternatives_ids,
+        )
+        self.assertEqual(
+            Alternative.objects.get(id=alternatives_ids[0]).votes_count, 1
+        )
+
+    def test_answer_some_of_the_questions(self):
+        url = reverse(
+            'answer_list_at_once', args=[self.question_list.slug, 'jorge']
+        )
+
+        response = self.post_answers([self.alternatives[0].id], url=url)
+
+        self.assertEqual(response.json()['votes'], 1)
+        self.assertEqual(
+            response.json()['next'],
+            reverse('answer_list', args=[self.question_list.slug, 'jorge']),
+        )
+        self.assertEqual(Vote.objects.get().shared_by, 'jorge')
+
+    def test_already_answered_questions_are_skipped(self):
+        self.post_answers([self.alternatives[0].id])
+
+        response = self.post_answers(
+            [alternative.id for alternative in self.alternatives]
+        )
+
+        self.assertEqual(response.json()['votes'], 2)
+        self.assertEqual(Vote.objects.filter(user=self.user).count(), 3)
+
+    def test_queries_do_not_grow_with_the_answers(self):
+        question_list = QuestionListFactory(active=True)
+        alternative = AlternativeFactory(
+            question=QuestionFactory(child_of=question_list)
+        )
+        url = reverse('answer_list_at_once', args=[question_list.slug])
+        # Otherwise the first answers also create the stats of the user
+        UserStats.objects.create(user=self.user)
+
+        with CaptureQueriesContext(connection) as one_answer:
+            self.post_answers([alternative.id], url=url)
+        with CaptureQueriesContext(connection) as three_answers:
+            self.post_answers(
+                [alternative.id for alternative in self.alternatives]
+            )
+
+        self.assertEqual(len(one_answer), len(three_answers))
+
+    def test_alternative_of_another_list(self):
+        alternative = AlternativeFactory()
+
+        response = self.post_answers([alternative.id])
+
+        self.assertEqual(response.status_code, HTTPStatus.BAD_REQUEST)
+        self.assertEqual(
+            response.json(), {'error': ANSWERS_MUST_BELONG_TO_THE_LIST}
+        )
+        self.assertFalse(Vote.objects.exists())
+
+    def test_two_answers_for_the_same_question(self):
+        question = self.alternatives[0].question
+        another_alternative = question.alternatives.last()
+
+        response = self.post_answers(
+            [self.alternatives[0].id, another_alternative.id]
+        )
+
+        self.assertEqual(response.status_code, HTTPStatus.BAD_REQUEST)
+        self.assertEqual(response.json(), {'error': ONE_ANSWER_PER_QUESTION})
+
+    def test_invalid_payload(self):
+        for payload in ({}, {'alternatives': 'a'}, {'alternatives': ['a']}):
+            response = self.client.post(
+                self.url, data=payload, content_type='application/json'
+            )
+
+            self.assertEqual(response.status_code, HTTPStatus.BAD_REQUEST)
+            self.assertEqual(
+                response.json(), {'error': INVALID_ANSWERS_PAYLOAD}
+            )
+
+    def test_user_not_logged_in(self):
+        self.client.logout()
+
+        response = self.post_answers([self.alternatives[0].id])
+
+        self.assertEqual(response.status_code, HTTPStatus.FORBIDDEN)
+        self.assertFalse(Vote.objects.exists())
+
+    def test_unpublished_list(self):
+        self.question_list.active = False
+        self.question_list.save()
+
+        response = self.post_answers([self.alternatives[0].id])
+
+        self.assertEqual(response.status_code, HTTPStatus.NOT_FOUND)
+
+    def test_get_not_allowed(self):
+        response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, HTTPStatus.METHOD_NOT_ALLOWED)
+
+
 class AddQuestionViewTests(TestViewsMixin, TestCase):
     def setUp(self):
         self.create_login_and_verify_user()
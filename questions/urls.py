@@ -19,6 +19,16 @@ urlpatterns = [
         view=views.AnswerQuestionView.as_view(),
         name='answer_list',
     ),
+    path(
+        route='lists/<slug:slug>/answers/',
+        view=views.answer_list_at_once,
+        name='answer_list_at_once',
+    ),
+    path(
+        route='lists/<slug:slug>/answers/shared-by-<str:username>/',
+        view=views.answer_list_at_once,
+        name='answer_list_at_once',
+    ),
     path(
         route='lists/<slug:list_slug>/add_question/',
         view=views.AddQuestionView.as_view(),
@@ -1,53 +1,60 @@
 import os
 from io import BytesIO
 
+from django.conf import settings
+from django.core.files.base import ContentFile
 from django.core.files.storage import default_storage as storage
 from django.core.files.uploadedfile import InMemoryUploadedFile
 from PIL import Image, ImageFilter
 
+from core.constants import (
+    IMAGE_DERIVATIVE_QUALITY,
+    IMAGE_DERIVATIVE_SIZES,
+    IMAGE_REDUCING_GAP,
+    MAX_IMAGE_PIXELS,
+)
+
+# Pillow refuses to decode (DecompressionBombError) images over twice this
+Image.MAX_IMAGE_PIXELS = MAX_IMAGE_PIXELS
+
+
+def open_img_for_size(fp, size):
+    """
+    Open ``fp`` to be shrunk to (at most) ``size`` x ``size``, without
+    decoding the full resolution bitmap when possible: JPEGs are decoded
+    already downscaled (by 1/2, 1/4 or 1/8) via ``draft()``. Other formats
+    just ignore the draft.
+    """
+    img = Image.open(fp)
+    width, height = img.size
+    if width * height > MAX_IMAGE_PIXELS:
+        img.close()
+        raise Image.DecompressionBombError(
+            f'Image of {width}x{height} pixels exceeds the limit of '
+            f'{MAX_IMAGE_PIXELS} pixels'
+        )
+
+    img.draft(img.mode, (size, size))
+    return img
+
 
 def reshape_img_to_square_with_blurry_bg(img):
     if isinstance(img, str):
-        path = r'{}'.format(img)  # Fix weird bug
-        front_img = Image.open(path)
-    else:
-        front_img = Image.open(img)
-
-    # Palette images with Transparency expressed in bytes should be converted
-    # to RGBA images
-    if front_img.mode == 'P':
-        front_img = front_img.convert('RGBA')
-
-    bg_output_size = (200, 200)
-    bg_img = front_img.resize(bg_output_size)
-    bg_img = bg_img.filter(ImageFilter.GaussianBlur(5))
-
-    front_output_size = (200, 200)
-    front_img.thumbnail(front_output_size)
-    x, y = front_img.size
-    size = max(200, x, y)
+        img = r'{}'.format(img)  # Fix weird bug
 
-    bg_img.paste(front_img, (int((size - x) / 2), int((size - y) / 2)))
-    return bg_img
+    with open_img_for_size(img, 200) as front_img:
+        return make_square_with_blurry_bg(front_img, 200)
 
 
 def reshape_img_to_square_with_blurry_bg_gcp(img_path):
     img_read = storage.open(img_path, 'r')
-    img = Image.open(img_read)
     extension_no_dot = os.path.splitext(img_path)[1][1:]
 
     if extension_no_dot == 'jpg':
         extension_no_dot = 'jpeg'
 
-    output_size = (200, 200)
-    bg_img = img.resize(output_size)
-    bg_img = bg_img.filter(ImageFilter.GaussianBlur(5))
-
-    front_output_size = (200, 200)
-    img.thumbnail(front_output_size)
-    x, y = img.size
-    size = max(200, x, y)
-    bg_img.paste(img, (int((size - x) / 2), int((size - y) / 2)))
+    with open_img_for_size(img_read, 200) as img:
+        bg_img = make_square_with_blurry_bg(img, 200)
 
     in_mem_file = BytesIO()
     bg_img.save(in_mem_file, format=extension_no_dot.upper())
@@ -58,8 +65,100 @@ def reshape_img_to_square_with_blurry_bg_gcp(img_path):
     img_read.close()
 
 
-def create_an_img_ready_for_models(img_name):
-    im = Image.new(mode='RGB', size=(1, 1))  # create a new image using PIL
+def make_square_with_blurry_bg(img, size):
+    # Palette images with Transparency expressed in bytes should be converted
+    # to RGBA images
+    if img.mode == 'P':
+        img = img.convert('RGBA')
+
+    # With a reducing gap, the image is first shrunk by an integer factor
+    # (cheap box reduction) and only then resampled with the costly filter
+    bg_img = img.resize((size, size), reducing_gap=IMAGE_REDUCING_GAP)
+    # Same blur than the 200x200 version, whatever the size is
+    bg_img = bg_img.filter(ImageFilter.GaussianBlur(5 * size / 200))
+
+    front_img = img.copy()
+    front_img.thumbnail((size, size), reducing_gap=IMAGE_REDUCING_GAP)
+    x, y = front_img.size
+
+    bg_img.paste(front_img, ((size - x) // 2, (size - y) // 2))
+    return bg_img
+
+
+def get_fallback_format(img_name):
+    extension_no_dot = os.path.splitext(img_name)[1][1:].lower()
+    if extension_no_dot == 'png':
+        return 'png'
+    return 'jpeg'
+
+
+def _save_derivative(img, name, img_format):
+    if img_format == 'jpeg' and img.mode != 'RGB':
+        img = img.convert('RGB')
+
+    in_mem_file = BytesIO()
+    img.save(
+        in_mem_file,
+        format=img_format.upper(),
+        quality=IMAGE_DERIVATIVE_QUALITY,
+    )
+    return storage.save(name, ContentFile(in_mem_file.getvalue()))
+
+
+def create_image_derivatives(img_name):
+    """
+    Store a squared copy of ``img_name`` for every size of
+    ``IMAGE_DERIVATIVE_SIZES``, both in WebP and in the format of the
+    original (JPEG or PNG), next to it in a ``derivatives`` folder.
+
+    Return the names of the stored files, by format and size. E.g.
+    ``{'webp': {'96': 'alternative_pics/derivatives/pizza_96.webp', ...},
+    'jpeg': {...}}``.
+    """
+    directory, filename = os.path.split(os.path.splitext(img_name)[0])
+    fallback_format = get_fallback_format(img_name)
+    extensions = {'webp': 'webp', 'jpeg': 'jpg', 'png': 'png'}
+    derivatives = {'webp': {}, fallback_format: {}}
+
+    with storage.open(img_name, 'rb') as img_file:
+        img = open_img_for_size(img_file, max(IMAGE_DERIVATIVE_SIZES))
+        img.load()
+
+    for size in IMAGE_DERIVATIVE_SIZES:
+        square_img = make_square_with_blurry_bg(img, size)
+        for img_format in derivatives:
+            name = os.path.join(
+                directory,
+                'derivatives',
+                f'{filename}_{size}.{extensions[img_format]}',
+            )
+            derivatives[img_format][str(size)] = _save_derivative(
+                square_img, name, img_format
+            )
+
+    return derivatives
+
+
+def process_image(img_name):
+    """
+    Create the derivatives of the stored image ``img_name`` and reshape it
+    in place, wherever it is stored. Return the derivatives.
+    """
+    derivatives = create_image_derivatives(img_name)
+
+    if settings.STORE_IN_BUCKET:
+        reshape_img_to_square_with_blurry_bg_gcp(img_name)
+    else:
+        img_path = storage.path(img_name)
+        bg_img = reshape_img_to_square_with_blurry_bg(img_path)
+        bg_img.save(img_path)
+
+    return derivatives
+
+
+def create_an_img_ready_for_models(img_name, color=0):
+    # create a new image using PIL
+    im = Image.new(mode='RGB', size=(1, 1), color=color)
     im_io = BytesIO()  # a BytesIO object for saving image
     im.save(im_io, 'JPEG')  # save the image to im_io
     im_io.seek(0)  # seek to the beginning
@@ -5,7 +5,9 @@ from django.core.exceptions import ValidationError
 from core.constants import (
     FILE_EXTENSION_ERROR,
     FILE_TOO_LARGE_ERROR,
+    FILE_TOO_MANY_PIXELS_ERROR,
     IMAGE_VALID_EXTENSIONS,
+    MAX_IMAGE_PIXELS,
     MAX_IMAGE_SIZE,
 )
 
@@ -19,3 +21,10 @@ def file_extension_validator(value):
     ext = os.path.splitext(value.name)[1]
     if not ext.lower() in IMAGE_VALID_EXTENSIONS:
         raise ValidationError(FILE_EXTENSION_ERROR)
+
+
+def image_pixels_validator(value):
+    # forms.ImageField leaves the opened (header only) image on the file
+    width, height = value.image.size
+    if width * height > MAX_IMAGE_PIXELS:
+        raise ValidationError(FILE_TOO_MANY_PIXELS_ERROR)
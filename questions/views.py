@@ -1,8 +1,12 @@
+import json
+
 from django.contrib import messages
 from django.contrib.auth.mixins import LoginRequiredMixin
-from django.http import Http404
-from django.shortcuts import redirect, render, reverse
+from django.core.exceptions import ValidationError
+from django.http import Http404, JsonResponse
+from django.shortcuts import get_object_or_404, redirect, render, reverse
 from django.template.response import TemplateResponse
+from django.views.decorators.http import require_POST
 from django.views.generic import DeleteView, DetailView, UpdateView, View
 from django.views.generic.base import TemplateView
 
@@ -10,7 +14,9 @@ from core.constants import (
     ALREADY_ANSWERED_ALL_THE_QUESTIONS,
     ATTEMPT_TO_SEE_AN_INCOMPLETE_LIST_MESSAGE,
     DONT_TRY_WEIRD_STUFF,
+    INVALID_ANSWERS_PAYLOAD,
     LIST_PUBLISHED_SUCCESSFULLY,
+    LOGIN_REQUIRED_TO_ANSWER,
     QUESTION_CREATED_SUCCESSFULLY,
     QUESTION_DELETED_SUCCESSFULLY,
     QUESTION_EDITED_SUCCESSFULLY,
@@ -19,8 +25,9 @@ from core.mixins import CustomUserPassesTestMixin
 from core.utils import redirect_and_check_if_list_was_shared
 from demo.models import DemoList
 from lists.forms import CompleteListForm
-from lists.models import QuestionList
-from votes.models import Vote
+from lists.models import QuestionList, UserListPlay
+from lists.structure import get_list_structure
+from votes.services import get_alternatives_to_vote, record_votes
 
 from .forms import AddAlternativesForm, AnswerQuestionForm, CreateQuestionForm
 from .models import Alternative, Question
@@ -34,10 +41,15 @@ def home(request):
 class AnswerQuestionView(DetailView):
     template_name = 'answer_question.html'
     template_name_not_auth = 'answer_question_not_authenticated.html'
+    context_object_name = 'questionlist'
 
     def get_queryset(self):
-        return QuestionList.objects.all().prefetch_related(
-            'questions__alternatives__users'
+        return QuestionList.objects.all()
+
+    def get_object(self, queryset=None):
+        # Lists not active yet have no structure
+        return get_list_structure(self.kwargs['slug']) or super().get_object(
+            queryset
         )
 
     def get(self, request, *args, **kwargs):
@@ -45,12 +57,8 @@ class AnswerQuestionView(DetailView):
 
         if self.object.active:
             if request.user.is_authenticated:
-                if (
-                    self.object.get_amount_of_unanswered_questions(
-                        request.user
-                    )
-                    > 0
-                ):
+                self.play = UserListPlay.get_for(request.user, self.object)
+                if not self.play.is_completed():
                     context = self.get_context_data(object=self.object)
                     return self.render_to_response(context)
 
@@ -62,8 +70,8 @@ class AnswerQuestionView(DetailView):
             else:
                 context = {
                     'questionlist': self.object,
-                    'question': self.object.questions.first(),
-                    'percentage': 1 / self.object.questions.count() * 100,
+                    'question': self.object.questions[0],
+                    'percentage': 1 / len(self.object.questions) * 100,
                     'demo_list': DemoList.objects.first(),
                 }
                 return render(request, self.template_name_not_auth, context)
@@ -74,34 +82,26 @@ class AnswerQuestionView(DetailView):
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
 
-        questions_list = self.object.get_unanswered_questions(
-            self.request.user
-        )
-        question = questions_list[0]
-        question_id = question.id
-        context['form'] = AnswerQuestionForm(question_id)
+        # The question comes along with its alternatives
+        question = self.object.get_question(self.play.next_question_id)
+        context['form'] = AnswerQuestionForm(question)
         context['question'] = question
-
-        total_of_questions = self.object.questions.count()
-        answered_questions_plus_one = (
-            total_of_questions - len(questions_list) + 1
-        )
-        context['percentage'] = (
-            answered_questions_plus_one / total_of_questions * 100
-        )
+        context['percentage'] = self.play.get_percentage()
         return context
 
     def post(self, request, *args, **kwargs):
         if request.user.is_authenticated:
-            target_list = QuestionList.objects.get(
-                slug=self.kwargs.get('slug')
-            )
-            target_question = target_list.get_unanswered_questions(
-                self.request.user
-            )[0]
+            target_list = self.get_object()
+            play = UserListPlay.get_for(request.user, target_list)
             username = self.kwargs.get('username')
 
+            if play.is_completed():
+                return redirect_and_check_if_list_was_shared(
+                    kwargs, 'list_results', target_list, username
+                )
+
             try:
+                # The list comes along for the stats of its owner
                 selected_alternative = (
                     Alternative.objects.all()
                     .select_related('question__child_of')
@@ -113,34 +113,20 @@ class AnswerQuestionView(DetailView):
                     kwargs, 'answer_list', target_list, username
                 )
 
-            question_list = selected_alternative.question.child_of
-
-            if not target_question.alternatives.filter(
-                id__in=[selected_alternative.id]
-            ).exists():
+            if selected_alternative.question_id != play.next_question_id:
                 messages.error(self.request, DONT_TRY_WEIRD_STUFF)
                 return redirect_and_check_if_list_was_shared(
                     kwargs, 'answer_list', target_list, username
                 )
 
-            if not selected_alternative.question.has_the_user_already_voted(
-                self.request.user
-            ):
-                selected_alternative.vote_for_this_alternative(
-                    self.request.user
-                )
-                Vote.objects.create(
-                    user=self.request.user,
-                    list=question_list,
-                    question=selected_alternative.question,
-                    alternative=selected_alternative,
-                    shared_by=self.kwargs.get('username'),
-                )
+            record_votes(
+                self.request.user,
+                [selected_alternative],
+                shared_by=self.kwargs.get('username'),
+            )
 
-            if (
-                question_list.get_amount_of_unanswered_questions(request.user)
-                == 0
-            ):
+            play.refresh_from_db()
+            if play.is_completed():
                 return redirect_and_check_if_list_was_shared(
                     kwargs, 'list_results', target_list, username
                 )
@@ -150,6 +136,42 @@ class AnswerQuestionView(DetailView):
             )
 
 
+@require_POST
+def answer_list_at_once(request, slug, username=None):
+    """
+    Answer all the questions of a list in a single request, sending
+    ``{"alternatives": [<alternative id>, ...]}`` as JSON. Answers
+    for questions the user already answered are ignored.
+    """
+    if not request.user.is_authenticated:
+        return JsonResponse({'error': LOGIN_REQUIRED_TO_ANSWER}, status=403)
+
+    question_list = get_object_or_404(QuestionList, slug=slug, active=True)
+    try:
+        alternatives_ids = json.loads(request.body)['alternatives']
+        if not isinstance(alternatives_ids, list):
+            raise TypeError
+        alternatives_ids = [int(id_) for id_ in alternatives_ids]
+    except (ValueError, KeyError, TypeError):
+        return JsonResponse({'error': INVALID_ANSWERS_PAYLOAD}, status=400)
+
+    try:
+        alternatives = get_alternatives_to_vote(
+            question_list, alternatives_ids
+        )
+    except ValidationError as error:
+        return JsonResponse({'error': error.messages[0]}, status=400)
+
+    votes = record_votes(request.user, alternatives, shared_by=username)
+
+    play = UserListPlay.get_for(request.user, question_list)
+    view_name = 'list_results' if play.is_completed() else 'answer_list'
+    args = [slug, username] if username else [slug]
+    return JsonResponse(
+        {'votes': votes, 'next': reverse(view_name, args=args)}
+    )
+
+
 class AddQuestionView(LoginRequiredMixin, CustomUserPassesTestMixin, View):
     template_name = 'create_question.html'
     instance = None
@@ -278,11 +300,9 @@ class ImagesCreditView(TemplateView):
     template_name = 'images_credit.html'
 
     def get(self, request, *args, **kwargs):
-        self.question_list = QuestionList.objects.prefetch_related(
-            'questions__alternatives'
-        ).get(slug=self.kwargs.get('slug'))
+        self.question_list = get_list_structure(self.kwargs.get('slug'))
 
-        if self.question_list.active:
+        if self.question_list is not None:
             return super().get(request, *args, **kwargs)
         raise Http404('The list either does not exist or is not published yet')
 
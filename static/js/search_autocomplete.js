@@ -0,0 +1,32 @@
+document.addEventListener('DOMContentLoaded', () => {
+
+    const $input = document.getElementById('search_input');
+    const $suggestions = document.getElementById('search_suggestions');
+
+    if ($input && $suggestions) {
+      let urls = {};
+
+      $input.addEventListener('input', () => {
+        // A suggestion was picked: go straight to it
+        if (urls[$input.value]) {
+          window.location.href = urls[$input.value];
+          return;
+        }
+
+        const url = $input.dataset.autocompleteUrl + '?q=' + encodeURIComponent($input.value);
+        fetch(url)
+          .then(response => response.json())
+          .then(data => {
+            urls = {};
+            $suggestions.innerHTML = '';
+            data.suggestions.forEach(suggestion => {
+              urls[suggestion.label] = suggestion.url;
+              const $option = document.createElement('option');
+              $option.value = suggestion.label;
+              $suggestions.appendChild($option);
+            });
+          });
+      });
+    }
+
+  });
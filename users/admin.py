@@ -1,5 +1,18 @@
 from django.contrib import admin
 
-from .models import CustomUser
+from .models import CustomUser, UserStats
 
 admin.site.register(CustomUser)
+
+
+@admin.register(UserStats)
+class UserStatsAdmin(admin.ModelAdmin):
+    list_display = (
+        'user',
+        'lists_created',
+        'lists_published',
+        'questions_answered',
+        'majority_answers',
+        'lists_completed',
+        'own_lists_plays',
+    )
@@ -0,0 +1,20 @@
+from django.core.management.base import BaseCommand
+
+from core.constants import (
+    COMMAND_REBUILD_USER_STATS_HELP_TEXT,
+    COMMAND_REBUILD_USER_STATS_SUCCESS_MESSAGE,
+)
+
+from ...stats import rebuild_user_stats
+
+
+class Command(BaseCommand):
+    help = COMMAND_REBUILD_USER_STATS_HELP_TEXT
+
+    def handle(self, *args, **options):
+        users_amount = rebuild_user_stats()
+        self.stdout.write(
+            self.style.SUCCESS(
+                COMMAND_REBUILD_USER_STATS_SUCCESS_MESSAGE % users_amount
+            )
+        )
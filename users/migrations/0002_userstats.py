@@ -0,0 +1,38 @@
+# Generated by Django 3.1.14 on 2026-10-18 09:24
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('users', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='UserStats',
+            fields=[
+                (
+                    'user',
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        primary_key=True,
+                        related_name='stats',
+                        serialize=False,
+                        to='users.customuser',
+                    ),
+                ),
+                ('lists_created', models.PositiveIntegerField(default=0)),
+                ('lists_published', models.PositiveIntegerField(default=0)),
+                ('questions_answered', models.PositiveIntegerField(default=0)),
+                ('majority_answers', models.PositiveIntegerField(default=0)),
+                ('lists_completed', models.PositiveIntegerField(default=0)),
+                ('own_lists_plays', models.PositiveIntegerField(default=0)),
+            ],
+            options={
+                'verbose_name_plural': 'user stats',
+            },
+        ),
+    ]
@@ -0,0 +1,21 @@
+from django.db import migrations
+
+
+def fill_user_stats(apps, schema_editor):
+    from users.stats import rebuild_user_stats
+
+    rebuild_user_stats(apps)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        # The majority answers need the votes counters filled
+        ('questions', '0013_fill_vote_counters'),
+        ('lists', '0011_auto_20261018_0919'),
+        ('users', '0002_userstats'),
+    ]
+
+    operations = [
+        migrations.RunPython(fill_user_stats, migrations.RunPython.noop),
+    ]
@@ -1,9 +1,16 @@
 from django.contrib.auth.models import AbstractUser
-from django.db import models
+from django.db import connection, models
+from django.db.models import F
+from django.db.models.functions import Greatest
 
 from questions.models import Alternative
 
 
+def decrement(field, amount):
+    """``field`` minus ``amount``, never below 0"""
+    return Greatest(F(field) - amount, 0)
+
+
 class CustomUser(AbstractUser):
     alternatives_chosen = models.ManyToManyField(
         Alternative, related_name='users', blank=True
@@ -14,3 +21,116 @@ class CustomUser(AbstractUser):
 
     def get_amount_of_questions_answered(self):
         return self.alternatives_chosen.count()
+
+
+class UserStats(models.Model):
+    """
+    Stats of a user, kept up to date on every change of its lists, answers
+    and plays (see ``users/stats.py``) instead of counted on every visit.
+    Rebuilt from scratch by the ``rebuild_user_stats`` command.
+    """
+
+    user = models.OneToOneField(
+        CustomUser,
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name='stats',
+    )
+    lists_created = models.PositiveIntegerField(default=0)
+    lists_published = models.PositiveIntegerField(default=0)
+    questions_answered = models.PositiveIntegerField(default=0)
+    # Answers choosing the most voted alternative of their question
+    majority_answers = models.PositiveIntegerField(default=0)
+    lists_completed = models.PositiveIntegerField(default=0)
+    # Lists of the user played by other users
+    own_lists_plays = models.PositiveIntegerField(default=0)
+
+    class Meta:
+        verbose_name_plural = 'user stats'
+
+    def __str__(self):
+        return f'{self.user} stats'
+
+    @classmethod
+    def get_for(cls, user):
+        """The stats of ``user``, all of them 0 if there are none yet"""
+        return cls.objects.filter(user=user).first() or cls(user=user)
+
+    @classmethod
+    def add(cls, amounts):
+        """
+        Add ``{user id: {stat: amount}}``, none of the amounts negative, to
+        the stats of every user with a single ``INSERT ... ON CONFLICT DO
+        UPDATE``: missing rows are created, without racing other requests
+        creating them. Both SQLite (3.24+) and PostgreSQL speak this syntax.
+        """
+        amounts = {
+            user_id: user_amounts
+            for user_id, user_amounts in sorted(amounts.items())
+            if any(user_amounts.values())
+        }
+        if not amounts:
+            return
+
+        quote_name = connection.ops.quote_name
+        table = quote_name(cls._meta.db_table)
+        pk_column = quote_name(cls._meta.pk.column)
+        fields = [
+            field
+            for field in cls._meta.concrete_fields
+            if not field.primary_key
+        ]
+        columns = ', '.join(
+            [pk_column] + [quote_name(field.column) for field in fields]
+        )
+        row = '({})'.format(', '.join(['%s'] * (len(fields) + 1)))
+        params = [
+            value
+            for user_id, user_amounts in amounts.items()
+            for value in [user_id]
+            + [user_amounts.get(field.name, 0) for field in fields]
+        ]
+        updates = ', '.join(
+            f'{column} = {table}.{column} + excluded.{column}'
+            for column in (
+                quote_name(field.column)
+                for field in fields
+                if any(
+                    user_amounts.get(field.name)
+                    for user_amounts in amounts.values()
+                )
+            )
+        )
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f'INSERT INTO {table} ({columns}) '
+                f'VALUES {", ".join([row] * len(amounts))} '
+                f'ON CONFLICT ({pk_column}) DO UPDATE SET {updates}',
+                params,
+            )
+
+    @classmethod
+    def increment(cls, user_id, **amounts):
+        """
+        Add ``amounts`` to the stats of a user. Negative ones never take a
+        stat below 0, which it could be if it was counted before the stats
+        were kept.
+        """
+        if all(amount >= 0 for amount in amounts.values()):
+            cls.add({user_id: amounts})
+            return
+
+        # Without stats there's nothing to take from
+        cls.objects.filter(user_id=user_id).update(
+            **{
+                field: F(field) + amount
+                if amount >= 0
+                else decrement(field, -amount)
+                for field, amount in amounts.items()
+            }
+        )
+
+    def get_majority_percentage(self):
+        if not self.questions_answered:
+            return 0
+        return round(self.majority_answers / self.questions_answered * 100)
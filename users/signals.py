@@ -0,0 +1,35 @@
+from django.db.models.signals import (
+    m2m_changed,
+    post_delete,
+    post_save,
+    pre_delete,
+)
+from django.dispatch import receiver
+
+from .models import CustomUser
+from .stats import count_lists, forget_list_plays, record_answers
+
+
+@receiver(post_save, sender='lists.QuestionList')
+@receiver(post_delete, sender='lists.QuestionList')
+def count_lists_on_list_change(sender, instance, **kwargs):
+    if instance.owner_id:
+        count_lists(instance.owner_id)
+
+
+@receiver(pre_delete, sender='lists.QuestionList')
+def forget_list_plays_on_list_delete(sender, instance, **kwargs):
+    forget_list_plays(instance)
+
+
+@receiver(m2m_changed, sender=CustomUser.alternatives_chosen.through)
+def record_answers_on_alternatives_chosen(
+    sender, instance, action, reverse, pk_set, **kwargs
+):
+    # Votes saved in bulk send no signal, see votes/services.py
+    if action != 'post_add' or not pk_set:
+        return
+    if reverse:
+        record_answers({user_id: [instance.id] for user_id in pk_set})
+    else:
+        record_answers({instance.id: list(pk_set)})
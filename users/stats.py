@@ -0,0 +1,182 @@
+from collections import Counter, defaultdict
+
+from django.apps import apps as global_apps
+from django.db import transaction
+from django.db.models import Count, F, OuterRef, Q, Subquery
+
+from lists.models import QuestionList, UserListPlay
+from questions.models import Alternative
+
+from .models import CustomUser, UserStats, decrement
+
+
+def count_lists(owner_id):
+    """Count again the lists of a user, after one of them changed"""
+    counts = QuestionList.objects.filter(owner_id=owner_id).aggregate(
+        lists_created=Count('id'),
+        lists_published=Count('id', filter=Q(active=True)),
+    )
+    UserStats.objects.update_or_create(user_id=owner_id, defaults=counts)
+
+
+def record_answers(answers, stats=None):
+    """
+    Count the new answers of every ``{user id: [alternative id]}``, and the
+    ones agreeing with the majority: the alternative has as many votes as
+    the most voted one of its question (ties agree too), the vote counters
+    already including the new answers. They are added to ``stats`` (``{user
+    id: Counter}``) when given, for the caller to save them along with other
+    stats, and saved right away otherwise.
+    """
+    alternatives_ids = {
+        alternative_id
+        for user_alternatives_ids in answers.values()
+        for alternative_id in user_alternatives_ids
+    }
+    if not alternatives_ids:
+        return
+
+    alternatives = Alternative.objects.filter(
+        question__in=Alternative.objects.filter(
+            id__in=alternatives_ids
+        ).values('question')
+    ).values_list('id', 'question_id', 'votes_count')
+    most_voted = defaultdict(int)
+    votes = {}
+    for alternative_id, question_id, votes_count in alternatives:
+        most_voted[question_id] = max(most_voted[question_id], votes_count)
+        votes[alternative_id] = (question_id, votes_count)
+
+    amounts = defaultdict(Counter) if stats is None else stats
+    for user_id, user_alternatives_ids in answers.items():
+        amounts[user_id]['questions_answered'] += len(user_alternatives_ids)
+        amounts[user_id]['majority_answers'] += sum(
+            1
+            for alternative_id in user_alternatives_ids
+            if alternative_id in votes
+            and votes[alternative_id][1]
+            >= most_voted[votes[alternative_id][0]]
+        )
+    if stats is None:
+        UserStats.add(amounts)
+
+
+def forget_list_plays(question_list):
+    """
+    Take the plays of a list about to be deleted out of the stats of its
+    players and its owner.
+    """
+    plays = UserListPlay.objects.filter(question_list=question_list)
+    UserStats.objects.filter(
+        user__in=plays.filter(completed__isnull=False).values('user')
+    ).update(lists_completed=decrement('lists_completed', 1))
+    if question_list.owner_id is None:
+        return
+
+    played = (
+        plays.filter(last_played__isnull=False)
+        .exclude(user=question_list.owner_id)
+        .count()
+    )
+    if played:
+        UserStats.objects.filter(user=question_list.owner_id).update(
+            own_lists_plays=decrement('own_lists_plays', played)
+        )
+
+
+def rebuild_user_stats(apps=global_apps):
+    """
+    Count again the stats of every user, comparing the answers with the
+    current majority of their question. Return the amount of users with
+    any stat. Migrations pass their ``apps``.
+    """
+    QuestionList = apps.get_model('lists', 'QuestionList')
+    UserListPlay = apps.get_model('lists', 'UserListPlay')
+    Alternative = apps.get_model('questions', 'Alternative')
+    CustomUser = apps.get_model('users', 'CustomUser')
+    UserStats = apps.get_model('users', 'UserStats')
+    stats_fields = [
+        field.name
+        for field in UserStats._meta.concrete_fields
+        if not field.primary_key
+    ]
+    stats = defaultdict(dict)
+
+    lists = (
+        QuestionList.objects.filter(owner__isnull=False)
+        .values('owner')
+        .annotate(
+            lists_created=Count('id'),
+            lists_published=Count('id', filter=Q(active=True)),
+        )
+        .order_by()
+    )
+    for row in lists:
+        stats[row.pop('owner')].update(row)
+
+    most_voted = (
+        Alternative.objects.filter(question=OuterRef('alternative__question'))
+        .order_by('-votes_count')
+        .values('votes_count')[:1]
+    )
+    answers = (
+        CustomUser.alternatives_chosen.through.objects.annotate(
+            most_voted=Subquery(most_voted)
+        )
+        .values('customuser')
+        .annotate(
+            questions_answered=Count('id'),
+            majority_answers=Count(
+                'id', filter=Q(alternative__votes_count__gte=F('most_voted'))
+            ),
+        )
+        .order_by()
+    )
+    for row in answers:
+        stats[row.pop('customuser')].update(row)
+
+    completed = (
+        UserListPlay.objects.filter(completed__isnull=False)
+        .values('user')
+        .annotate(lists_completed=Count('id'))
+        .order_by()
+    )
+    for row in completed:
+        stats[row.pop('user')].update(row)
+
+    own_lists_plays = (
+        UserListPlay.objects.filter(
+            last_played__isnull=False, question_list__owner__isnull=False
+        )
+        .exclude(user=F('question_list__owner'))
+        .values('question_list__owner')
+        .annotate(own_lists_plays=Count('id'))
+        .order_by()
+    )
+    for row in own_lists_plays:
+        stats[row.pop('question_list__owner')].update(row)
+
+    users_stats = [
+        UserStats(user_id=user_id, **user_stats)
+        for user_id, user_stats in stats.items()
+    ]
+    with transaction.atomic():
+        existing_ids = set(
+            UserStats.objects.filter(user_id__in=stats).values_list(
+                'user_id', flat=True
+            )
+        )
+        UserStats.objects.bulk_update(
+            [s for s in users_stats if s.user_id in existing_ids],
+            stats_fields,
+            batch_size=500,
+        )
+        UserStats.objects.bulk_create(
+            [s for s in users_stats if s.user_id not in existing_ids],
+            batch_size=500,
+        )
+        UserStats.objects.exclude(user_id__in=stats).update(
+            **{field: 0 for field in stats_fields}
+        )
+
+    return len(users_stats)
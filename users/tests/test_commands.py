@@ -0,0 +1,28 @@
+import io
+
+from django.core.management import call_command
+from django.test import TestCase
+
+from core.constants import COMMAND_REBUILD_USER_STATS_SUCCESS_MESSAGE
+from lists.factories import QuestionListFactory
+
+from ..factories import UserFactory
+from ..models import UserStats
+
+
+class RebuildUserStatsCommandTests(TestCase):
+    def setUp(self):
+        self.user = UserFactory()
+        QuestionListFactory(owner=self.user)
+        UserStats.objects.update(lists_created=0)
+
+    def test_command_success(self):
+        out = io.StringIO()
+        call_command('rebuild_user_stats', stdout=out)
+
+        self.assertIn(
+            COMMAND_REBUILD_USER_STATS_SUCCESS_MESSAGE % 1, out.getvalue()
+        )
+        self.assertEqual(
+            UserStats.objects.get(user=self.user).lists_created, 1
+        )
@@ -0,0 +1,177 @@
+from django.test import TestCase
+
+from lists.factories import QuestionListFactory
+from questions.factories import AlternativeFactory, QuestionFactory
+from votes.services import cast_votes
+
+from ..factories import UserFactory
+from ..models import UserStats
+from ..stats import rebuild_user_stats
+
+
+class UserStatsTests(TestCase):
+    def setUp(self):
+        self.owner = UserFactory(username='owner', email='owner@email.com')
+        self.user = UserFactory(username='player', email='player@email.com')
+        self.question_list = QuestionListFactory(owner=self.owner, active=True)
+        self.alternatives = []
+        for _ in range(2):
+            question = QuestionFactory(child_of=self.question_list)
+            self.alternatives.append(
+                [AlternativeFactory(question=question) for _ in range(2)]
+            )
+
+    def get_stats(self, user):
+        return UserStats.objects.get(user=user)
+
+    def test_lists_are_counted(self):
+        QuestionListFactory(owner=self.owner)
+
+        stats = self.get_stats(self.owner)
+        self.assertEqual(stats.lists_created, 2)
+        self.assertEqual(stats.lists_published, 1)
+
+        self.question_list.active = False
+        self.question_list.save()
+
+        self.assertEqual(self.get_stats(self.owner).lists_published, 0)
+
+    def test_deleted_lists_are_not_counted(self):
+        self.question_list.delete()
+
+        self.assertEqual(self.get_stats(self.owner).lists_created, 0)
+
+    def test_answers_are_counted(self):
+        other_user = UserFactory(username='other', email='other@email.com')
+        cast_votes(other_user, [self.alternatives[0][0]])
+
+        cast_votes(self.user, [self.alternatives[0][1]])
+        self.alternatives[1][0].vote_for_this_alternative(self.user)
+
+        stats = self.get_stats(self.user)
+        self.assertEqual(stats.questions_answered, 2)
+        # Tied on the first question, alone on the second one
+        self.assertEqual(stats.majority_answers, 2)
+        self.assertEqual(stats.get_majority_percentage(), 100)
+
+    def test_answers_against_the_majority(self):
+        for username in ('first', 'second'):
+            cast_votes(
+                UserFactory(username=username, email=f'{username}@email.com'),
+                [self.alternatives[0][0]],
+            )
+
+        cast_votes(self.user, [self.alternatives[0][1]])
+
+        stats = self.get_stats(self.user)
+        self.assertEqual(stats.questions_answered, 1)
+        self.assertEqual(stats.majority_answers, 0)
+        self.assertEqual(stats.get_majority_percentage(), 0)
+
+    def test_plays_are_counted(self):
+        cast_votes(self.user, [self.alternatives[0][0]])
+
+        self.assertEqual(self.get_stats(self.owner).own_lists_plays, 1)
+        self.assertEqual(self.get_stats(self.user).lists_completed, 0)
+
+        cast_votes(self.user, [self.alternatives[1][0]])
+
+        self.assertEqual(self.get_stats(self.owner).own_lists_plays, 1)
+        self.assertEqual(self.get_stats(self.user).lists_completed, 1)
+
+    def test_owner_playing_its_list_is_not_counted(self):
+        cast_votes(
+            self.owner, [self.alternatives[0][0], self.alternatives[1][0]]
+        )
+
+        stats = self.get_stats(self.owner)
+        self.assertEqual(stats.own_lists_plays, 0)
+        self.assertEqual(stats.lists_completed, 1)
+
+    def test_deleted_list_plays_are_not_counted(self):
+        cast_votes(
+            self.user, [self.alternatives[0][0], self.alternatives[1][0]]
+        )
+
+        self.question_list.delete()
+
+        self.assertEqual(self.get_stats(self.owner).own_lists_plays, 0)
+        self.assertEqual(self.get_stats(self.user).lists_completed, 0)
+
+    def test_stats_counted_before_they_were_kept_never_go_below_0(self):
+        cast_votes(
+            self.user, [self.alternatives[0][0], self.alternatives[1][0]]
+        )
+        UserStats.objects.update(lists_completed=0, own_lists_plays=0)
+
+        self.question_list.delete()
+
+        self.assertEqual(self.get_stats(self.owner).own_lists_plays, 0)
+        self.assertEqual(self.get_stats(self.user).lists_completed, 0)
+
+    def test_add_to_the_stats_of_several_users(self):
+        UserStats.objects.create(user=self.user, questions_answered=1)
+        UserStats.objects.filter(user=self.owner).delete()
+
+        with self.assertNumQueries(1):
+            UserStats.add(
+                {
+                    self.user.id: {'questions_answered': 2},
+                    self.owner.id: {'own_lists_plays': 1},
+                }
+            )
+
+        self.assertEqual(self.get_stats(self.user).questions_answered, 3)
+        self.assertEqual(self.get_stats(self.owner).own_lists_plays, 1)
+        self.assertEqual(self.get_stats(self.owner).lists_created, 0)
+
+    def test_increment_never_goes_below_0(self):
+        UserStats.objects.create(user=self.user, questions_answered=1)
+
+        UserStats.increment(self.user.id, questions_answered=-2)
+
+        self.assertEqual(self.get_stats(self.user).questions_answered, 0)
+
+    def test_new_question_uncompletes_the_list(self):
+        cast_votes(
+            self.user, [self.alternatives[0][0], self.alternatives[1][0]]
+        )
+
+        QuestionFactory(child_of=self.question_list)
+
+        self.assertEqual(self.get_stats(self.user).lists_completed, 0)
+
+    def test_get_for_user_without_stats(self):
+        stats = UserStats.get_for(self.user)
+
+        self.assertEqual(stats.questions_answered, 0)
+        self.assertEqual(stats.get_majority_percentage(), 0)
+
+
+class RebuildUserStatsTests(TestCase):
+    def test_rebuild_user_stats(self):
+        owner = UserFactory(username='owner', email='owner@email.com')
+        user = UserFactory(username='player', email='player@email.com')
+        question_list = QuestionListFactory(owner=owner, active=True)
+        QuestionListFactory(owner=owner)
+        alternatives = [
+            AlternativeFactory(
+                question=QuestionFactory(child_of=question_list)
+            )
+            for _ in range(2)
+        ]
+        AlternativeFactory(question=alternatives[0].question)
+        cast_votes(user, alternatives)
+        # The stats kept up to date on every change
+        expected = list(UserStats.objects.order_by('user_id').values())
+        UserStats.objects.update(lists_created=9, majority_answers=0)
+        UserStats.objects.filter(user=user).delete()
+
+        users_amount = rebuild_user_stats()
+
+        self.assertEqual(users_amount, 2)
+        self.assertEqual(
+            list(UserStats.objects.order_by('user_id').values()), expected
+        )
+        self.assertEqual(UserStats.objects.get(user=owner).lists_created, 2)
+        self.assertEqual(UserStats.objects.get(user=user).majority_answers, 2)
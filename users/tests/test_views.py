@@ -3,11 +3,14 @@ from http import HTTPStatus
 from django.test import TestCase
 from django.urls import resolve, reverse
 
+from core.constants import AMOUNT_OF_LISTS_PER_PAGE
 from core.mixins import TestViewsMixin
 from lists.factories import QuestionListFactory
-from questions.factories import AlternativeFactory
+from lists.models import UserListPlay
+from questions.factories import AlternativeFactory, QuestionFactory
 
 from ..factories import UserFactory
+from ..models import UserStats
 from ..views import UserListsView, UserPlayedListsView, UserStatsView
 
 
@@ -115,6 +118,24 @@ class UserStatsViewTests(TestViewsMixin, TestCase):
 
         self.assertRegex(html, '10')
 
+    def test_stats_are_read_from_the_rollup(self):
+        UserStats.objects.create(
+            user=self.user,
+            questions_answered=4,
+            majority_answers=3,
+            lists_completed=7,
+            own_lists_plays=12,
+        )
+
+        # The session, the user and its stats
+        with self.assertNumQueries(3):
+            response = self.client.get(self.base_url)
+
+        self.assertEqual(response.context['lists_completed'], 7)
+        self.assertEqual(response.context['own_lists_plays'], 12)
+        self.assertEqual(response.context['majority_percentage'], 75)
+        self.assertContains(response, '75%')
+
     def test_cant_access_if_user_is_not_the_owner_of_the_stats_profile(self):
         user = UserFactory(username='jorge', email='jorge@email.com')
 
@@ -139,3 +160,61 @@ class UserPlayedListsViewTests(TestViewsMixin, TestCase):
         response = self.client.get(self.base_url)
 
         self.assertTemplateUsed(response, 'user_played_lists.html')
+
+    def test_every_played_list_is_shown_once(self):
+        question_list = QuestionListFactory(active=True)
+        for _ in range(2):
+            question = QuestionFactory(child_of=question_list)
+            AlternativeFactory(question=question).vote_for_this_alternative(
+                self.user
+            )
+        AlternativeFactory(
+            question=QuestionFactory(child_of=QuestionListFactory())
+        ).vote_for_this_alternative(UserFactory())
+
+        response = self.client.get(self.base_url)
+
+        self.assertEqual(
+            [play.question_list for play in response.context['object_list']],
+            [question_list],
+        )
+
+    def test_last_played_lists_first(self):
+        plays = []
+        for _ in range(2):
+            question = QuestionFactory(child_of=QuestionListFactory())
+            AlternativeFactory(question=question).vote_for_this_alternative(
+                self.user
+            )
+            plays.append(UserListPlay.objects.latest('id'))
+        # Opening a list isn't playing it
+        UserListPlay.get_for(self.user, QuestionListFactory())
+
+        # The session, the users, the plays and the tags of their lists
+        with self.assertNumQueries(5):
+            response = self.client.get(self.base_url)
+            object_list = list(response.context['object_list'])
+
+        self.assertEqual(object_list, plays[::-1])
+
+    def test_next_page_of_played_lists(self):
+        for _ in range(AMOUNT_OF_LISTS_PER_PAGE + 2):
+            question = QuestionFactory(child_of=QuestionListFactory())
+            AlternativeFactory(question=question).vote_for_this_alternative(
+                self.user
+            )
+        plays = list(UserListPlay.objects.order_by('-last_played', '-id'))
+        # Plays at the same time are told apart by their id
+        UserListPlay.objects.filter(id__in=[plays[5].id, plays[6].id]).update(
+            last_played=plays[5].last_played
+        )
+
+        response = self.client.get(self.base_url)
+        next_cursor = response.context['page_obj'].next_cursor
+        response = self.client.get(self.base_url, {'cursor': next_cursor})
+
+        self.assertEqual(response.status_code, HTTPStatus.OK)
+        self.assertEqual(
+            list(response.context['object_list']),
+            plays[AMOUNT_OF_LISTS_PER_PAGE:],
+        )
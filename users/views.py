@@ -5,12 +5,19 @@ from django.shortcuts import render
 from django.views.generic import ListView, View
 
 from core.constants import AMOUNT_OF_LISTS_PER_PAGE
-from core.mixins import CustomUserPassesTestMixin
+from core.mixins import CustomUserPassesTestMixin, KeysetPaginationMixin
+from lists.models import UserListPlay
 from questions.models import QuestionList
-from votes.models import Vote
 
+from .models import UserStats
 
-class UserListsView(LoginRequiredMixin, CustomUserPassesTestMixin, ListView):
+
+class UserListsView(
+    LoginRequiredMixin,
+    CustomUserPassesTestMixin,
+    KeysetPaginationMixin,
+    ListView,
+):
     template_name = 'user_lists.html'
     paginate_by = AMOUNT_OF_LISTS_PER_PAGE
 
@@ -43,15 +50,15 @@ class UserStatsView(LoginRequiredMixin, UserPassesTestMixin, View):
     template_name = 'user_stats.html'
 
     def get(self, request, *args, **kwargs):
-        user = request.user
-        lists_created = user.get_amount_of_lists_created()
-        lists_published = user.lists.filter(active=True).count()
-        questions_answered = user.get_amount_of_questions_answered()
+        stats = UserStats.get_for(request.user)
 
         context = {
-            'lists_created': lists_created,
-            'questions_answered': questions_answered,
-            'lists_published': lists_published,
+            'lists_created': stats.lists_created,
+            'questions_answered': stats.questions_answered,
+            'lists_published': stats.lists_published,
+            'lists_completed': stats.lists_completed,
+            'own_lists_plays': stats.own_lists_plays,
+            'majority_percentage': stats.get_majority_percentage(),
         }
 
         return render(request, self.template_name, context)
@@ -64,7 +71,10 @@ class UserStatsView(LoginRequiredMixin, UserPassesTestMixin, View):
 
 
 class UserPlayedListsView(
-    LoginRequiredMixin, CustomUserPassesTestMixin, ListView
+    LoginRequiredMixin,
+    CustomUserPassesTestMixin,
+    KeysetPaginationMixin,
+    ListView,
 ):
     template_name = 'user_played_lists.html'
     paginate_by = AMOUNT_OF_LISTS_PER_PAGE
@@ -73,10 +83,10 @@ class UserPlayedListsView(
         username = self.kwargs['username']
         user_id = get_user_model().objects.get(username=username).id
         return (
-            Vote.objects.filter(user=user_id)
-            .filter(~Q(list=None))
-            .select_related('list')
-            .prefetch_related('list__tags')
-            .order_by('-list__id')
-            .distinct()
+            UserListPlay.objects.filter(
+                user=user_id, last_played__isnull=False
+            )
+            .select_related('question_list')
+            .prefetch_related('question_list__tags')
+            .order_by('-last_played', '-id')
         )
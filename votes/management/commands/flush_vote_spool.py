@@ -0,0 +1,29 @@
+from django.core.management.base import BaseCommand
+
+from core.constants import (
+    COMMAND_FLUSH_VOTE_SPOOL_HELP_TEXT,
+    COMMAND_FLUSH_VOTE_SPOOL_SUCCESS_MESSAGE,
+    VOTES_SPOOL_BATCH_SIZE,
+)
+
+from ...services import flush_vote_spool
+
+
+class Command(BaseCommand):
+    help = COMMAND_FLUSH_VOTE_SPOOL_HELP_TEXT
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=VOTES_SPOOL_BATCH_SIZE,
+            help='Amount of spooled votes saved per transaction',
+        )
+
+    def handle(self, *args, **options):
+        saved = flush_vote_spool(batch_size=options['batch_size'])
+        self.stdout.write(
+            self.style.SUCCESS(
+                COMMAND_FLUSH_VOTE_SPOOL_SUCCESS_MESSAGE % saved
+            )
+        )
@@ -0,0 +1,26 @@
+# Generated by Django 3.1.14 on 2026-10-18 07:58
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('votes', '0003_auto_20210429_2248'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='vote',
+            index=models.Index(
+                fields=['user', 'list'], name='votes_vote_user_id_3208a7_idx'
+            ),
+        ),
+        migrations.AddIndex(
+            model_name='vote',
+            index=models.Index(
+                fields=['list', 'created'],
+                name='votes_vote_list_id_c09beb_idx',
+            ),
+        ),
+    ]
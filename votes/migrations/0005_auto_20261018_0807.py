@@ -0,0 +1,37 @@
+# Generated by Django 3.1.14 on 2026-10-18 08:07
+
+from django.db import migrations, models
+from django.db.models import Min
+
+
+def delete_duplicated_votes(apps, schema_editor):
+    # Keep the first vote of every user for every question
+    Vote = apps.get_model('votes', 'Vote')
+    first_votes_ids = (
+        Vote.objects.filter(user__isnull=False, question__isnull=False)
+        .values('user', 'question')
+        .annotate(first_id=Min('id'))
+        .values('first_id')
+    )
+    Vote.objects.filter(user__isnull=False, question__isnull=False).exclude(
+        id__in=first_votes_ids
+    ).delete()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('votes', '0004_auto_20261018_0758'),
+    ]
+
+    operations = [
+        migrations.RunPython(
+            delete_duplicated_votes, migrations.RunPython.noop
+        ),
+        migrations.AddConstraint(
+            model_name='vote',
+            constraint=models.UniqueConstraint(
+                fields=('user', 'question'), name='unique_user_question_vote'
+            ),
+        ),
+    ]
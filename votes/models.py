@@ -28,5 +28,16 @@ class Vote(TimeStampedModel):
         max_length=100, default='', blank=True, null=True
     )
 
+    class Meta:
+        indexes = [
+            models.Index(fields=['user', 'list']),
+            models.Index(fields=['list', 'created']),
+        ]
+        constraints = [
+            models.UniqueConstraint(
+                fields=['user', 'question'], name='unique_user_question_vote'
+            )
+        ]
+
     def __str__(self):
         return f'{self.user} vote'
@@ -0,0 +1,345 @@
+import logging
+import threading
+import time
+from collections import Counter, defaultdict
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.exceptions import ValidationError
+from django.db import connection, connections, transaction
+from django.db.models import F
+
+from core.constants import (
+    AMOUNT_OF_QUESTIONS_PER_LIST,
+    ANSWERS_MUST_BELONG_TO_THE_LIST,
+    ONE_ANSWER_PER_QUESTION,
+    VOTES_SPOOL_BATCH_SIZE,
+)
+from lists.cache import invalidate_list_results
+from lists.models import UserListPlay
+from lists.popularity import record_list_vote
+from questions.models import Alternative, Question
+from users.models import UserStats
+from users.stats import record_answers
+
+from .models import Vote
+from .spool import get_vote_spool
+
+logger = logging.getLogger(__name__)
+
+
+def insert_votes(votes):
+    """
+    Insert ``votes`` with ``INSERT ... ON CONFLICT DO NOTHING``, like
+    ``bulk_create(ignore_conflicts=True)`` does, but telling which ones were
+    inserted: return their ``(user_id, question_id)`` pairs. Both SQLite
+    (3.35+) and PostgreSQL speak this syntax.
+    """
+    if not votes:
+        return set()
+
+    fields = [
+        field for field in Vote._meta.concrete_fields if not field.primary_key
+    ]
+    columns = ', '.join(
+        connection.ops.quote_name(field.column) for field in fields
+    )
+    row = '({})'.format(', '.join(['%s'] * len(fields)))
+    params = [
+        field.get_db_prep_save(field.pre_save(vote, add=True), connection)
+        for vote in votes
+        for field in fields
+    ]
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f'INSERT INTO {connection.ops.quote_name(Vote._meta.db_table)} '
+            f'({columns}) VALUES {", ".join([row] * len(votes))} '
+            'ON CONFLICT DO NOTHING RETURNING user_id, question_id',
+            params,
+        )
+        return set(cursor.fetchall())
+
+
+def get_alternatives_to_vote(question_list, alternatives_ids):
+    """
+    The alternatives of ``alternatives_ids``, checking with a single query
+    that all of them belong to ``question_list`` and that there is at most
+    one for each question. Raise ``ValidationError`` otherwise.
+    """
+    alternatives_ids = set(alternatives_ids)
+    if len(alternatives_ids) > AMOUNT_OF_QUESTIONS_PER_LIST:
+        raise ValidationError(ONE_ANSWER_PER_QUESTION)
+
+    alternatives = list(
+        Alternative.objects.filter(
+            id__in=alternatives_ids, question__child_of=question_list
+        ).select_related('question')
+    )
+    for alternative in alternatives:
+        # Already loaded, the stats of its owner need it
+        alternative.question.child_of = question_list
+    if len(alternatives) != len(alternatives_ids):
+        raise ValidationError(ANSWERS_MUST_BELONG_TO_THE_LIST)
+    if len({alternative.question_id for alternative in alternatives}) != len(
+        alternatives
+    ):
+        raise ValidationError(ONE_ANSWER_PER_QUESTION)
+    return alternatives
+
+
+def increment_counters(model, field_name, increments):
+    """
+    Add ``increments`` (a ``Counter`` by id) to a counter field, with a
+    query per different increment rather than per row.
+    """
+    ids_by_amount = defaultdict(list)
+    for id_, amount in increments.items():
+        ids_by_amount[amount].append(id_)
+    for amount, ids in ids_by_amount.items():
+        model.objects.filter(id__in=ids).update(
+            **{field_name: F(field_name) + amount}
+        )
+
+
+def save_votes(votes, stats=None):
+    """
+    Insert ``votes``, at most one for each user and question, skipping the
+    questions already answered. For the inserted ones, add the M2M rows and
+    the counters, merged in memory, and the answers to the user stats (see
+    ``record_answers`` for ``stats``). Must run within a transaction. Return
+    the inserted votes.
+    """
+    inserted = insert_votes(votes)
+    saved_votes = [
+        vote for vote in votes if (vote.user_id, vote.question_id) in inserted
+    ]
+    if not saved_votes:
+        return []
+
+    through = get_user_model().alternatives_chosen.through
+    through.objects.bulk_create(
+        [
+            through(
+                customuser_id=vote.user_id, alternative_id=vote.alternative_id
+            )
+            for vote in saved_votes
+        ],
+        ignore_conflicts=True,
+    )
+    increment_counters(
+        Alternative,
+        'votes_count',
+        Counter(vote.alternative_id for vote in saved_votes),
+    )
+    increment_counters(
+        Question,
+        'total_votes',
+        Counter(vote.question_id for vote in saved_votes),
+    )
+    # No post_save signal is sent for the votes
+    for list_id, amount in Counter(
+        vote.list_id for vote in saved_votes
+    ).items():
+        record_list_vote(list_id, amount)
+    # Nor m2m_changed for the alternatives chosen
+    answers = defaultdict(list)
+    for vote in saved_votes:
+        answers[vote.user_id].append(vote.alternative_id)
+    record_answers(answers, stats)
+    return saved_votes
+
+
+def cast_votes(user, alternatives, shared_by=None):
+    """
+    Vote for ``alternatives``, all of them of the same list and of different
+    questions, in a single transaction. Questions ``user`` already answered
+    are skipped. Concurrent submissions are settled by the unique (user,
+    question) constraint of the votes: only the one inserting a vote touches
+    the counters for it. The stats of the user, and of the owner of the
+    list, are saved at once. Return the amount of new votes.
+    """
+    if not alternatives:
+        return 0
+
+    question_list = alternatives[0].question.child_of
+    list_id = question_list.id
+    votes = [
+        Vote(
+            user=user,
+            list_id=list_id,
+            question_id=alternative.question_id,
+            alternative=alternative,
+            shared_by=shared_by,
+        )
+        for alternative in alternatives
+    ]
+
+    stats = defaultdict(Counter)
+    with transaction.atomic():
+        saved_votes = save_votes(votes, stats)
+        if not saved_votes:
+            return 0
+        UserListPlay.record_answers(
+            user,
+            list_id,
+            [vote.question_id for vote in saved_votes],
+            owner_id=question_list.owner_id,
+            stats=stats,
+        )
+        UserStats.add(stats)
+
+    invalidate_list_results(list_id)
+    return len(saved_votes)
+
+
+def cast_vote(user, alternative, shared_by=None):
+    """Same as ``cast_votes``, for one alternative. Return if it was new."""
+    return cast_votes(user, [alternative], shared_by) == 1
+
+
+def spool_votes(user, alternatives, shared_by=None):
+    """
+    Same as ``cast_votes``, but only the play of ``user`` is updated right
+    away: the votes are appended to the spool, ``flush_vote_spool`` moves
+    them to the database later on. Return the amount of new votes.
+    """
+    if not alternatives:
+        return 0
+
+    question_list = alternatives[0].question.child_of
+    with transaction.atomic():
+        new_questions_ids = UserListPlay.record_answers(
+            user,
+            question_list.id,
+            [alternative.question_id for alternative in alternatives],
+            owner_id=question_list.owner_id,
+        )
+        # Within the transaction: if spooling fails the play isn't updated
+        get_vote_spool().append(
+            [
+                (user.id, alternative.id, shared_by)
+                for alternative in alternatives
+                if alternative.question_id in new_questions_ids
+            ]
+        )
+
+    vote_spool_flusher.start()
+    return len(new_questions_ids)
+
+
+def record_votes(user, alternatives, shared_by=None):
+    """Cast or spool the votes, depending on ``VOTES_WRITE_BEHIND``"""
+    if settings.VOTES_WRITE_BEHIND:
+        return spool_votes(user, alternatives, shared_by)
+    return cast_votes(user, alternatives, shared_by)
+
+
+def save_spooled_votes(spooled_votes):
+    """
+    Save ``spooled_votes`` in a single transaction. Saving them again does
+    nothing, so a spool can be replayed after a crash. Votes whose user or
+    alternative no longer exist are dropped. Return the amount of new votes.
+    """
+    alternatives = Alternative.objects.select_related('question').in_bulk(
+        {spooled_vote.alternative_id for spooled_vote in spooled_votes}
+    )
+    users_ids = set(
+        get_user_model()
+        .objects.filter(
+            id__in={spooled_vote.user_id for spooled_vote in spooled_votes}
+        )
+        .values_list('id', flat=True)
+    )
+
+    votes = {}
+    for spooled_vote in spooled_votes:
+        alternative = alternatives.get(spooled_vote.alternative_id)
+        if alternative is None or spooled_vote.user_id not in users_ids:
+            continue
+        votes.setdefault(
+            (spooled_vote.user_id, alternative.question_id),
+            Vote(
+                user_id=spooled_vote.user_id,
+                list_id=alternative.question.child_of_id,
+                question_id=alternative.question_id,
+                alternative=alternative,
+                shared_by=spooled_vote.shared_by,
+            ),
+        )
+
+    with transaction.atomic():
+        saved_votes = save_votes(list(votes.values()))
+
+    for list_id in {vote.list_id for vote in saved_votes}:
+        invalidate_list_results(list_id)
+    return len(saved_votes)
+
+
+def flush_vote_spool(batch_size=VOTES_SPOOL_BATCH_SIZE):
+    """
+    Move the spooled votes to the database, a batch at a time. Return the
+    amount of new votes.
+    """
+    spool = get_vote_spool()
+    saved = 0
+    while True:
+        spooled_votes = spool.read(batch_size)
+        if not spooled_votes:
+            return saved
+        saved += save_spooled_votes(spooled_votes)
+        # Crashing before this point replays the batch, which is harmless
+        spool.remove([spooled_vote.id for spooled_vote in spooled_votes])
+
+
+def flush_user_vote_spool(user):
+    """
+    Move the spooled votes of ``user`` to the database right away, for the
+    pages showing them. Return the amount of new votes.
+    """
+    if not settings.VOTES_WRITE_BEHIND:
+        return 0
+
+    spool = get_vote_spool()
+    spooled_votes = spool.read_user(user.id)
+    if not spooled_votes:
+        return 0
+    # The flusher may save them too, saving them twice is harmless
+    saved = save_spooled_votes(spooled_votes)
+    spool.remove([spooled_vote.id for spooled_vote in spooled_votes])
+    return saved
+
+
+class VoteSpoolFlusher:
+    """
+    Flush the spool every ``VOTES_SPOOL_FLUSH_INTERVAL`` seconds from a
+    thread of the process spooling the votes. With an interval of 0 it's up
+    to the ``flush_vote_spool`` command.
+    """
+
+    def __init__(self):
+        self.thread = None
+        self.lock = threading.Lock()
+
+    def start(self):
+        if settings.VOTES_SPOOL_FLUSH_INTERVAL <= 0:
+            return
+        with self.lock:
+            if self.thread is None or not self.thread.is_alive():
+                self.thread = threading.Thread(
+                    target=self.run, name='vote-spool-flusher', daemon=True
+                )
+                self.thread.start()
+
+    def run(self):
+        while True:
+            time.sleep(settings.VOTES_SPOOL_FLUSH_INTERVAL)
+            try:
+                flush_vote_spool()
+            except Exception:
+                logger.exception('Could not flush the votes spool')
+            finally:
+                # The thread opens its own connection
+                connections.close_all()
+
+
+vote_spool_flusher = VoteSpoolFlusher()
@@ -0,0 +1,108 @@
+import sqlite3
+from collections import namedtuple
+from functools import lru_cache
+
+from django.conf import settings
+
+SpooledVote = namedtuple(
+    'SpooledVote', ['id', 'user_id', 'alternative_id', 'shared_by']
+)
+
+
+class VoteSpool:
+    """
+    Append-only queue of votes in a local SQLite file. In WAL mode with a
+    full sync, an appended vote survives a crash of the process, so it can
+    be acknowledged right away and moved to the database later on.
+    """
+
+    def __init__(self, path):
+        self.path = str(path)
+        self.ready = False
+
+    def connect(self):
+        connection = sqlite3.connect(self.path, timeout=30)
+        connection.execute('PRAGMA journal_mode=WAL')
+        connection.execute('PRAGMA synchronous=FULL')
+        if not self.ready:
+            connection.execute(
+                'CREATE TABLE IF NOT EXISTS spooled_votes ('
+                'id INTEGER PRIMARY KEY AUTOINCREMENT, '
+                'user_id INTEGER NOT NULL, '
+                'alternative_id INTEGER NOT NULL, '
+                'shared_by TEXT)'
+            )
+            connection.execute(
+                'CREATE INDEX IF NOT EXISTS spooled_votes_user_id '
+                'ON spooled_votes (user_id)'
+            )
+            self.ready = True
+        return connection
+
+    def append(self, votes):
+        """Spool ``(user_id, alternative_id, shared_by)`` tuples"""
+        connection = self.connect()
+        try:
+            with connection:
+                connection.executemany(
+                    'INSERT INTO spooled_votes '
+                    '(user_id, alternative_id, shared_by) VALUES (?, ?, ?)',
+                    votes,
+                )
+        finally:
+            connection.close()
+
+    def read(self, limit):
+        """The oldest ``limit`` spooled votes, they stay in the spool"""
+        connection = self.connect()
+        try:
+            rows = connection.execute(
+                'SELECT id, user_id, alternative_id, shared_by '
+                'FROM spooled_votes ORDER BY id LIMIT ?',
+                [limit],
+            ).fetchall()
+        finally:
+            connection.close()
+        return [SpooledVote(*row) for row in rows]
+
+    def read_user(self, user_id):
+        """Every spooled vote of ``user_id``, they stay in the spool"""
+        connection = self.connect()
+        try:
+            rows = connection.execute(
+                'SELECT id, user_id, alternative_id, shared_by '
+                'FROM spooled_votes WHERE user_id = ? ORDER BY id',
+                [user_id],
+            ).fetchall()
+        finally:
+            connection.close()
+        return [SpooledVote(*row) for row in rows]
+
+    def remove(self, ids):
+        connection = self.connect()
+        try:
+            with connection:
+                connection.executemany(
+                    'DELETE FROM spooled_votes WHERE id = ?',
+                    [(id_,) for id_ in ids],
+                )
+        finally:
+            connection.close()
+
+    def __len__(self):
+        connection = self.connect()
+        try:
+            return connection.execute(
+                'SELECT COUNT(*) FROM spooled_votes'
+            ).fetchone()[0]
+        finally:
+            connection.close()
+
+
+@lru_cache(maxsize=None)
+def _get_vote_spool(path):
+    return VoteSpool(path)
+
+
+def get_vote_spool():
+    return _get_vote_spool(str(settings.VOTES_SPOOL_PATH))
@@ -0,0 +1,32 @@
+import io
+import tempfile
+from pathlib import Path
+
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+
+from core.constants import COMMAND_FLUSH_VOTE_SPOOL_SUCCESS_MESSAGE
+from questions.factories import AlternativeFactory
+from users.factories import UserFactory
+
+from ..models import Vote
+from ..spool import get_vote_spool
+
+
+class FlushVoteSpoolCommandTests(TestCase):
+    def test_command_success(self):
+        user = UserFactory()
+        alternative = AlternativeFactory()
+        out = io.StringIO()
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            with override_settings(
+                VOTES_SPOOL_PATH=str(Path(temp_dir) / 'spool.sqlite3')
+            ):
+                get_vote_spool().append([(user.id, alternative.id, None)])
+                call_command('flush_vote_spool', stdout=out)
+
+        self.assertIn(
+            COMMAND_FLUSH_VOTE_SPOOL_SUCCESS_MESSAGE % 1, out.getvalue()
+        )
+        self.assertEqual(Vote.objects.get().alternative, alternative)
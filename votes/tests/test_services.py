@@ -0,0 +1,212 @@
+import threading
+import time
+
+from django.core.exceptions import ValidationError
+from django.db import OperationalError, connection
+from django.test import TestCase, TransactionTestCase
+from django.test.utils import CaptureQueriesContext
+
+from core.constants import (
+    ANSWERS_MUST_BELONG_TO_THE_LIST,
+    ONE_ANSWER_PER_QUESTION,
+)
+from lists.models import ListPopularity, UserListPlay
+from questions.factories import (
+    AlternativeFactory,
+    QuestionFactory,
+    QuestionListFactory,
+)
+from users.factories import UserFactory
+from users.models import UserStats
+
+from ..models import Vote
+from ..services import cast_vote, cast_votes, get_alternatives_to_vote
+
+
+class CastVoteMixin:
+    def setUp(self):
+        self.user = UserFactory()
+        self.question_list = QuestionListFactory()
+        self.question = QuestionFactory(child_of=self.question_list)
+        self.alternative_1 = AlternativeFactory(question=self.question)
+        self.alternative_2 = AlternativeFactory(question=self.question)
+
+    def assert_voted_once(self):
+        self.alternative_1.refresh_from_db()
+        self.alternative_2.refresh_from_db()
+        self.question.refresh_from_db()
+
+        self.assertEqual(Vote.objects.filter(user=self.user).count(), 1)
+        self.assertEqual(self.user.alternatives_chosen.count(), 1)
+        self.assertEqual(
+            self.alternative_1.votes_count + self.alternative_2.votes_count,
+            1,
+        )
+        self.assertEqual(self.question.total_votes, 1)
+        self.assertEqual(
+            ListPopularity.objects.get(
+                question_list=self.question_list
+            ).votes_10d,
+            1,
+        )
+
+
+class CastVoteTests(CastVoteMixin, TestCase):
+    def test_new_vote(self):
+        is_new_vote = cast_vote(self.user, self.alternative_1, 'someone')
+        vote = Vote.objects.get()
+
+        self.assertTrue(is_new_vote)
+        self.assertEqual(vote.list, self.question_list)
+        self.assertEqual(vote.alternative, self.alternative_1)
+        self.assertEqual(vote.shared_by, 'someone')
+        self.assertIn(self.user, self.alternative_1.users.all())
+        self.assert_voted_once()
+
+    def test_vote_again_for_the_same_alternative(self):
+        cast_vote(self.user, self.alternative_1)
+
+        self.assertFalse(cast_vote(self.user, self.alternative_1))
+        self.assert_voted_once()
+
+    def test_vote_again_for_another_alternative_of_the_question(self):
+        cast_vote(self.user, self.alternative_1)
+
+        self.assertFalse(cast_vote(self.user, self.alternative_2))
+        self.assertNotIn(self.user, self.alternative_2.users.all())
+        self.assert_voted_once()
+
+    def test_vote_moves_the_play_forward(self):
+        play = UserListPlay.get_for(self.user, self.question_list)
+
+        cast_vote(self.user, self.alternative_1)
+        play.refresh_from_db()
+
+        self.assertTrue(play.is_completed())
+
+
+class ConcurrentCastVoteTests(CastVoteMixin, TransactionTestCase):
+    THREADS = 20
+
+    def cast_vote_retrying(self, alternative):
+        while True:
+            try:
+                return cast_vote(self.user, alternative)
+            except OperationalError as error:
+                # The in-memory SQLite of the tests fails instead of waiting
+                # for the lock of another writer
+                if 'locked' not in str(error):
+                    raise
+                time.sleep(0.001)
+
+    def test_concurrent_double_submissions_vote_once(self):
+        barrier = threading.Barrier(self.THREADS)
+        results = []
+        errors = []
+
+        def vote(alternative):
+            try:
+                barrier.wait()
+                results.append(self.cast_vote_retrying(alternative))
+            except Exception as error:
+                errors.append(error)
+            finally:
+                connection.close()
+
+        threads = [
+            threading.Thread(
+                target=vote,
+                args=[(self.alternative_1, self.alternative_2)[i % 2]],
+            )
+            for i in range(self.THREADS)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(errors, [])
+        self.assertEqual(results.count(True), 1)
+        self.assert_voted_once()
+
+
+class CastVotesTests(CastVoteMixin, TestCase):
+    def setUp(self):
+        super().setUp()
+        another_question = QuestionFactory(child_of=self.question_list)
+        self.alternative_3 = AlternativeFactory(question=another_question)
+
+    def test_get_alternatives_to_vote(self):
+        alternatives = get_alternatives_to_vote(
+            self.question_list, [self.alternative_1.id, self.alternative_3.id]
+        )
+
+        self.assertEqual(
+            set(alternatives), {self.alternative_1, self.alternative_3}
+        )
+
+    def test_get_alternatives_to_vote_of_another_list(self):
+        with self.assertRaisesMessage(
+            ValidationError, str(ANSWERS_MUST_BELONG_TO_THE_LIST)
+        ):
+            get_alternatives_to_vote(
+                self.question_list, [self.alternative_1.id, 0]
+            )
+
+    def test_get_alternatives_to_vote_twice_for_a_question(self):
+        with self.assertRaisesMessage(
+            ValidationError, str(ONE_ANSWER_PER_QUESTION)
+        ):
+            get_alternatives_to_vote(
+                self.question_list,
+                [self.alternative_1.id, self.alternative_2.id],
+            )
+
+    def test_cast_votes(self):
+        votes = cast_votes(self.user, [self.alternative_1, self.alternative_3])
+        self.alternative_3.refresh_from_db()
+
+        self.assertEqual(votes, 2)
+        self.assertEqual(Vote.objects.filter(user=self.user).count(), 2)
+        self.assertEqual(self.alternative_3.votes_count, 1)
+        self.assertEqual(
+            ListPopularity.objects.get(
+                question_list=self.question_list
+            ).votes_10d,
+            2,
+        )
+
+    def test_cast_votes_skips_answered_questions(self):
+        cast_vote(self.user, self.alternative_2)
+
+        votes = cast_votes(self.user, [self.alternative_1, self.alternative_3])
+        self.alternative_1.refresh_from_db()
+
+        self.assertEqual(votes, 1)
+        self.assertEqual(self.alternative_1.votes_count, 0)
+        self.assertNotIn(self.user, self.alternative_1.users.all())
+
+    def test_cast_votes_saves_the_stats_at_once(self):
+        owner = UserFactory(username='owner', email='owner@email.com')
+        self.question_list.owner = owner
+        self.question_list.save()
+        UserStats.objects.all().delete()
+
+        with CaptureQueriesContext(connection) as queries:
+            cast_votes(self.user, [self.alternative_1, self.alternative_3])
+
+        self.assertEqual(
+            len(
+                [
+                    query
+                    for query in queries.captured_queries
+                    if UserStats._meta.db_table in query['sql']
+                ]
+            ),
+            1,
+        )
+        user_stats = UserStats.objects.get(user=self.user)
+        self.assertEqual(user_stats.questions_answered, 2)
+        self.assertEqual(user_stats.majority_answers, 2)
+        self.assertEqual(user_stats.lists_completed, 1)
+        self.assertEqual(UserStats.objects.get(user=owner).own_lists_plays, 1)
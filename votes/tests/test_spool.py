@@ -0,0 +1,214 @@
+import tempfile
+from pathlib import Path
+from unittest.mock import patch
+
+from django.test import TestCase, override_settings
+from django.urls import reverse
+
+from core.mixins import LoginUserMixin
+from lists.models import ListPopularity, UserListPlay
+from questions.factories import (
+    AlternativeFactory,
+    QuestionFactory,
+    QuestionListFactory,
+)
+from users.factories import UserFactory
+from users.models import UserStats
+
+from ..models import Vote
+from ..services import flush_vote_spool, record_votes
+from ..spool import SpooledVote, VoteSpool, get_vote_spool
+
+
+class SpoolMixin:
+    def setUp(self):
+        temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        self.spool_path = Path(temp_dir.name) / 'votes_spool.sqlite3'
+        settings_override = override_settings(
+            VOTES_WRITE_BEHIND=True,
+            VOTES_SPOOL_PATH=str(self.spool_path),
+            VOTES_SPOOL_FLUSH_INTERVAL=0,
+        )
+        settings_override.enable()
+        self.addCleanup(settings_override.disable)
+
+
+class VoteSpoolTests(SpoolMixin, TestCase):
+    def test_append_and_read(self):
+        spool = VoteSpool(self.spool_path)
+        spool.append([(1, 2, None), (1, 3, 'javi')])
+
+        self.assertEqual(
+            spool.read(10),
+            [SpooledVote(1, 1, 2, None), SpooledVote(2, 1, 3, 'javi')],
+        )
+        self.assertEqual(spool.read(1), [SpooledVote(1, 1, 2, None)])
+
+    def test_remove(self):
+        spool = VoteSpool(self.spool_path)
+        spool.append([(1, 2, None), (1, 3, None)])
+
+        spool.remove([1])
+
+        self.assertEqual(spool.read(10), [SpooledVote(2, 1, 3, None)])
+        self.assertEqual(len(spool), 1)
+
+    def test_votes_survive_a_restart(self):
+        VoteSpool(self.spool_path).append([(1, 2, None)])
+
+        # A new process opens the same file
+        self.assertEqual(len(VoteSpool(self.spool_path)), 1)
+
+
+class WriteBehindTests(SpoolMixin, TestCase):
+    def setUp(self):
+        super().setUp()
+        self.user = UserFactory()
+        self.question_list = QuestionListFactory(active=True)
+        self.alternatives = []
+        for _ in range(2):
+            question = QuestionFactory(child_of=self.question_list)
+            self.alternatives.append(AlternativeFactory(question=question))
+            AlternativeFactory(question=question)
+        self.play = UserListPlay.get_for(self.user, self.question_list)
+
+    def assert_votes_saved_once(self):
+        for alternative in self.alternatives:
+            alternative.refresh_from_db()
+            self.assertEqual(alternative.votes_count, 1)
+            self.assertIn(self.user, alternative.users.all())
+        self.assertEqual(Vote.objects.filter(user=self.user).count(), 2)
+        self.assertEqual(
+            ListPopularity.objects.get(
+                question_list=self.question_list
+            ).votes_10d,
+            2,
+        )
+        self.assertEqual(len(get_vote_spool()), 0)
+
+    def test_votes_are_spooled_and_the_play_moves_forward(self):
+        votes = record_votes(self.user, self.alternatives, 'jorge')
+        self.play.refresh_from_db()
+
+        self.assertEqual(votes, 2)
+        self.assertTrue(self.play.is_completed())
+        self.assertFalse(Vote.objects.exists())
+        self.assertEqual(
+            [spooled.shared_by for spooled in get_vote_spool().read(10)],
+            ['jorge', 'jorge'],
+        )
+
+    def test_answered_questions_are_not_spooled_again(self):
+        record_votes(self.user, self.alternatives[:1])
+
+        votes = record_votes(self.user, self.alternatives)
+
+        self.assertEqual(votes, 1)
+        self.assertEqual(len(get_vote_spool()), 2)
+
+    def test_flush(self):
+        record_votes(self.user, self.alternatives)
+
+        self.assertEqual(flush_vote_spool(), 2)
+        self.assert_votes_saved_once()
+
+    def test_flush_in_batches(self):
+        record_votes(self.user, self.alternatives)
+
+        self.assertEqual(flush_vote_spool(batch_size=1), 2)
+        self.assert_votes_saved_once()
+
+    def test_replay_after_crashing_before_removing_the_batch(self):
+        record_votes(self.user, self.alternatives)
+        with patch.object(VoteSpool, 'remove', side_effect=OSError):
+            with self.assertRaises(OSError):
+                flush_vote_spool()
+
+        # The votes are saved but still spooled, replaying adds nothing
+        self.assertEqual(flush_vote_spool(), 0)
+        self.assert_votes_saved_once()
+
+    def test_replay_after_crashing_while_saving_the_batch(self):
+        record_votes(self.user, self.alternatives)
+        with patch(
+            'votes.services.record_list_vote', side_effect=RuntimeError
+        ):
+            with self.assertRaises(RuntimeError):
+                flush_vote_spool()
+
+        self.assertFalse(Vote.objects.exists())
+        self.assertEqual(flush_vote_spool(), 2)
+        self.assert_votes_saved_once()
+
+    def test_replay_a_spool_with_duplicated_votes(self):
+        # E.g. spooled again after the play got reset
+        get_vote_spool().append(
+            [
+                (self.user.id, self.alternatives[0].id, None),
+                (self.user.id, self.alternatives[1].id, None),
+                (self.user.id, self.alternatives[0].id, None),
+            ]
+        )
+
+        self.assertEqual(flush_vote_spool(), 2)
+        self.assert_votes_saved_once()
+
+    def test_votes_of_deleted_users_or_alternatives_are_dropped(self):
+        user = UserFactory()
+        get_vote_spool().append(
+            [(user.id, self.alternatives[0].id, None), (self.user.id, 0, None)]
+        )
+        user.delete()
+
+        self.assertEqual(flush_vote_spool(), 0)
+        self.assertEqual(len(get_vote_spool()), 0)
+
+
+class WriteBehindViewTests(SpoolMixin, LoginUserMixin, TestCase):
+    def setUp(self):
+        super().setUp()
+        self.create_login_and_verify_user()
+        self.question_list = QuestionListFactory(active=True)
+        self.alternative = AlternativeFactory(
+            question=QuestionFactory(child_of=self.question_list)
+        )
+        AlternativeFactory(question=self.alternative.question)
+
+    def test_answer_is_acknowledged_before_being_saved(self):
+        question_list = self.question_list
+        alternative = self.alternative
+
+        response = self.client.post(
+            reverse('answer_list', args=[question_list.slug]),
+            data={'alternatives': alternative.id},
+        )
+
+        self.assertEqual(
+            response['Location'],
+            reverse('list_results', args=[question_list.slug]),
+        )
+        self.assertFalse(Vote.objects.exists())
+
+        flush_vote_spool()
+
+        self.assertEqual(Vote.objects.get().alternative, alternative)
+
+    def test_results_show_the_spooled_answers(self):
+        self.client.post(
+            reverse('answer_list', args=[self.question_list.slug]),
+            data={'alternatives': self.alternative.id},
+        )
+
+        response = self.client.get(
+            reverse('list_results', args=[self.question_list.slug])
+        )
+        [question_results] = response.context['results']
+
+        self.assertEqual(question_results.user_alternative, self.alternative)
+        self.assertEqual(
+            [a.votes_percentage for a in question_results.alternatives],
+            [100, 0],
+        )
+        self.assertEqual(UserStats.get_for(self.user).questions_answered, 1)
+        self.assertEqual(len(get_vote_spool()), 0)